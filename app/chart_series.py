@@ -0,0 +1,242 @@
+"""
+Chart Series Module
+Indicator time series over any date range, downsampled with Largest-Triangle-Three-Buckets
+"""
+import re
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.indicator_engine import IndicatorEngine
+from app.indicator_kernels import prefix_sum
+from app.manifest import parse_as_of
+
+# Series name -> default period; None for series that take no period
+SERIES_DEFAULTS = {
+    'sma': 20,
+    'ema': 12,
+    'rsi': 14,
+    'macd': None,
+    'bollinger': 20,
+    'atr': 14,
+    'stochastic': 14,
+    'donchian': 20,
+    'volume_sma': 20,
+    'adx': 14,
+    'obv': None,
+    'mfi': 14,
+    'cci': 20,
+    'williams_r': 14,
+    'keltner': 20,
+    'ichimoku': None,
+    'vwap': 20,
+    'psar': None
+}
+
+DEFAULT_POINTS = 1000
+MAX_POINTS = 20000
+
+_SERIES_PATTERN = re.compile(r'^([a-z_]+?)(?:_(\d+))?$')
+
+
+def parse_range(start: Optional[str], end: Optional[str]) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """
+    Parse start/end query values; a bare end date covers that whole day
+    Raises ValueError on malformed values or an empty range
+    """
+    start_ts = None
+    if start:
+        try:
+            start_ts = pd.Timestamp(start)
+        except ValueError:
+            raise ValueError(f"Invalid start '{start}', expected YYYY-MM-DD[THH:MM:SS]")
+        if start_ts.tzinfo is not None:
+            start_ts = start_ts.tz_convert(None)
+    end_ts = pd.Timestamp(parse_as_of(end)) if end else None
+    if start_ts is not None and end_ts is not None and start_ts > end_ts:
+        raise ValueError("start must not be after end")
+    return start_ts, end_ts
+
+
+def parse_series(names: List[str]) -> List[Tuple[str, Optional[int]]]:
+    """'rsi', 'sma_50', 'bollinger_20' -> [(kind, period)]; raises ValueError on unknown names"""
+    parsed = []
+    for name in names:
+        name = name.strip().lower()
+        if not name:
+            continue
+        match = _SERIES_PATTERN.match(name)
+        kind = match.group(1) if match else None
+        if kind not in SERIES_DEFAULTS:
+            raise ValueError(f"Unknown series '{name}'. Available: {', '.join(SERIES_DEFAULTS)}")
+        if SERIES_DEFAULTS[kind] is None and match.group(2):
+            raise ValueError(f"{kind} takes no period")
+        period = int(match.group(2)) if match.group(2) else SERIES_DEFAULTS[kind]
+        if period is not None and period < 1:
+            raise ValueError(f"Invalid period in '{name}'")
+        if (kind, period) not in parsed:
+            parsed.append((kind, period))
+    return parsed
+
+
+def lttb_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of threshold points that keep
+    the visual shape of y (x is the bar position)
+
+    The first and last points are always kept; the rest are split into
+    threshold - 2 buckets, and each bucket keeps the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average. Bucket averages come from one prefix sum, so the loop body is
+    a single vectorized area computation per bucket.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    counts = np.diff(edges)
+    x_sums = prefix_sum(x)
+    y_sums = prefix_sum(y)
+    avg_x = (x_sums[edges[1:]] - x_sums[edges[:-1]]) / counts
+    avg_y = (y_sums[edges[1:]] - y_sums[edges[:-1]]) / counts
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    anchor = 0
+    buckets = threshold - 2
+    for i in range(buckets):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 1 < buckets:
+            next_x, next_y = avg_x[i + 1], avg_y[i + 1]
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        ax, ay = x[anchor], y[anchor]
+        area = np.abs((ax - next_x) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y - ay))
+        anchor = lo + int(np.argmax(area))
+        selected[i + 1] = anchor
+    return selected
+
+
+def to_json_list(values: np.ndarray, digits: Optional[int] = None) -> List:
+    """NumPy array -> JSON-ready list in one C-level tolist(), NaN/inf as None"""
+    values = np.asarray(values, dtype=np.float64)
+    if digits is not None:
+        values = np.round(values, digits)
+    missing = ~np.isfinite(values)
+    if not missing.any():
+        return values.tolist()
+    out = values.astype(object)
+    out[missing] = None
+    return out.tolist()
+
+
+def format_dates(index: pd.Index) -> List[str]:
+    """ISO timestamps, date-only when every bar sits at midnight"""
+    values = np.asarray(index.values, dtype='datetime64[ns]')
+    daily = len(values) and not (values - values.astype('datetime64[D]')).any()
+    return np.datetime_as_string(values, unit='D' if daily else 's').tolist()
+
+
+class ChartSeries:
+    """
+    Price and indicator series for charting
+
+    Indicators are computed on the full history (so warm-up periods are
+    right at the start of any range), sliced to [start, end], then every
+    series is sampled at the same LTTB indices chosen on the close.
+    """
+
+    def __init__(self, price_data: pd.DataFrame, engine: Optional[IndicatorEngine] = None):
+        self.price_data = price_data
+        self.engine = engine or IndicatorEngine(price_data)
+
+    def indicator(self, kind: str, period: Optional[int]) -> Dict[str, np.ndarray]:
+        """Full-length arrays of one requested series, keyed by output name"""
+        engine = self.engine
+        if kind == 'sma':
+            return {f'sma_{period}': engine.sma(period)}
+        if kind == 'ema':
+            return {f'ema_{period}': engine.ema(period)}
+        if kind == 'rsi':
+            return {f'rsi_{period}': engine.rsi(period)}
+        if kind == 'macd':
+            macd = engine.macd()
+            return {'macd': macd['macd'], 'macd_signal': macd['signal'], 'macd_histogram': macd['histogram']}
+        if kind == 'bollinger':
+            bands = engine.bollinger(period)
+            return {f'bb_upper_{period}': bands['upper'], f'bb_middle_{period}': bands['middle'],
+                    f'bb_lower_{period}': bands['lower']}
+        if kind == 'atr':
+            return {f'atr_{period}': engine.atr(period)}
+        if kind == 'stochastic':
+            stochastic = engine.stochastic(period)
+            return {f'stoch_k_{period}': stochastic['k'], f'stoch_d_{period}': stochastic['d']}
+        if kind == 'donchian':
+            channel = engine.donchian(period)
+            return {f'donchian_upper_{period}': channel['upper'], f'donchian_middle_{period}': channel['middle'],
+                    f'donchian_lower_{period}': channel['lower']}
+        if kind == 'volume_sma':
+            return {f'volume_sma_{period}': engine.volume_sma(period)}
+        if kind == 'adx':
+            dmi = engine.dmi(period)
+            return {f'adx_{period}': dmi['adx'], f'plus_di_{period}': dmi['plus_di'],
+                    f'minus_di_{period}': dmi['minus_di']}
+        if kind == 'obv':
+            return {'obv': engine.obv()}
+        if kind == 'mfi':
+            return {f'mfi_{period}': engine.mfi(period)}
+        if kind == 'cci':
+            return {f'cci_{period}': engine.cci(period)}
+        if kind == 'williams_r':
+            return {f'williams_r_{period}': engine.williams_r(period)}
+        if kind == 'keltner':
+            channel = engine.keltner(period)
+            return {f'keltner_upper_{period}': channel['upper'], f'keltner_middle_{period}': channel['middle'],
+                    f'keltner_lower_{period}': channel['lower']}
+        if kind == 'ichimoku':
+            return {f'ichimoku_{name}': values for name, values in engine.ichimoku().items()}
+        if kind == 'vwap':
+            return {f'vwap_{period}': engine.vwap(period)}
+        if kind == 'psar':
+            return {'psar': engine.parabolic_sar()['sar']}
+        raise ValueError(f"Unknown series '{kind}'")
+
+    def build(self, series: List[str], start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None,
+              points: int = DEFAULT_POINTS, digits: int = 4) -> Dict[str, Any]:
+        """
+        Chart payload for [start, end]: dates, OHLCV and the requested
+        series, downsampled to at most points bars (0 = every bar)
+        """
+        requested = parse_series(series)
+        engine = self.engine
+        index = self.price_data.index
+
+        first = int(index.searchsorted(start, side='left')) if start is not None else 0
+        last = int(index.searchsorted(end, side='right')) if end is not None else len(index)
+        window = slice(first, max(first, last))
+        bars = window.stop - window.start
+
+        if points and bars > points:
+            selected = lttb_indices(engine.close[window], points) + window.start
+        else:
+            selected = np.arange(window.start, window.stop)
+
+        payload = {
+            'bars': bars,
+            'points': len(selected),
+            'downsampled': len(selected) < bars,
+            'dates': format_dates(index[selected]),
+            'open': to_json_list(engine.open[selected], digits),
+            'high': to_json_list(engine.high[selected], digits),
+            'low': to_json_list(engine.low[selected], digits),
+            'close': to_json_list(engine.close[selected], digits),
+            'volume': engine.volume[selected].astype(np.int64).tolist(),
+            'series': {}
+        }
+        for kind, period in requested:
+            for name, values in self.indicator(kind, period).items():
+                payload['series'][name] = to_json_list(values[selected], digits)
+        return payload
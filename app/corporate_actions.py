@@ -0,0 +1,142 @@
+"""
+Corporate Actions Module
+Split and dividend adjustment factors applied to OHLCV series in one vectorized pass
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+# Alpha Vantage intraday series are fetched with adjusted=true, so they already include actions
+PRE_ADJUSTED_INTERVALS = {'5min', '15min', '1h'}
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close')
+
+
+class AdjustmentFactors:
+    """
+    Cumulative backward adjustment factors at each corporate-action date
+
+    price[i] / volume[i] is the multiplier for a bar dated before event i and
+    on or after event i - 1; the last element (1.0) applies to bars after the
+    final event. A bar's factor is found with one searchsorted call.
+    """
+
+    def __init__(self, event_dates: np.ndarray, price: np.ndarray, volume: np.ndarray):
+        self.event_dates = event_dates
+        self.price = price
+        self.volume = volume
+
+    def __len__(self) -> int:
+        return len(self.event_dates)
+
+    def factors_for(self, timestamps: np.ndarray) -> tuple:
+        """(price factor, volume factor) per bar timestamp"""
+        # Bars dated on the event day already trade ex-event, so only strictly earlier bars move
+        positions = np.searchsorted(self.event_dates, timestamps.astype('datetime64[ns]'), side='right')
+        return self.price[positions], self.volume[positions]
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adjusted copy of an OHLCV frame: prices scaled by split and dividend
+        factors, volume by split ratios. Other columns are carried over as-is.
+        """
+        if df is None or df.empty or len(self) == 0:
+            return df
+
+        price_factor, volume_factor = self.factors_for(df.index.values)
+        columns = {}
+        for column in df.columns:
+            values = df[column].to_numpy()
+            if column in PRICE_FIELDS:
+                columns[column] = values * price_factor
+            elif column == 'volume':
+                columns[column] = np.rint(values * volume_factor).astype(np.int64)
+            else:
+                columns[column] = values
+        return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+class CorporateActions:
+    """
+    Split and dividend events of one symbol as date-sorted arrays
+    Built from the splits_*.json / dividends_*.json fundamental files
+    """
+
+    def __init__(self, split_dates: np.ndarray, split_ratios: np.ndarray,
+                 dividend_dates: np.ndarray, dividend_amounts: np.ndarray):
+        self.split_dates = split_dates
+        self.split_ratios = split_ratios
+        self.dividend_dates = dividend_dates
+        self.dividend_amounts = dividend_amounts
+
+    def __len__(self) -> int:
+        return len(self.split_dates) + len(self.dividend_dates)
+
+    @classmethod
+    def from_data(cls, splits: Optional[Dict], dividends: Optional[Dict]) -> 'CorporateActions':
+        """Parse Alpha Vantage SPLITS / DIVIDENDS payloads, skipping malformed rows"""
+        split_dates, split_ratios = _events(
+            (splits or {}).get('data', []), 'effective_date', 'split_factor'
+        )
+        dividend_dates, dividend_amounts = _events(
+            (dividends or {}).get('data', []), 'ex_dividend_date', 'amount'
+        )
+        return cls(split_dates, split_ratios, dividend_dates, dividend_amounts)
+
+    def until(self, as_of) -> 'CorporateActions':
+        """Only the events effective on or before as_of"""
+        cutoff = np.datetime64(pd.Timestamp(as_of).to_datetime64(), 'ns')
+        splits = int(np.searchsorted(self.split_dates, cutoff, side='right'))
+        dividends = int(np.searchsorted(self.dividend_dates, cutoff, side='right'))
+        return CorporateActions(self.split_dates[:splits], self.split_ratios[:splits],
+                                self.dividend_dates[:dividends], self.dividend_amounts[:dividends])
+
+    def factors(self, reference: Optional[pd.Series]) -> AdjustmentFactors:
+        """
+        Cumulative factors for every event
+
+        A split of ratio r multiplies earlier prices by 1/r and earlier volume
+        by r. A dividend D multiplies earlier prices by 1 - D / close, with the
+        unadjusted close of the last bar before the ex-date taken from
+        reference; dividends without a usable reference close are skipped.
+        """
+        dividend_multipliers = np.ones(len(self.dividend_dates))
+        if reference is not None and len(reference) and len(self.dividend_dates):
+            ref_dates = reference.index.values.astype('datetime64[ns]')
+            ref_close = reference.to_numpy(dtype=np.float64)
+            previous = np.searchsorted(ref_dates, self.dividend_dates, side='left') - 1
+            known = previous >= 0
+            closes = np.where(known, ref_close[np.maximum(previous, 0)], np.nan)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                multipliers = 1.0 - self.dividend_amounts / closes
+            usable = known & np.isfinite(multipliers) & (multipliers > 0)
+            dividend_multipliers[usable] = multipliers[usable]
+
+        dates = np.concatenate((self.split_dates, self.dividend_dates))
+        price = np.concatenate((1.0 / self.split_ratios, dividend_multipliers))
+        volume = np.concatenate((self.split_ratios, np.ones(len(self.dividend_dates))))
+        order = np.argsort(dates, kind='stable')
+        dates, price, volume = dates[order], price[order], volume[order]
+
+        # Suffix products: a bar is scaled by every event that happens after it
+        price_cum = np.append(np.cumprod(price[::-1])[::-1], 1.0)
+        volume_cum = np.append(np.cumprod(volume[::-1])[::-1], 1.0)
+        return AdjustmentFactors(dates, price_cum, volume_cum)
+
+
+def _events(rows, date_field: str, value_field: str) -> tuple:
+    """Sorted (dates, values) arrays from event rows"""
+    dates, values = [], []
+    for row in rows:
+        try:
+            value = float(row.get(value_field))
+            date = np.datetime64(row.get(date_field), 'ns')
+        except (TypeError, ValueError):
+            continue
+        if value > 0 and not np.isnat(date):
+            dates.append(date)
+            values.append(value)
+    dates = np.array(dates, dtype='datetime64[ns]')
+    values = np.array(values, dtype=np.float64)
+    order = np.argsort(dates, kind='stable')
+    return dates[order], values[order]
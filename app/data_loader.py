@@ -2,19 +2,51 @@
 Data Loader Module
 Loads and manages data from various folders
 """
+import asyncio
+import hashlib
 import json
 import os
 import pandas as pd
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-import glob
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
+from datetime import datetime, timedelta
+
+from app.cache import LRUCache
+from app.corporate_actions import PRE_ADJUSTED_INTERVALS, AdjustmentFactors, CorporateActions
+from app.indicator_state import IndicatorState
+from app.insider_table import InsiderTable
+from app.manifest import DataManifest, ManifestEntry, parse_as_of
+from app.price_parser import parse_time_series
+from app.price_store import PriceStore
+from app.resample import INTERVALS, interval_rank, normalize_interval, resample_ohlcv
+from app.symbol_registry import SymbolInfo, SymbolRegistry
+from app.transcript_index import TranscriptIndex
 
 class DataLoader:
     """
     Loads data from TechnicalAnalysis, FundamentalData, SentimentData, and AlternativeData folders
     """
     
-    def __init__(self):
+    # Manifest data type per fundamental result key
+    FUNDAMENTAL_DATA_TYPES = {
+        'overview': 'company_overview',
+        'income': 'income_statement',
+        'balance': 'balance_sheet',
+        'cash_flow': 'cash_flow',
+        'earnings': 'earnings_history'
+    }
+    
+    # Default byte budget of the data cache, overridable via DATA_CACHE_MAX_MB
+    DEFAULT_CACHE_MAX_MB = 256
+    
+    # Default size of the I/O thread pool behind the aload_* methods, overridable via DATA_LOADER_WORKERS
+    DEFAULT_IO_WORKERS = 8
+    
+    # Days after quarter end before that quarter's earnings call counts as known to as_of
+    # cutoffs (calls land 3-6 weeks out), overridable via TRANSCRIPT_LAG_DAYS
+    DEFAULT_TRANSCRIPT_LAG_DAYS = 45
+    
+    def __init__(self, cache_max_bytes: Optional[int] = None):
         # Get the project root directory
         self.root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         
@@ -26,305 +58,590 @@ class DataLoader:
             'alternative': os.path.join(self.root_dir, 'IBM', 'AlternativeData')
         }
         
-        # Cache for loaded data
-        self.cache = {}
+        # Cache for loaded data, keyed by symbol, data type and source file fingerprints
+        if cache_max_bytes is None:
+            cache_max_mb = float(os.getenv('DATA_CACHE_MAX_MB', self.DEFAULT_CACHE_MAX_MB))
+            cache_max_bytes = int(cache_max_mb * 1024 * 1024)
+        self.cache = LRUCache(max_bytes=cache_max_bytes)
+        
+        # Columnar, memory-mapped copies of the price JSON files
+        self.store = PriceStore(os.path.join(self.root_dir, 'data', 'store'))
+        
+        # Index of every data file, refreshed incrementally instead of globbing per request
+        self.manifest = DataManifest(
+            self.root_dir,
+            manifest_path=os.path.join(self.root_dir, 'data', 'manifest.json'),
+            refresh_seconds=float(os.getenv('MANIFEST_REFRESH_SECONDS', 5))
+        )
+        
+        # Per-symbol data availability built from the manifest
+        self.registry = SymbolRegistry(self.manifest)
+        
+        # Bounded pool for the awaitable loaders, and the loads currently in flight
+        self.io_workers = int(os.getenv('DATA_LOADER_WORKERS', self.DEFAULT_IO_WORKERS))
+        self._executor = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='data-loader')
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        
+        # Reporting lag applied to quarter-labelled transcripts for point-in-time loads
+        self.transcript_lag = timedelta(days=float(os.getenv('TRANSCRIPT_LAG_DAYS', self.DEFAULT_TRANSCRIPT_LAG_DAYS)))
     
     def get_available_symbols(self) -> List[str]:
         """
         Get list of symbols that have data available
-        Currently only IBM, but designed to support multiple
+        Any top-level folder with data category subfolders counts as a symbol
         """
-        symbols = set()
-        
-        # Check each folder for available data
-        for folder_type, folder_path in self.folders.items():
-            if os.path.exists(folder_path):
-                # Look for JSON files
-                files = glob.glob(os.path.join(folder_path, '**/*.json'), recursive=True)
-                for file in files:
-                    # Extract symbol from filename (assumes format like ibm_*.json)
-                    filename = os.path.basename(file).lower()
-                    if 'ibm' in filename:
-                        symbols.add('IBM')
-                    # Add logic for other symbols as needed
-        
-        return sorted(list(symbols))
+        return self.registry.symbols()
     
-    def load_price_data(self, symbol: str = 'IBM') -> pd.DataFrame:
+    def get_symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        """Data availability flags (price intervals, fundamentals, sentiment, insider)"""
+        return self.registry.get(symbol)
+    
+    def search_symbols(self, query: str, limit: int = 20) -> List[SymbolInfo]:
+        """Prefix/substring symbol search for the symbol picker"""
+        return self.registry.search(query, limit)
+    
+    def load_price_data(self, symbol: str = 'IBM', interval: Optional[str] = None, as_of=None,
+                        adjusted: bool = True) -> pd.DataFrame:
         """
         Load price data for technical analysis
-        Prioritizes daily data, falls back to weekly if needed
-        """
-        symbol_lower = symbol.lower()
         
-        # Try to load from cache first
-        cache_key = f"{symbol}_price"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # Try daily data first - files are directly in technical folder
-        technical_path = self.folders['technical']
-        if os.path.exists(technical_path):
-            # Look for daily adjusted data
-            files = glob.glob(os.path.join(technical_path, f'{symbol_lower}_daily*.json'))
-            if files:
-                # Get the most recent file
-                latest_file = max(files, key=os.path.getctime)
-                data = self._load_json_file(latest_file)
-                df = self._parse_price_data(data)
-                if df is not None:
-                    self.cache[cache_key] = df
-                    return df
-        
-        # Fallback to weekly data
-        if os.path.exists(technical_path):
-            files = glob.glob(os.path.join(technical_path, f'{symbol_lower}_weekly*.json'))
-            if files:
-                latest_file = max(files, key=os.path.getctime)
-                data = self._load_json_file(latest_file)
-                df = self._parse_price_data(data)
+        interval: 5min, 15min, 1h, daily, weekly or monthly. Without an interval,
+        daily data is used and weekly is the fallback. Intervals without their
+        own file are derived from the finest available finer series.
+        as_of: date/datetime cutoff - bars are read from the snapshot current at
+        that time (or the oldest one) and bars after the cutoff are dropped.
+        adjusted: back-adjust OHLCV for splits and dividends (intraday files
+        are already adjusted at the source).
+        """
+        as_of = parse_as_of(as_of) if as_of is not None else None
+        if interval is None:
+            # Try daily data first, fall back to weekly data (also when the cutoff predates the daily bars)
+            for candidate in ('daily', 'weekly'):
+                df = self._load_native_price_data(symbol, candidate, as_of, adjusted)
                 if df is not None:
-                    self.cache[cache_key] = df
-                    return df
+                    df = self._truncate(df, as_of)
+                    if not df.empty:
+                        return df
+            return pd.DataFrame()
+        
+        interval = normalize_interval(interval)
+        df = self._load_native_price_data(symbol, interval, as_of, adjusted)
+        if df is None:
+            df = self._load_derived_price_data(symbol, interval, as_of, adjusted)
         
         # If no data found, return empty DataFrame
-        return pd.DataFrame()
+        return self._truncate(df, as_of) if df is not None else pd.DataFrame()
     
-    def _parse_price_data(self, data: Dict) -> pd.DataFrame:
+    def available_intervals(self, symbol: str = 'IBM') -> Dict[str, str]:
         """
-        Parse Alpha Vantage price data into DataFrame
+        Intervals that can be loaded for a symbol, mapped to the native
+        interval they are read or derived from
+        """
+        native = self.manifest.intervals(symbol, 'price')
+        available = {}
+        for interval in INTERVALS:
+            if interval in native:
+                available[interval] = interval
+                continue
+            source = self._finest_source_interval(native, interval)
+            if source is not None:
+                available[interval] = source
+        return available
+    
+    def _price_entry(self, symbol: str, interval: str, as_of: Optional[datetime] = None) -> Optional[ManifestEntry]:
+        """
+        Price file to read for a cutoff: the snapshot current at as_of, or the
+        oldest snapshot when every file is newer (its bars up to as_of still apply)
         """
-        if not data:
+        if as_of is None:
+            return self.manifest.latest(symbol, 'price', interval)
+        entry = self.manifest.as_of(symbol, 'price', as_of, interval)
+        if entry is None:
+            entries = self.manifest.entries(symbol, 'price', interval)
+            entry = entries[0] if entries else None
+        return entry
+    
+    @staticmethod
+    def _truncate(df: pd.DataFrame, as_of: Optional[datetime]) -> pd.DataFrame:
+        """Drop bars after the cutoff; a slice, so no data is copied"""
+        if as_of is None or df.empty:
+            return df
+        end = int(df.index.searchsorted(pd.Timestamp(as_of), side='right'))
+        return df.iloc[:end]
+    
+    def _load_native_price_data(self, symbol: str, interval: str, as_of: Optional[datetime] = None,
+                                adjusted: bool = False) -> Optional[pd.DataFrame]:
+        """Price series read from this interval's own file via the columnar store"""
+        entry = self._price_entry(symbol, interval, as_of)
+        if entry is None:
             return None
         
-        # Find the time series key
-        time_series_key = None
-        for key in data.keys():
-            if 'Time Series' in key or 'time series' in key.lower():
-                time_series_key = key
-                break
-        
-        if not time_series_key:
+        # Try to load from cache first
+        cache_key = (symbol, 'price', interval, self._source_key(entry))
+        df = self.cache.get(cache_key)
+        if df is None:
+            if entry == self.manifest.latest(symbol, 'price', interval):
+                df = self.store.load(symbol, interval, entry.path, self._parse_price_file)
+            else:
+                # Older snapshots are parsed directly so they do not displace the stored latest series
+                df = self._parse_price_file(entry.path)
+                if df is not None and df.empty:
+                    df = None
+            if df is None:
+                return None
+            self.cache.put(cache_key, df)
+        
+        if adjusted and interval not in PRE_ADJUSTED_INTERVALS:
+            return self._adjust_price_data(symbol, interval, entry, df, as_of)
+        return df
+    
+    def _load_derived_price_data(self, symbol: str, interval: str, as_of: Optional[datetime] = None,
+                                 adjusted: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Price series aggregated from the finest finer interval on file
+        Derived series are stored and cached like native ones, keyed by their source
+        """
+        source_interval = self._finest_source_interval(
+            self.manifest.intervals(symbol, 'price'), interval
+        )
+        if source_interval is None:
             return None
         
-        time_series = data.get(time_series_key, {})
-        
-        # Convert to DataFrame
-        rows = []
-        for date, values in time_series.items():
-            row = {
-                'date': date,
-                'open': float(values.get('1. open', values.get('open', 0))),
-                'high': float(values.get('2. high', values.get('high', 0))),
-                'low': float(values.get('3. low', values.get('low', 0))),
-                'close': float(values.get('4. close', values.get('close', 0))),
-                'volume': int(values.get('6. volume', values.get('5. volume', values.get('volume', 0))))
-            }
-            
-            # Handle adjusted close if available
-            if '5. adjusted close' in values or 'adjusted_close' in values:
-                row['adjusted_close'] = float(values.get('5. adjusted close', values.get('adjusted_close', 0)))
-            
-            rows.append(row)
+        # Aggregating adjusted bars keeps every bucket on one price basis
+        actions = self._corporate_action_entries(symbol, as_of)
+        adjusted = adjusted and source_interval not in PRE_ADJUSTED_INTERVALS and bool(actions)
+        action_key = self._source_key(*actions) if adjusted else ()
+        
+        if as_of is not None:
+            # Aggregate only the bars known at the cutoff, so the last bucket may be partial
+            cache_key = (symbol, 'price', interval, source_interval, as_of, adjusted, action_key,
+                         self._source_key(self._price_entry(symbol, source_interval, as_of)))
+            df = self.cache.get(cache_key)
+            if df is None:
+                source = self._load_native_price_data(symbol, source_interval, as_of, adjusted)
+                df = resample_ohlcv(self._truncate(source, as_of), interval) if source is not None else None
+                if df is not None:
+                    self.cache.put(cache_key, df)
+            return df
         
-        if not rows:
-            return None
+        entry = self.manifest.latest(symbol, 'price', source_interval)
         
-        df = pd.DataFrame(rows)
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
-        df.sort_index(inplace=True)
+        cache_key = (symbol, 'price', interval, source_interval, adjusted, action_key, self._source_key(entry))
+        df = self.cache.get(cache_key)
+        if df is not None:
+            return df
         
+        def derive(_path: str) -> Optional[pd.DataFrame]:
+            return resample_ohlcv(self._load_native_price_data(symbol, source_interval, adjusted=adjusted), interval)
+        
+        series_name = f'{interval}_adjusted' if adjusted else interval
+        df = self.store.load(symbol, series_name, entry.path, derive,
+                             depends_on=[a.path for a in actions] if adjusted else None)
+        if df is not None:
+            self.cache.put(cache_key, df)
         return df
     
-    def load_fundamental_data(self, symbol: str = 'IBM') -> Dict:
+    def _adjust_price_data(self, symbol: str, interval: str, entry: ManifestEntry, raw: pd.DataFrame,
+                           as_of: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Split/dividend back-adjusted copy of a native series
+        Latest series are persisted next to the raw ones as <interval>_adjusted
+        """
+        actions = self._corporate_action_entries(symbol, as_of)
+        if not actions:
+            return raw
+        
+        # Try to load from cache; cutoffs between the same events share one adjusted copy
+        references = self._reference_entries(symbol, as_of)
+        cache_key = (symbol, 'price', interval, 'adjusted', self._event_counts(symbol, actions, as_of),
+                     self._source_key(entry, *actions, *(e for _, e in references)))
+        df = self.cache.get(cache_key)
+        if df is not None:
+            return df
+        
+        def adjust(_path: str) -> Optional[pd.DataFrame]:
+            return self._adjustment_factors(symbol, as_of).apply(raw)
+        
+        if as_of is None:
+            df = self.store.load(symbol, f'{interval}_adjusted', entry.path, adjust,
+                                 depends_on=[a.path for a in actions])
+        else:
+            df = adjust(entry.path)
+        if df is None:
+            return raw
+        self.cache.put(cache_key, df)
+        return df
+    
+    def _corporate_action_entries(self, symbol: str, as_of: Optional[datetime] = None) -> List[ManifestEntry]:
+        """Splits and dividends files that apply; event history only grows, so older cutoffs use the oldest file"""
+        entries = []
+        for data_type in ('splits', 'dividends'):
+            entry = self._snapshot(symbol, data_type, as_of)
+            if entry is None and as_of is not None:
+                history = self.manifest.entries(symbol, data_type)
+                entry = history[0] if history else None
+            if entry is not None:
+                entries.append(entry)
+        return entries
+    
+    def load_corporate_actions(self, symbol: str = 'IBM', as_of=None) -> CorporateActions:
+        """Split and dividend events of a symbol, limited to those effective by as_of"""
+        as_of = parse_as_of(as_of) if as_of is not None else None
+        actions = self._parse_corporate_actions(symbol, self._corporate_action_entries(symbol, as_of))
+        return actions.until(as_of) if as_of is not None else actions
+    
+    def _parse_corporate_actions(self, symbol: str, entries: List[ManifestEntry]) -> CorporateActions:
+        """Events of a set of splits/dividends files, parsed once per set of source files"""
+        cache_key = (symbol, 'corporate_actions', self._source_key(*entries))
+        actions = self.cache.get(cache_key)
+        if actions is not None:
+            return actions
+        
+        by_type = {e.data_type: e for e in entries}
+        actions = CorporateActions.from_data(
+            self._load_json_file(by_type['splits'].path) if 'splits' in by_type else None,
+            self._load_json_file(by_type['dividends'].path) if 'dividends' in by_type else None
+        )
+        self.cache.put(cache_key, actions,
+                       size=sum(a.nbytes for a in (actions.split_dates, actions.split_ratios,
+                                                   actions.dividend_dates, actions.dividend_amounts)))
+        return actions
+    
+    def _event_counts(self, symbol: str, entries: List[ManifestEntry], as_of: Optional[datetime]) -> tuple:
+        """
+        (splits, dividends) effective by as_of - adjusted prices only change
+        when an event crosses the cutoff, so this stands in for as_of in cache keys
+        """
+        actions = self._parse_corporate_actions(symbol, entries)
+        if as_of is not None:
+            actions = actions.until(as_of)
+        return len(actions.split_dates), len(actions.dividend_dates)
+    
+    def _reference_entries(self, symbol: str, as_of: Optional[datetime] = None) -> List[tuple]:
+        """(interval, entry) of the daily/weekly/monthly series that supply dividend reference closes"""
+        references = [(interval, self._price_entry(symbol, interval, as_of))
+                      for interval in ('monthly', 'weekly', 'daily')]
+        return [(interval, entry) for interval, entry in references if entry is not None]
+    
+    def _adjustment_factors(self, symbol: str, as_of: Optional[datetime] = None) -> AdjustmentFactors:
+        """
+        Cumulative split/dividend factors of a symbol, computed once per set of
+        source files and events effective at the cutoff
+        Dividend ratios use the unadjusted close before each ex-date from the
+        finest native daily/weekly/monthly series that covers it
+        """
+        references = self._reference_entries(symbol, as_of)
+        actions = self._corporate_action_entries(symbol, as_of)
+        
+        # Try to load from cache; keyed on the events known at the cutoff rather than the cutoff itself
+        cache_key = (symbol, 'adjustment_factors', self._event_counts(symbol, actions, as_of),
+                     self._source_key(*actions, *(entry for _, entry in references)))
+        factors = self.cache.get(cache_key)
+        if factors is not None:
+            return factors
+        
+        # Stitch coarse history in front of finer series
+        closes = []
+        for interval, _ in references:
+            raw = self._load_native_price_data(symbol, interval, as_of)
+            if raw is None or raw.empty:
+                continue
+            close = raw['close']
+            if closes:
+                closes = [c[c.index < close.index[0]] for c in closes]
+            closes.append(close)
+        reference = pd.concat(closes) if closes else None
+        
+        factors = self.load_corporate_actions(symbol, as_of).factors(reference)
+        self.cache.put(cache_key, factors,
+                       size=factors.event_dates.nbytes + factors.price.nbytes + factors.volume.nbytes)
+        return factors
+    
+    @staticmethod
+    def _finest_source_interval(native_intervals: List[str], interval: str) -> Optional[str]:
+        """Finest native interval that is finer than the requested one"""
+        finer = [i for i in native_intervals if i in INTERVALS and interval_rank(i) < interval_rank(interval)]
+        return min(finer, key=interval_rank) if finer else None
+    
+    def ingest_price_data(self, symbol: str = 'IBM') -> Dict[str, int]:
+        """
+        Convert every available price JSON file for a symbol into the columnar store,
+        together with its split/dividend adjusted copy
+        Returns the number of bars stored per interval
+        """
+        ingested = {}
+        for interval in self.manifest.intervals(symbol, 'price'):
+            df = self._load_native_price_data(symbol, interval, adjusted=True)
+            if df is not None:
+                ingested[interval] = len(df)
+        return ingested
+    
+    def _parse_price_file(self, filepath: str) -> Optional[pd.DataFrame]:
+        """Load and parse one Alpha Vantage price JSON file"""
+        return self._parse_price_data(self._load_json_file(filepath))
+    
+    def _parse_price_data(self, data: Dict) -> pd.DataFrame:
+        """
+        Parse Alpha Vantage price data into DataFrame
+        """
+        return parse_time_series(data)
+    
+    def load_indicator_state(self, symbol: str = 'IBM', interval: str = 'daily') -> Optional[IndicatorState]:
+        """
+        Running indicator state for a symbol and interval, restored from the store
+        
+        Bars newer than the saved state are fed in incrementally (the last saved
+        bar is revised if it changed); the state is rebuilt from the price
+        series when it is missing, no longer lines up with it, or was built on
+        other split/dividend files (a new event rescales every earlier bar).
+        """
+        interval = normalize_interval(interval)
+        df = self.load_price_data(symbol, interval)
+        if df.empty:
+            return None
+        source = self._price_basis(symbol, interval)
+        
+        path = os.path.join(self.store.store_dir, symbol.upper(), f'{interval}_state.json')
+        with self.store.series_lock(symbol, f'{interval}_state'):
+            state = IndicatorState.load(path) if os.path.exists(path) else None
+            start = None
+            if state is not None and state.last_timestamp is not None and state.source == source:
+                last = pd.Timestamp(state.last_timestamp)
+                start = int(df.index.searchsorted(last, side='left'))
+                if start >= len(df) or df.index[start] != last:
+                    start = None
+            
+            if start is None:
+                state = IndicatorState.from_frame(df, symbol.upper(), interval, source)
+            elif start < len(df) - 1 or state.last_bar != self._bar_dict(df, start):
+                for i in range(start, len(df)):
+                    bar = self._bar_dict(df, i)
+                    state.update(df.index[i], bar['open'], bar['high'], bar['low'], bar['close'], bar['volume'])
+            else:
+                return state
+            
+            try:
+                state.save(path)
+            except OSError as e:
+                print(f"Error saving indicator state for {symbol} {interval}: {str(e)}")
+        return state
+    
+    def _price_basis(self, symbol: str, interval: str) -> str:
+        """
+        Digest of the split/dividend files behind an adjusted interval's prices
+        (empty for intervals adjusted at the source)
+        """
+        source_interval = interval
+        if interval not in self.manifest.intervals(symbol, 'price'):
+            source_interval = self._finest_source_interval(self.manifest.intervals(symbol, 'price'), interval)
+        if source_interval is None or source_interval in PRE_ADJUSTED_INTERVALS:
+            return ''
+        key = self._source_key(*self._corporate_action_entries(symbol))
+        return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _bar_dict(df: pd.DataFrame, i: int) -> Dict[str, float]:
+        return {column: float(df[column].iat[i]) for column in ('open', 'high', 'low', 'close', 'volume')}
+    
+    def load_fundamental_data(self, symbol: str = 'IBM', as_of=None) -> Dict:
         """
         Load fundamental data (company overview, financials)
+        as_of: use the snapshots that were current at that date instead of the newest
         """
-        symbol_lower = symbol.lower()
+        # Find the most recent file of each statement type (at the cutoff)
+        sources = {}
+        for key, data_type in self.FUNDAMENTAL_DATA_TYPES.items():
+            entry = self._snapshot(symbol, data_type, as_of)
+            if entry is not None:
+                sources[key] = entry
         
         # Try to load from cache
-        cache_key = f"{symbol}_fundamental"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        cache_key = (symbol, 'fundamental', self._source_key(*sources.values()))
+        result = self.cache.get(cache_key)
+        if result is not None:
+            return result
         
         result = {}
+        for key, entry in sources.items():
+            result[key] = self._load_json_file(entry.path)
         
-        # Load company overview
-        overview_files = glob.glob(
-            os.path.join(self.folders['fundamental'], 'company_overview*.json')
-        )
-        if overview_files:
-            latest_file = max(overview_files, key=os.path.getctime)
-            result['overview'] = self._load_json_file(latest_file)
-        
-        # Load income statement
-        income_files = glob.glob(
-            os.path.join(self.folders['fundamental'], 'income_statement*.json')
-        )
-        if income_files:
-            latest_file = max(income_files, key=os.path.getctime)
-            result['income'] = self._load_json_file(latest_file)
-        
-        # Load balance sheet
-        balance_files = glob.glob(
-            os.path.join(self.folders['fundamental'], 'balance_sheet*.json')
-        )
-        if balance_files:
-            latest_file = max(balance_files, key=os.path.getctime)
-            result['balance'] = self._load_json_file(latest_file)
-        
-        # Load cash flow
-        cash_files = glob.glob(
-            os.path.join(self.folders['fundamental'], 'cash_flow*.json')
-        )
-        if cash_files:
-            latest_file = max(cash_files, key=os.path.getctime)
-            result['cash_flow'] = self._load_json_file(latest_file)
-        
-        # Load earnings
-        earnings_files = glob.glob(
-            os.path.join(self.folders['fundamental'], 'earnings_history*.json')
-        )
-        if earnings_files:
-            latest_file = max(earnings_files, key=os.path.getctime)
-            result['earnings'] = self._load_json_file(latest_file)
-        
-        self.cache[cache_key] = result
+        self.cache.put(cache_key, result)
         return result
     
-    def load_sentiment_data(self, symbol: str = 'IBM') -> Dict:
+    def load_sentiment_data(self, symbol: str = 'IBM', as_of=None) -> Dict:
         """
         Load sentiment data (news, earnings transcripts, sentiment scores)
+        as_of: only snapshots current at that date, and transcripts whose calls
+        were available by then (quarter end plus transcript_lag)
         """
-        symbol_lower = symbol.lower()
+        transcript_entries = self.manifest.entries(symbol, 'earnings_transcript')
+        if as_of is not None:
+            cutoff = parse_as_of(as_of)
+            transcript_entries = [e for e in transcript_entries if self._transcript_available(e) <= cutoff]
+        latest_news = self._snapshot(symbol, 'financial_news', as_of)
+        latest_scores = self._snapshot(symbol, 'sentiment_scores', as_of)
         
         # Try to load from cache
-        cache_key = f"{symbol}_sentiment"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        sources = [e for e in transcript_entries + [latest_news, latest_scores] if e]
+        cache_key = (symbol, 'sentiment', self._source_key(*sources))
+        result = self.cache.get(cache_key)
+        if result is not None:
+            return result
         
         result = {}
         
-        # Load earnings transcripts
-        transcript_files = glob.glob(
-            os.path.join(self.folders['sentiment'], 'earnings_transcript_*.json')
-        )
-        if transcript_files:
-            transcripts = []
-            for file in transcript_files:
-                data = self._load_json_file(file)
-                if data:
-                    transcripts.append(data)
-            result['transcripts'] = transcripts
+        # Earnings transcripts as compact per-quarter summaries; full text via load_transcript
+        if transcript_entries:
+            with self.store.series_lock(symbol, 'transcripts'):
+                index = TranscriptIndex(os.path.join(self.store.store_dir, symbol.upper(), 'transcripts.json'))
+                result['transcripts'] = index.summaries(transcript_entries, self._load_json_file, prune=as_of is None)
         
         # Load financial news (if EODHD data exists)
-        news_files = glob.glob(
-            os.path.join(self.folders['sentiment'], 'financial_news*.json')
-        )
-        if news_files:
-            latest_file = max(news_files, key=os.path.getctime)
-            result['news'] = self._load_json_file(latest_file)
+        if latest_news:
+            result['news'] = self._load_json_file(latest_news.path)
         
         # Load sentiment scores (if EODHD data exists)
-        sentiment_files = glob.glob(
-            os.path.join(self.folders['sentiment'], 'sentiment_scores*.json')
-        )
-        if sentiment_files:
-            latest_file = max(sentiment_files, key=os.path.getctime)
-            result['scores'] = self._load_json_file(latest_file)
+        if latest_scores:
+            result['scores'] = self._load_json_file(latest_scores.path)
         
-        self.cache[cache_key] = result
+        self.cache.put(cache_key, result)
         return result
     
-    def load_insider_data(self, symbol: str = 'IBM') -> Dict:
+    def load_transcript(self, symbol: str = 'IBM', quarter: Optional[str] = None) -> Dict:
         """
-        Load insider trading data
+        Full text of one earnings call transcript, loaded on demand
+        quarter is YYYYQn; the latest transcript is returned when omitted
         """
-        symbol_lower = symbol.lower()
+        entries = self.manifest.entries(symbol, 'earnings_transcript')
+        if quarter:
+            entries = [e for e in entries if e.period == quarter.upper()]
+        if not entries:
+            return {}
+        entry = entries[-1]
         
         # Try to load from cache
-        cache_key = f"{symbol}_insider"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        cache_key = (symbol, 'transcript', self._source_key(entry))
+        result = self.cache.get(cache_key)
+        if result is not None:
+            return result
+        
+        result = self._load_json_file(entry.path)
+        if result:
+            self.cache.put(cache_key, result)
+        return result
+    
+    def load_insider_data(self, symbol: str = 'IBM', since: Optional[str] = None, as_of=None) -> Dict:
+        """
+        Load insider trading data
         
-        # Load insider transactions
-        insider_files = glob.glob(
-            os.path.join(self.folders['alternative'], 'insider_transactions*.json')
-        )
+        Summary metrics cover the whole file, or only transactions on or after
+        since (YYYY-MM-DD). Trailing 30/90/365-day windows, top executives and
+        cluster activity come from the typed insider table. With as_of, the
+        snapshot current at that date is used and later transactions are ignored.
+        """
+        table = self.load_insider_table(symbol, as_of)
+        if table is None or len(table) == 0:
+            return {}
         
-        if insider_files:
-            latest_file = max(insider_files, key=os.path.getctime)
-            data = self._load_json_file(latest_file)
-            
-            # Process insider data
-            if data and 'data' in data:
-                transactions = data['data']
-                
-                # Calculate summary metrics
-                buy_count = 0
-                sell_count = 0
-                buy_value = 0
-                sell_value = 0
-                
-                for trans in transactions:
-                    trans_type = trans.get('transaction_type', '').lower()
-                    shares = float(trans.get('securities_transacted', 0))
-                    price = float(trans.get('security_price', 0))
-                    value = shares * price
-                    
-                    if 'buy' in trans_type or 'acquisition' in trans_type:
-                        buy_count += 1
-                        buy_value += value
-                    elif 'sell' in trans_type or 'sale' in trans_type:
-                        sell_count += 1
-                        sell_value += value
-                
-                result = {
-                    'transactions': transactions[:50],  # Latest 50 transactions
-                    'buyers': buy_count,
-                    'sellers': sell_count,
-                    'buy_value': buy_value,
-                    'sell_value': sell_value,
-                    'net_value': buy_value - sell_value,
-                    'recent_activity': self._analyze_insider_clusters(transactions[:10])
-                }
-                
-                self.cache[cache_key] = result
-                return result
-        
-        return {}
-    
-    def _analyze_insider_clusters(self, recent_transactions: List) -> str:
-        """Analyze recent insider transactions for clusters"""
-        if not recent_transactions:
-            return 'none'
-        
-        buy_count = sum(1 for t in recent_transactions 
-                       if 'buy' in t.get('transaction_type', '').lower() 
-                       or 'acquisition' in t.get('transaction_type', '').lower())
-        sell_count = sum(1 for t in recent_transactions 
-                        if 'sell' in t.get('transaction_type', '').lower() 
-                        or 'sale' in t.get('transaction_type', '').lower())
-        
-        if buy_count >= 5:
-            return 'buying_cluster'
-        elif sell_count >= 5:
-            return 'selling_cluster'
-        elif buy_count > sell_count:
-            return 'moderate_buying'
-        elif sell_count > buy_count:
-            return 'moderate_selling'
-        else:
-            return 'mixed'
+        end = parse_as_of(as_of).date() if as_of is not None else None
+        totals = table.totals(start=since, end=end)
+        clusters = table.cluster_activity(days=30, as_of=end)
+        return {
+            'transactions': table.recent_rows(50, end=end),  # Latest 50 transactions
+            'buyers': totals['buyers'],
+            'sellers': totals['sellers'],
+            'buy_value': totals['buy_value'],
+            'sell_value': totals['sell_value'],
+            'net_value': totals['net_value'],
+            'recent_activity': clusters['signal'],
+            'clusters': clusters,
+            'windows': table.window_totals((30, 90, 365), as_of=end),
+            'top_executives': table.executive_totals(start=since, end=end, top=10)
+        }
+    
+    def load_insider_table(self, symbol: str = 'IBM', as_of=None) -> Optional[InsiderTable]:
+        """
+        Typed columnar insider table, built once per source file and kept
+        next to the price store as memory-mapped columns
+        """
+        latest = self._snapshot(symbol, 'insider_transactions', as_of)
+        if latest is None and as_of is not None:
+            # Transaction history only grows, so the oldest file still covers earlier cutoffs
+            entries = self.manifest.entries(symbol, 'insider_transactions')
+            latest = entries[0] if entries else None
+        if latest is None:
+            return None
+        if latest != self.manifest.latest(symbol, 'insider_transactions'):
+            # Older snapshots are built in memory only, keeping the stored table on the newest file
+            return self._load_snapshot_insider_table(symbol, latest)
+        
+        # Try to load from cache
+        cache_key = (symbol, 'insider_table', self._source_key(latest))
+        table = self.cache.get(cache_key)
+        if table is not None:
+            return table
+        
+        fingerprint = self.store.fingerprint(latest.path)
+        table_dir = self.store.series_dir(symbol, 'insider')
+        with self.store.series_lock(symbol, 'insider'):
+            table = InsiderTable.load(table_dir, fingerprint)
+            if table is None:
+                try:
+                    table = InsiderTable.from_file(latest.path)
+                except (OSError, ValueError) as e:
+                    print(f"Error loading {latest.path}: {str(e)}")
+                    return None
+                try:
+                    table.save(table_dir, fingerprint)
+                except OSError as e:
+                    print(f"Error writing insider table for {symbol}: {str(e)}")
+        
+        self.cache.put(cache_key, table, size=table.nbytes())
+        return table
+    
+    def _load_snapshot_insider_table(self, symbol: str, entry: ManifestEntry) -> Optional[InsiderTable]:
+        cache_key = (symbol, 'insider_table', self._source_key(entry))
+        table = self.cache.get(cache_key)
+        if table is None:
+            try:
+                table = InsiderTable.from_file(entry.path)
+            except (OSError, ValueError) as e:
+                print(f"Error loading {entry.path}: {str(e)}")
+                return None
+            self.cache.put(cache_key, table, size=table.nbytes())
+        return table
     
-    def load_company_overview(self, symbol: str = 'IBM') -> Dict:
+    def load_company_overview(self, symbol: str = 'IBM', as_of=None) -> Dict:
         """
         Load company overview data
         """
-        fundamental = self.load_fundamental_data(symbol)
+        fundamental = self.load_fundamental_data(symbol, as_of)
         return fundamental.get('overview', {})
     
+    def _snapshot(self, symbol: str, data_type: str, as_of=None) -> Optional[ManifestEntry]:
+        """Newest file of a data type, or the one current at as_of"""
+        if as_of is None:
+            return self.manifest.latest(symbol, data_type)
+        return self.manifest.as_of(symbol, data_type, parse_as_of(as_of))
+    
+    def _transcript_available(self, entry: ManifestEntry) -> datetime:
+        """
+        When a quarter-labelled transcript became known: the end of its quarter
+        plus the reporting lag, since the call happens weeks after the quarter closes
+        """
+        start = entry.timestamp
+        month = start.month + 3
+        quarter_end = datetime(start.year + (month - 1) // 12, (month - 1) % 12 + 1, 1)
+        return quarter_end + self.transcript_lag
+    
+    @staticmethod
+    def _source_key(*entries: ManifestEntry) -> tuple:
+        """
+        Fingerprint source files as (path, mtime, size) tuples for cache keys,
+        so replacing or adding a file produces a new key
+        """
+        return tuple((e.path, e.mtime_ns, e.size) for e in entries)
+    
     def _load_json_file(self, filepath: str) -> Dict:
         """
         Load JSON file and handle errors
@@ -350,6 +667,65 @@ class DataLoader:
             'data_types': []
         }
     
+    # ------------------------------------------------------------------
+    # Awaitable loaders for the async API endpoints
+    # ------------------------------------------------------------------
+    
+    async def _run_async(self, func: Callable, *args) -> Any:
+        """
+        Run a blocking loader on the I/O pool without blocking the event loop
+        
+        Concurrent calls with the same loader and arguments share one
+        execution: the first caller starts it, later callers await its result.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), func.__name__, args)
+        future = self._inflight.get(key)
+        if future is None:
+            future = loop.run_in_executor(self._executor, func, *args)
+            self._inflight[key] = future
+            
+            def forget(done: asyncio.Future):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+            future.add_done_callback(forget)
+        
+        # Shield so one cancelled request does not cancel the load for the others
+        return await asyncio.shield(future)
+    
+    async def aload_price_data(self, symbol: str = 'IBM', interval: Optional[str] = None, as_of=None,
+                               adjusted: bool = True) -> pd.DataFrame:
+        """Awaitable load_price_data"""
+        return await self._run_async(self.load_price_data, symbol, interval, as_of, adjusted)
+    
+    async def aload_indicator_state(self, symbol: str = 'IBM', interval: str = 'daily') -> Optional[IndicatorState]:
+        """Awaitable load_indicator_state"""
+        return await self._run_async(self.load_indicator_state, symbol, interval)
+    
+    async def aload_fundamental_data(self, symbol: str = 'IBM', as_of=None) -> Dict:
+        """Awaitable load_fundamental_data"""
+        return await self._run_async(self.load_fundamental_data, symbol, as_of)
+    
+    async def aload_sentiment_data(self, symbol: str = 'IBM', as_of=None) -> Dict:
+        """Awaitable load_sentiment_data"""
+        return await self._run_async(self.load_sentiment_data, symbol, as_of)
+    
+    async def aload_insider_data(self, symbol: str = 'IBM', since: Optional[str] = None, as_of=None) -> Dict:
+        """Awaitable load_insider_data"""
+        return await self._run_async(self.load_insider_data, symbol, since, as_of)
+    
+    async def aload_company_overview(self, symbol: str = 'IBM', as_of=None) -> Dict:
+        """Awaitable load_company_overview"""
+        return await self._run_async(self.load_company_overview, symbol, as_of)
+    
+    async def aload_transcript(self, symbol: str = 'IBM', quarter: Optional[str] = None) -> Dict:
+        """Awaitable load_transcript"""
+        return await self._run_async(self.load_transcript, symbol, quarter)
+    
     def clear_cache(self):
         """Clear the data cache"""
-        self.cache = {}
+        self.cache.clear()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters of the data cache"""
+        return self.cache.stats()
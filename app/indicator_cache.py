@@ -0,0 +1,171 @@
+"""
+Indicator Cache Module
+Memoized indicator results shared by every endpoint, keyed by a price-data fingerprint
+"""
+import hashlib
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.cache import LRUCache
+from app.chart_series import DEFAULT_POINTS, ChartSeries, parse_series
+from app.indicator_engine import IndicatorEngine
+from app.price_levels import LevelDetector
+from app.technical_analysis import TechnicalAnalyzer
+
+class IndicatorCache:
+    """
+    LRU cache of indicator results across endpoints
+
+    Entries are keyed by (symbol, interval, last bar timestamp, bar count,
+    parameter set) plus a digest of the OHLCV columns, so a revised bar, a
+    new bar or a re-adjusted history produces a new key and stale results
+    simply age out. Cached dictionaries are shared between callers and
+    must be treated as read-only.
+    """
+
+    # Default byte budget, overridable via INDICATOR_CACHE_MAX_MB
+    DEFAULT_MAX_MB = 64
+
+    PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, analyzer: Optional[TechnicalAnalyzer] = None, max_bytes: Optional[int] = None):
+        self.analyzer = analyzer or TechnicalAnalyzer()
+        if max_bytes is None:
+            max_mb = float(os.getenv('INDICATOR_CACHE_MAX_MB', self.DEFAULT_MAX_MB))
+            max_bytes = int(max_mb * 1024 * 1024)
+        self.cache = LRUCache(max_bytes=max_bytes)
+
+        # Per-kind counters ('indicators', 'chart', ...) on top of the LRU totals
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, Dict[str, int]] = {}
+
+    # Fingerprints of live DataFrames by id(), each with a weak reference that
+    # confirms the id still belongs to the same frame
+    _fingerprints: Dict[int, Tuple[weakref.ref, Tuple]] = {}
+    _fingerprints_lock = threading.Lock()
+
+    @classmethod
+    def fingerprint(cls, price_data: pd.DataFrame) -> Tuple:
+        """
+        (last bar timestamp, bar count, digest of the OHLCV columns)
+        The digest is computed once per DataFrame object: the loader hands out
+        the same cached (read-only) frame while its source files are unchanged
+        """
+        if price_data is None or price_data.empty:
+            return (None, 0, None)
+        key = id(price_data)
+        with cls._fingerprints_lock:
+            memo = cls._fingerprints.get(key)
+        if memo is not None and memo[0]() is price_data:
+            return memo[1]
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(price_data.index.values.astype('datetime64[ns]').tobytes())
+        for column in cls.PRICE_COLUMNS:
+            if column in price_data.columns:
+                digest.update(np.ascontiguousarray(price_data[column].to_numpy()).tobytes())
+        fingerprint = (str(price_data.index[-1]), len(price_data), digest.hexdigest())
+
+        def forget(ref: weakref.ref):
+            with cls._fingerprints_lock:
+                if cls._fingerprints.get(key, (None,))[0] is ref:
+                    del cls._fingerprints[key]
+
+        with cls._fingerprints_lock:
+            cls._fingerprints[key] = (weakref.ref(price_data, forget), fingerprint)
+        return fingerprint
+
+    def get_or_compute(self, symbol: str, interval: Optional[str], price_data: pd.DataFrame,
+                       params: Tuple[Hashable, ...], compute: Callable[[], Any],
+                       fingerprint: Optional[Tuple] = None) -> Any:
+        """
+        Cached result for (symbol, interval, data fingerprint, params), computing
+        and storing it on a miss; params[0] names the result kind for the stats
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint(price_data)
+        key = (symbol.upper(), interval or 'daily') + fingerprint + tuple(params)
+        kind = str(params[0]) if params else 'default'
+
+        value = self.cache.get(key)
+        hit = value is not None
+        if not hit:
+            value = compute()
+            self.cache.put(key, value)
+
+        with self._lock:
+            counters = self._kinds.setdefault(kind, {'hits': 0, 'misses': 0})
+            counters['hits' if hit else 'misses'] += 1
+        return value
+
+    def indicators(self, symbol: str, interval: Optional[str], price_data: pd.DataFrame) -> Dict[str, Any]:
+        """calculate_all_indicators, memoized"""
+        return self.get_or_compute(
+            symbol, interval, price_data, ('indicators',),
+            lambda: self.analyzer.calculate_all_indicators(price_data)
+        )
+
+    def technical(self, symbol: str, interval: Optional[str], price_data: pd.DataFrame,
+                  limit: int = 100) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        (indicators, chart data), memoized separately; on a miss both share
+        one IndicatorEngine, built only if something has to be computed
+        """
+        fingerprint = self.fingerprint(price_data)
+        engines = []
+
+        def engine() -> IndicatorEngine:
+            if not engines:
+                engines.append(IndicatorEngine(price_data))
+            return engines[0]
+
+        indicators = self.get_or_compute(
+            symbol, interval, price_data, ('indicators',),
+            lambda: self.analyzer.calculate_all_indicators(price_data, engine()), fingerprint
+        )
+        chart = self.get_or_compute(
+            symbol, interval, price_data, ('chart', limit),
+            lambda: self.analyzer.prepare_chart_data(price_data, limit, engine()), fingerprint
+        )
+        return indicators, chart
+
+    def levels(self, symbol: str, interval: Optional[str], price_data: pd.DataFrame,
+               scales: Tuple[int, ...] = LevelDetector.DEFAULT_SCALES, tolerance: float = 0.01,
+               max_zones: int = 5) -> Dict[str, Any]:
+        """Multi-scale support/resistance zones, memoized"""
+        detector = LevelDetector(scales, tolerance)
+        return self.get_or_compute(
+            symbol, interval, price_data, ('levels', detector.scales, detector.tolerance, max_zones),
+            lambda: detector.detect(price_data, max_zones=max_zones)
+        )
+
+    def chart_series(self, symbol: str, interval: Optional[str], price_data: pd.DataFrame,
+                     series: List[str], start: Optional[pd.Timestamp] = None,
+                     end: Optional[pd.Timestamp] = None, points: int = DEFAULT_POINTS) -> Dict[str, Any]:
+        """Downsampled price and indicator series for a date range, memoized"""
+        # Normalized so 'RSI' and 'rsi_14' share one entry; raises ValueError on unknown names
+        requested = tuple(parse_series(series))
+        names = [kind if period is None else f'{kind}_{period}' for kind, period in requested]
+        return self.get_or_compute(
+            symbol, interval, price_data, ('chart_series', requested, str(start), str(end), points),
+            lambda: ChartSeries(price_data).build(names, start, end, points)
+        )
+
+    def clear(self):
+        """Drop every cached result (counters are kept)"""
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """LRU usage counters plus hit rates per result kind"""
+        stats = self.cache.stats()
+        with self._lock:
+            stats['kinds'] = {
+                kind: dict(counters, hit_rate=round(counters['hits'] / (counters['hits'] + counters['misses']), 4))
+                for kind, counters in self._kinds.items()
+            }
+        return stats
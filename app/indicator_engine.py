@@ -0,0 +1,763 @@
+"""
+Indicator Engine Module
+Computes every technical indicator from one set of shared intermediates
+"""
+import math
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional
+
+from app.indicator_kernels import (
+    as_float_array, ema, emas, prefix_sum, rolling_max, rolling_mean, rolling_min,
+    rolling_std, wilder, wilders, window_sums
+)
+
+class IndicatorEngine:
+    """
+    Single-pass indicator computation over one OHLCV frame
+
+    The price columns are extracted once as contiguous float64 arrays.
+    Intermediates that several indicators need - the close prefix sum behind
+    every SMA, each EMA span, close-to-close deltas, returns, true range - are
+    computed on first use and memoized, so e.g. SMA(20) is shared by the SMA
+    block, Bollinger Bands and the chart, and EMA(12/26) by the EMA block and
+    MACD. EMAs and Wilder averages (RSI, ATR, ADX) all run on the recursive
+    filter kernel. Series methods return full-length arrays; the *_values methods return
+    the latest-bar dictionaries TechnicalAnalyzer has always produced.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.index = df.index
+        self.open = as_float_array(df['open'])
+        self.high = as_float_array(df['high'])
+        self.low = as_float_array(df['low'])
+        self.close = as_float_array(df['close'])
+        self.volume = as_float_array(df['volume'])
+        self._memo: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def _cached(self, key, compute: Callable):
+        value = self._memo.get(key)
+        if value is None:
+            value = self._memo[key] = compute()
+        return value
+
+    # ------------------------------------------------------------------
+    # Shared intermediates
+    # ------------------------------------------------------------------
+
+    def close_prefix(self) -> np.ndarray:
+        return self._cached('close_prefix', lambda: prefix_sum(self.close))
+
+    def volume_prefix(self) -> np.ndarray:
+        return self._cached('volume_prefix', lambda: prefix_sum(self.volume))
+
+    def deltas(self) -> np.ndarray:
+        """Close-to-close changes (length n - 1)"""
+        return self._cached('deltas', lambda: np.diff(self.close))
+
+    def gains(self) -> np.ndarray:
+        return self._cached('gains', lambda: np.where(self.deltas() > 0, self.deltas(), 0.0))
+
+    def losses(self) -> np.ndarray:
+        return self._cached('losses', lambda: np.where(self.deltas() < 0, -self.deltas(), 0.0))
+
+    def returns(self) -> np.ndarray:
+        """Simple close-to-close returns (length n - 1)"""
+        def compute():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return self.close[1:] / self.close[:-1] - 1.0
+        return self._cached('returns', compute)
+
+    def typical_price(self) -> np.ndarray:
+        """(high + low + close) / 3, behind MFI, CCI and VWAP"""
+        return self._cached('typical_price', lambda: (self.high + self.low + self.close) / 3)
+
+    def money_flow_prefix(self) -> np.ndarray:
+        """Prefix sum of typical price x volume, shared by MFI-style and VWAP windows"""
+        return self._cached('money_flow_prefix', lambda: prefix_sum(self.typical_price() * self.volume))
+
+    def true_range(self) -> np.ndarray:
+        """High-low range widened to the previous close (first bar wraps, as np.roll does)"""
+        def compute():
+            previous = np.roll(self.close, 1)
+            return np.maximum(self.high - self.low,
+                              np.maximum(np.abs(self.high - previous), np.abs(self.low - previous)))
+        return self._cached('true_range', compute)
+
+    # ------------------------------------------------------------------
+    # Indicator series
+    # ------------------------------------------------------------------
+
+    def sma(self, period: int) -> np.ndarray:
+        return self._cached(('sma', period), lambda: rolling_mean(self.close, period, self.close_prefix()))
+
+    def ema(self, span: int) -> np.ndarray:
+        return self._cached(('ema', span), lambda: ema(self.close, span))
+
+    def emas(self, spans: List[int]) -> Dict[int, np.ndarray]:
+        """EMAs of several spans; the ones not yet memoized are filtered in one kernel call"""
+        missing = [span for span in dict.fromkeys(spans) if ('ema', span) not in self._memo]
+        if missing:
+            for span, values in zip(missing, emas(self.close, missing)):
+                self._memo[('ema', span)] = values
+        return {span: self._memo[('ema', span)] for span in spans}
+
+    def std(self, period: int) -> np.ndarray:
+        return self._cached(('std', period), lambda: rolling_std(self.close, period))
+
+    def volume_sma(self, period: int) -> np.ndarray:
+        return self._cached(('volume_sma', period), lambda: rolling_mean(self.volume, period, self.volume_prefix()))
+
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+        def compute():
+            averages = self.emas([fast, slow])
+            line = averages[fast] - averages[slow]
+            signal_line = ema(line, signal)
+            return {'macd': line, 'signal': signal_line, 'histogram': line - signal_line}
+        return self._cached(('macd', fast, slow, signal), compute)
+
+    def bollinger(self, period: int = 20, std_dev: float = 2) -> Dict[str, np.ndarray]:
+        def compute():
+            middle = self.sma(period)
+            width = self.std(period) * std_dev
+            return {'upper': middle + width, 'middle': middle, 'lower': middle - width}
+        return self._cached(('bollinger', period, std_dev), compute)
+
+    def rsi(self, period: int = 14) -> np.ndarray:
+        """
+        Wilder RSI at every bar: 100 - 100 / (1 + avg gain / avg loss), the
+        averages seeded with the mean of the first period deltas and then
+        Wilder-smoothed; aligned with the close array
+        """
+        def compute():
+            if len(self.deltas()) < period:
+                return np.full(len(self), np.nan)
+            return self._rsi_series(period, wilder(self.gains(), period), wilder(self.losses(), period))
+        return self._cached(('rsi', period), compute)
+
+    def rsis(self, periods: List[int]) -> Dict[int, np.ndarray]:
+        """RSIs of several periods; the gain and loss averages not yet memoized are each smoothed in one kernel call"""
+        missing = [period for period in dict.fromkeys(periods) if ('rsi', period) not in self._memo]
+        if missing:
+            gains = wilders(self.gains(), missing)
+            losses = wilders(self.losses(), missing)
+            for period, gain, loss in zip(missing, gains, losses):
+                self._memo[('rsi', period)] = self._rsi_series(period, gain, loss)
+        return {period: self._memo[('rsi', period)] for period in periods}
+
+    def _rsi_series(self, period: int, gains: np.ndarray, losses: np.ndarray) -> np.ndarray:
+        """Close-aligned RSI from Wilder-averaged gains and losses (NaN when there are too few deltas)"""
+        out = np.full(len(self), np.nan)
+        gains, losses = gains[period - 1:], losses[period - 1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = 100 - 100 / (1 + gains / losses)
+        out[period:] = np.where(losses == 0, 100.0, values)
+        return out
+
+    def atr(self, period: int = 14) -> np.ndarray:
+        """
+        Wilder ATR at every bar; true ranges start at the second bar (the
+        first has no previous close), so the first value lands on bar period
+        """
+        def compute():
+            out = np.full(len(self), np.nan)
+            out[1:] = wilder(self.true_range()[1:], period)
+            return out
+        return self._cached(('atr', period), compute)
+
+    def atrs(self, periods: List[int]) -> Dict[int, np.ndarray]:
+        """ATRs of several periods; the ones not yet memoized are smoothed in one kernel call"""
+        missing = [period for period in dict.fromkeys(periods) if ('atr', period) not in self._memo]
+        if missing:
+            for period, values in zip(missing, wilders(self.true_range()[1:], missing)):
+                out = np.full(len(self), np.nan)
+                out[1:] = values
+                self._memo[('atr', period)] = out
+        return {period: self._memo[('atr', period)] for period in periods}
+
+    def dmi(self, period: int = 14) -> Dict[str, np.ndarray]:
+        """
+        Wilder's directional movement: +DI, -DI and ADX at every bar
+
+        +DM / -DM are the up / down moves of the high / low when they beat
+        the opposite move; both and the true range are Wilder-smoothed, and
+        ADX is the Wilder average of DX = 100 * |+DI - -DI| / (+DI + -DI),
+        so it starts on bar 2 * period - 1.
+        """
+        def compute():
+            n = len(self)
+            plus_di = np.full(n, np.nan)
+            minus_di = np.full(n, np.nan)
+            adx = np.full(n, np.nan)
+            if n > period:
+                up = np.diff(self.high)
+                down = -np.diff(self.low)
+                plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+                minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+                smoothed_range = self.atr(period)[1:]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    plus_di[1:] = 100 * wilder(plus_dm, period) / smoothed_range
+                    minus_di[1:] = 100 * wilder(minus_dm, period) / smoothed_range
+                    total = plus_di + minus_di
+                    dx = np.where(total == 0, 0.0, 100 * np.abs(plus_di - minus_di) / total)
+                adx[period:] = wilder(dx[period:], period)
+            return {'plus_di': plus_di, 'minus_di': minus_di, 'adx': adx}
+        return self._cached(('dmi', period), compute)
+
+    def highest(self, period: int) -> np.ndarray:
+        """Highest high of the trailing period bars"""
+        return self._cached(('highest', period), lambda: rolling_max(self.high, period))
+
+    def lowest(self, period: int) -> np.ndarray:
+        """Lowest low of the trailing period bars"""
+        return self._cached(('lowest', period), lambda: rolling_min(self.low, period))
+
+    def donchian(self, period: int = 20) -> Dict[str, np.ndarray]:
+        """Donchian channel; shares the rolling extrema with the stochastic of the same period"""
+        def compute():
+            upper = self.highest(period)
+            lower = self.lowest(period)
+            return {'upper': upper, 'middle': (upper + lower) / 2, 'lower': lower}
+        return self._cached(('donchian', period), compute)
+
+    def pivots(self, scale: int) -> Dict[str, np.ndarray]:
+        """
+        Positions of confirmed swing highs/lows: bars whose high (low) is the
+        extreme of the scale bars on each side and strictly beyond the scale
+        bars before it, so a flat top counts once. Built on the same rolling
+        extrema as Donchian and the stochastic; the last scale bars cannot
+        be confirmed yet.
+        """
+        def compute():
+            n = len(self)
+            empty = np.empty(0, dtype=np.int64)
+            if scale < 1 or n < 2 * scale + 1:
+                return {'highs': empty, 'lows': empty}
+            span = 2 * scale + 1
+            highs = self.high[scale:n - scale]
+            lows = self.low[scale:n - scale]
+            is_high = (highs == self.highest(span)[2 * scale:]) & (highs > self.highest(scale)[scale - 1:n - scale - 1])
+            is_low = (lows == self.lowest(span)[2 * scale:]) & (lows < self.lowest(scale)[scale - 1:n - scale - 1])
+            return {'highs': np.flatnonzero(is_high) + scale, 'lows': np.flatnonzero(is_low) + scale}
+        return self._cached(('pivots', scale), compute)
+
+    def stochastic(self, period: int = 14, smooth: int = 3) -> Dict[str, np.ndarray]:
+        def compute():
+            lowest = self.lowest(period)
+            highest = self.highest(period)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                k = 100 * ((self.close - lowest) / (highest - lowest))
+            d = np.full(len(self), np.nan)
+            if len(self) >= period:
+                d[period - 1:] = rolling_mean(k[period - 1:], smooth)
+            return {'k': k, 'd': d}
+        return self._cached(('stochastic', period, smooth), compute)
+
+    def obv(self) -> np.ndarray:
+        """On-balance volume: cumulative volume signed by the close-to-close move, 0 at the first bar"""
+        def compute():
+            out = np.zeros(len(self))
+            np.cumsum(np.sign(self.deltas()) * self.volume[1:], out=out[1:])
+            return out
+        return self._cached('obv', compute)
+
+    def mfi(self, period: int = 14) -> np.ndarray:
+        """
+        Money Flow Index: 100 - 100 / (1 + positive flow / negative flow),
+        flows summed over the trailing period bars from two prefix sums
+        """
+        def compute():
+            out = np.full(len(self), np.nan)
+            typical = self.typical_price()
+            flow = (typical * self.volume)[1:]
+            rising = np.diff(typical)
+            positive = window_sums(prefix_sum(np.where(rising > 0, flow, 0.0)), period)
+            negative = window_sums(prefix_sum(np.where(rising < 0, flow, 0.0)), period)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = 100 - 100 / (1 + positive / negative)
+            out[1:] = np.where(negative == 0, 100.0, values)
+            return out
+        return self._cached(('mfi', period), compute)
+
+    def cci(self, period: int = 20) -> np.ndarray:
+        """
+        Commodity Channel Index: (typical price - its SMA) / (0.015 x mean
+        absolute deviation); the deviation needs each window's own mean, so it
+        is one vectorized O(n x period) pass over a strided window view
+        """
+        def compute():
+            out = np.full(len(self), np.nan)
+            typical = self.typical_price()
+            if len(self) >= period:
+                windows = np.lib.stride_tricks.sliding_window_view(typical, period)
+                mean = windows.mean(axis=1)
+                deviation = np.abs(windows - mean[:, None]).mean(axis=1)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    out[period - 1:] = np.where(deviation == 0, 0.0,
+                                                (typical[period - 1:] - mean) / (0.015 * deviation))
+            return out
+        return self._cached(('cci', period), compute)
+
+    def williams_r(self, period: int = 14) -> np.ndarray:
+        """Williams %R in [-100, 0]; shares the rolling extrema with the stochastic"""
+        def compute():
+            highest = self.highest(period)
+            lowest = self.lowest(period)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return -100 * (highest - self.close) / (highest - lowest)
+        return self._cached(('williams_r', period), compute)
+
+    def keltner(self, period: int = 20, multiplier: float = 2, atr_period: int = 10) -> Dict[str, np.ndarray]:
+        """Keltner channel: EMA(period) of the close +/- multiplier x Wilder ATR(atr_period)"""
+        def compute():
+            middle = self.ema(period)
+            width = self.atr(atr_period) * multiplier
+            return {'upper': middle + width, 'middle': middle, 'lower': middle - width}
+        return self._cached(('keltner', period, multiplier, atr_period), compute)
+
+    def ichimoku(self, tenkan: int = 9, kijun: int = 26, senkou: int = 52) -> Dict[str, np.ndarray]:
+        """
+        Ichimoku lines aligned to the bar they are read at: the senkou spans
+        are the midpoints computed kijun bars earlier (the cloud under the
+        current bar) and the chikou span is the close kijun bars later
+        """
+        def midpoint(period: int) -> np.ndarray:
+            return (self.highest(period) + self.lowest(period)) / 2
+
+        def shift(values: np.ndarray, bars: int) -> np.ndarray:
+            out = np.full(len(values), np.nan)
+            if bars < len(values):
+                if bars >= 0:
+                    out[bars:] = values[:len(values) - bars]
+                else:
+                    out[:bars] = values[-bars:]
+            return out
+
+        def compute():
+            conversion = midpoint(tenkan)
+            base = midpoint(kijun)
+            return {
+                'tenkan': conversion,
+                'kijun': base,
+                'senkou_a': shift((conversion + base) / 2, kijun),
+                'senkou_b': shift(midpoint(senkou), kijun),
+                'chikou': shift(self.close, -kijun)
+            }
+        return self._cached(('ichimoku', tenkan, kijun, senkou), compute)
+
+    def vwap(self, period: int = 20) -> np.ndarray:
+        """Rolling volume-weighted average of the typical price over the trailing period bars"""
+        def compute():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return window_sums(self.money_flow_prefix(), period) / window_sums(self.volume_prefix(), period)
+        return self._cached(('vwap', period), compute)
+
+    def parabolic_sar(self, step: float = 0.02, maximum: float = 0.2) -> Dict[str, np.ndarray]:
+        """
+        Wilder's Parabolic SAR and trend (1 up, -1 down) at every bar
+
+        Each value depends on the previous one through reversals and the
+        acceleration factor, so unlike the rest of the pack this is one
+        sequential pass over plain Python floats (about 0.5 us per bar).
+        """
+        def compute():
+            n = len(self)
+            if n < 2:
+                return {'sar': np.full(n, np.nan), 'trend': np.zeros(n)}
+            high = self.high.tolist()
+            low = self.low.tolist()
+            out = [math.nan] * n
+            directions = [0.0] * n
+
+            rising = self.close[1] >= self.close[0]
+            sar = low[0] if rising else high[0]
+            extreme = high[0] if rising else low[0]
+            factor = step
+            # Highs/lows of the two previous bars bound the SAR (both are bar 0 at t = 1)
+            previous_low = older_low = low[0]
+            previous_high = older_high = high[0]
+            for t in range(1, n):
+                sar += factor * (extreme - sar)
+                bar_high = high[t]
+                bar_low = low[t]
+                if rising:
+                    if sar > previous_low:
+                        sar = previous_low
+                    if sar > older_low:
+                        sar = older_low
+                    if bar_low < sar:
+                        rising, sar, extreme, factor = False, extreme, bar_low, step
+                    elif bar_high > extreme:
+                        extreme = bar_high
+                        factor = min(factor + step, maximum)
+                else:
+                    if sar < previous_high:
+                        sar = previous_high
+                    if sar < older_high:
+                        sar = older_high
+                    if bar_high > sar:
+                        rising, sar, extreme, factor = True, extreme, bar_high, step
+                    elif bar_low < extreme:
+                        extreme = bar_low
+                        factor = min(factor + step, maximum)
+                out[t] = sar
+                directions[t] = 1.0 if rising else -1.0
+                older_low, previous_low = previous_low, bar_low
+                older_high, previous_high = previous_high, bar_high
+            return {'sar': np.array(out), 'trend': np.array(directions)}
+        return self._cached(('parabolic_sar', step, maximum), compute)
+
+    # ------------------------------------------------------------------
+    # Latest-bar values (TechnicalAnalyzer output format)
+    # ------------------------------------------------------------------
+
+    def sma_values(self, periods: List[int] = [20, 50, 200]) -> Dict[str, Optional[float]]:
+        return {
+            f'sma_{period}': round(float(self.sma(period)[-1]), 2) if len(self) >= period else None
+            for period in periods
+        }
+
+    def ema_values(self, periods: List[int] = [12, 26]) -> Dict[str, Optional[float]]:
+        ready = [period for period in periods if len(self) >= period]
+        averages = self.emas(ready) if ready else {}
+        return {
+            f'ema_{period}': round(float(averages[period][-1]), 2) if period in averages else None
+            for period in periods
+        }
+
+    def rsi_value(self, period: int = 14) -> float:
+        if len(self) <= period:
+            return 50.0  # Neutral
+        # Wilder smoothing carries the whole history, so the latest value comes from the series
+        return round(float(self.rsi(period)[-1]), 2)
+
+    def macd_values(self) -> Dict[str, float]:
+        if len(self) < 26:
+            return {'macd': 0, 'signal': 0, 'histogram': 0}
+        macd = self.macd()
+        return {
+            'macd': round(float(macd['macd'][-1]), 3),
+            'signal': round(float(macd['signal'][-1]), 3),
+            'histogram': round(float(macd['histogram'][-1]), 3)
+        }
+
+    def bollinger_values(self, period: int = 20, std_dev: int = 2) -> Dict[str, float]:
+        if len(self) < period:
+            return {'upper': 0, 'middle': 0, 'lower': 0, 'width': 0}
+        # Only the latest band is needed, so the deviation comes from the last window alone
+        middle = float(self.sma(period)[-1])
+        deviation = float(np.std(self.close[-period:], ddof=1)) * std_dev
+        upper = middle + deviation
+        lower = middle - deviation
+        width = upper - lower
+        return {
+            'upper': round(upper, 2),
+            'middle': round(middle, 2),
+            'lower': round(lower, 2),
+            'width': round(width, 2),
+            'percent_b': round(float((self.close[-1] - lower) / width), 3)
+        }
+
+    def stochastic_values(self, period: int = 14, smooth: int = 3) -> Dict[str, float]:
+        if len(self) < period:
+            return {'k': 50, 'd': 50}
+        # %D of the latest bar needs only the last period + smooth - 1 bars
+        tail = slice(max(0, len(self) - (period + smooth - 1)), None)
+        lowest = rolling_min(self.low[tail], period)
+        highest = rolling_max(self.high[tail], period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = 100 * ((self.close[tail] - lowest) / (highest - lowest))
+        return {
+            'k': round(float(k[-1]), 2),
+            'd': round(float(np.mean(k[-smooth:])), 2)
+        }
+
+    def _latest_extreme(self, period: int, maximum: bool) -> float:
+        """Latest N-bar high/low: read from the rolling series if already built, else from the tail"""
+        series = self._memo.get(('highest' if maximum else 'lowest', period))
+        if series is not None:
+            return float(series[-1])
+        return float(self.high[-period:].max() if maximum else self.low[-period:].min())
+
+    def donchian_values(self, period: int = 20) -> Dict[str, float]:
+        if len(self) < period:
+            return {'upper': 0, 'middle': 0, 'lower': 0, 'width': 0}
+        upper = self._latest_extreme(period, maximum=True)
+        lower = self._latest_extreme(period, maximum=False)
+        width = upper - lower
+        return {
+            'upper': round(upper, 2),
+            'middle': round((upper + lower) / 2, 2),
+            'lower': round(lower, 2),
+            'width': round(width, 2),
+            'position': round(float((self.close[-1] - lower) / width), 3) if width else 0.5
+        }
+
+    def extremes_values(self, periods: List[int] = [20, 50, 252]) -> Dict[str, Optional[float]]:
+        """Highest high / lowest low of the last N bars for each period"""
+        values = {}
+        for period in periods:
+            ready = len(self) >= period
+            values[f'high_{period}'] = round(self._latest_extreme(period, True), 2) if ready else None
+            values[f'low_{period}'] = round(self._latest_extreme(period, False), 2) if ready else None
+        return values
+
+    def atr_value(self, period: int = 14) -> float:
+        if len(self) <= period:
+            return 0.0
+        return round(float(self.atr(period)[-1]), 2)
+
+    def volume_values(self) -> Dict[str, Any]:
+        """Volume vs its 20/50-bar averages and the price-volume signal"""
+        n = len(self)
+        current_volume = int(self.volume[-1])
+        if n >= 20:
+            avg_volume_20 = int(self.volume_sma(20)[-1])
+        else:
+            avg_volume_20 = int(self.volume.mean())
+        avg_volume_50 = int(self.volume_sma(50)[-1]) if n >= 50 else avg_volume_20
+
+        volume_ratio = current_volume / avg_volume_20 if avg_volume_20 > 0 else 1
+
+        # Volume trend
+        recent_volumes = self.volume[-5:]
+        volume_trend = "increasing" if recent_volumes[-1] > recent_volumes.mean() else "decreasing"
+
+        # Price-Volume relationship
+        price_change = self.close[-1] - self.close[-2]
+
+        if price_change > 0 and volume_ratio > 1.2:
+            signal = "bullish_strong"
+            interpretation = "Price up on high volume - Strong bullish signal"
+        elif price_change > 0 and volume_ratio < 0.8:
+            signal = "bullish_weak"
+            interpretation = "Price up on low volume - Weak bullish signal"
+        elif price_change < 0 and volume_ratio > 1.2:
+            signal = "bearish_strong"
+            interpretation = "Price down on high volume - Strong bearish signal"
+        elif price_change < 0 and volume_ratio < 0.8:
+            signal = "bearish_weak"
+            interpretation = "Price down on low volume - Weak bearish signal"
+        else:
+            signal = "neutral"
+            interpretation = "Normal volume activity"
+
+        return {
+            'current': current_volume,
+            'avg_20': avg_volume_20,
+            'avg_50': avg_volume_50,
+            'ratio': round(volume_ratio, 2),
+            'trend': volume_trend,
+            'signal': signal,
+            'interpretation': interpretation
+        }
+
+    def support_resistance_values(self, lookback: int = 20) -> Dict[str, List[float]]:
+        """Local highs/lows of the lookback window plus classic pivot levels"""
+        if len(self) < lookback:
+            return {'support': [], 'resistance': []}
+
+        highs = self.high[-lookback:]
+        lows = self.low[-lookback:]
+        inner_highs = highs[1:-1]
+        inner_lows = lows[1:-1]
+        peaks = inner_highs[(inner_highs > highs[:-2]) & (inner_highs > highs[2:])]
+        troughs = inner_lows[(inner_lows < lows[:-2]) & (inner_lows < lows[2:])]
+
+        last_high = float(self.high[-1])
+        last_low = float(self.low[-1])
+        last_close = float(self.close[-1])
+
+        pivot = (last_high + last_low + last_close) / 3
+        r1 = (2 * pivot) - last_low
+        r2 = pivot + (last_high - last_low)
+        s1 = (2 * pivot) - last_high
+        s2 = pivot - (last_high - last_low)
+
+        resistance_levels = [float(h) for h in peaks] + [r1, r2]
+        support_levels = [float(l) for l in troughs] + [s1, s2]
+
+        return {
+            'support': sorted(set(round(s, 2) for s in support_levels), reverse=True)[:3],
+            'resistance': sorted(set(round(r, 2) for r in resistance_levels))[-3:],
+            'pivot': round(pivot, 2)
+        }
+
+    def trend_value(self, sma_data: Dict[str, Optional[float]]) -> str:
+        """Trend label from SMA alignment, 10-bar price action and higher highs/lows"""
+        current_price = float(self.close[-1])
+
+        sma_20 = sma_data.get('sma_20', current_price)
+        sma_50 = sma_data.get('sma_50', current_price)
+        sma_200 = sma_data.get('sma_200', current_price)
+
+        start = max(0, len(self) - 10)
+        price_trend_up = self.close[-1] > self.close[start]
+        higher_highs = self.high[-1] > self.high[start]
+        higher_lows = self.low[-1] > self.low[start]
+
+        bullish_signals = 0
+        if sma_20 and current_price > sma_20:
+            bullish_signals += 1
+        if sma_50 and current_price > sma_50:
+            bullish_signals += 1
+        if sma_200 and current_price > sma_200:
+            bullish_signals += 1
+        if price_trend_up:
+            bullish_signals += 1
+        if higher_highs and higher_lows:
+            bullish_signals += 2
+
+        if bullish_signals >= 4:
+            return "strong_uptrend"
+        elif bullish_signals >= 2:
+            return "uptrend"
+        elif bullish_signals >= 1:
+            return "neutral"
+        else:
+            return "downtrend"
+
+    def volatility_value(self, period: int = 20) -> float:
+        """Annualized standard deviation of the last period returns, in percent"""
+        if len(self) < period:
+            return 0.0
+        closes = self.close[-(period + 1):]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = closes[1:] / closes[:-1] - 1.0
+        volatility = np.std(returns, ddof=1) * np.sqrt(252)
+        return round(float(volatility * 100), 2)
+
+    def adx_values(self, period: int = 14) -> Dict[str, Any]:
+        """ADX with +DI / -DI; ADX needs 2 x period bars"""
+        if len(self) < 2 * period:
+            return {'adx': 0, 'plus_di': 0, 'minus_di': 0, 'trend_strength': 'weak', 'direction': 'neutral'}
+        dmi = self.dmi(period)
+        adx = float(dmi['adx'][-1])
+        plus_di = float(dmi['plus_di'][-1])
+        minus_di = float(dmi['minus_di'][-1])
+        return {
+            'adx': round(adx, 2),
+            'plus_di': round(plus_di, 2),
+            'minus_di': round(minus_di, 2),
+            'trend_strength': 'strong' if adx >= 25 else 'moderate' if adx >= 20 else 'weak',
+            'direction': 'bullish' if plus_di > minus_di else 'bearish' if minus_di > plus_di else 'neutral'
+        }
+
+    def obv_values(self, period: int = 20) -> Dict[str, Any]:
+        """Latest OBV and whether it sits above its period-bar average"""
+        obv = self.obv()
+        current = float(obv[-1])
+        if len(self) < period:
+            return {'obv': int(current), 'trend': 'neutral'}
+        average = float(obv[-period:].mean())
+        return {
+            'obv': int(current),
+            'trend': 'rising' if current > average else 'falling' if current < average else 'neutral'
+        }
+
+    def mfi_value(self, period: int = 14) -> float:
+        if len(self) <= period:
+            return 50.0  # Neutral
+        # The latest value needs only the last period flows
+        typical = self.typical_price()[-(period + 1):]
+        flow = typical[1:] * self.volume[-period:]
+        rising = np.diff(typical)
+        positive = float(flow[rising > 0].sum())
+        negative = float(flow[rising < 0].sum())
+        if negative == 0:
+            return 100.0
+        return round(100 - 100 / (1 + positive / negative), 2)
+
+    def cci_value(self, period: int = 20) -> float:
+        if len(self) < period:
+            return 0.0
+        # The latest value needs only the last window
+        typical = self.typical_price()[-period:]
+        mean = typical.mean()
+        deviation = np.abs(typical - mean).mean()
+        return round(float((typical[-1] - mean) / (0.015 * deviation)), 2) if deviation else 0.0
+
+    def williams_r_value(self, period: int = 14) -> float:
+        if len(self) < period:
+            return -50.0  # Neutral
+        highest = self._latest_extreme(period, maximum=True)
+        lowest = self._latest_extreme(period, maximum=False)
+        if highest == lowest:
+            return -50.0
+        return round(float(-100 * (highest - self.close[-1]) / (highest - lowest)), 2)
+
+    def keltner_values(self, period: int = 20, multiplier: float = 2, atr_period: int = 10) -> Dict[str, float]:
+        if len(self) < period or len(self) <= atr_period:
+            return {'upper': 0, 'middle': 0, 'lower': 0, 'width': 0}
+        channel = self.keltner(period, multiplier, atr_period)
+        upper, middle, lower = (float(channel[key][-1]) for key in ('upper', 'middle', 'lower'))
+        width = upper - lower
+        return {
+            'upper': round(upper, 2),
+            'middle': round(middle, 2),
+            'lower': round(lower, 2),
+            'width': round(width, 2),
+            'position': round(float((self.close[-1] - lower) / width), 3) if width else 0.5
+        }
+
+    def ichimoku_values(self, tenkan: int = 9, kijun: int = 26, senkou: int = 52) -> Dict[str, Any]:
+        """Latest conversion/base lines and the cloud under the current bar (None until warmed up)"""
+        n = len(self)
+
+        def midpoint(period: int, end: int) -> Optional[float]:
+            # Midpoint of the period bars ending at bar end - 1, from the tail alone
+            if end < period:
+                return None
+            return (float(self.high[end - period:end].max()) + float(self.low[end - period:end].min())) / 2
+
+        conversion = midpoint(tenkan, n)
+        base = midpoint(kijun, n)
+        # The cloud under the current bar was projected kijun bars ago
+        past_conversion = midpoint(tenkan, n - kijun)
+        past_base = midpoint(kijun, n - kijun)
+        span_a = (past_conversion + past_base) / 2 if past_base is not None else None
+        span_b = midpoint(senkou, n - kijun)
+
+        price = float(self.close[-1])
+        if span_a is None or span_b is None:
+            cloud = None
+        elif price > max(span_a, span_b):
+            cloud = 'above'
+        elif price < min(span_a, span_b):
+            cloud = 'below'
+        else:
+            cloud = 'inside'
+        return {
+            'tenkan': round(conversion, 2) if conversion is not None else None,
+            'kijun': round(base, 2) if base is not None else None,
+            'senkou_a': round(span_a, 2) if span_a is not None else None,
+            'senkou_b': round(span_b, 2) if span_b is not None else None,
+            'cloud': cloud
+        }
+
+    def vwap_values(self, period: int = 20) -> Dict[str, Optional[float]]:
+        """Rolling period-bar VWAP and the close's distance from it in percent"""
+        if len(self) < period:
+            return {'vwap': None, 'distance_percent': None}
+        # The latest value needs only the last window
+        volume = self.volume[-period:]
+        total = float(volume.sum())
+        if total == 0:
+            return {'vwap': None, 'distance_percent': None}
+        vwap = float(np.dot(self.typical_price()[-period:], volume) / total)
+        return {
+            'vwap': round(vwap, 2),
+            'distance_percent': round((float(self.close[-1]) / vwap - 1) * 100, 2)
+        }
+
+    def parabolic_sar_values(self) -> Dict[str, Any]:
+        if len(self) < 2:
+            return {'sar': None, 'trend': 'neutral'}
+        sar = self.parabolic_sar()
+        return {
+            'sar': round(float(sar['sar'][-1]), 2),
+            'trend': 'up' if sar['trend'][-1] > 0 else 'down'
+        }
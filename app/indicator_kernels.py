@@ -0,0 +1,319 @@
+"""
+Indicator Kernels Module
+NumPy building blocks shared by the indicator engine
+
+All kernels take contiguous float64 arrays of finite values and return arrays
+of the same length, with NaN where a window is not yet full (pandas'
+rolling(window).<agg>() convention).
+"""
+import math
+from collections import deque
+from typing import Any, Dict
+
+import numpy as np
+
+
+def as_float_array(values) -> np.ndarray:
+    """Contiguous float64 copy-free view of a column where possible"""
+    return np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+
+
+def prefix_sum(values: np.ndarray, shift: float = 0.0) -> np.ndarray:
+    """Cumulative sum with a leading zero, so sum(values[i:j]) = p[j] - p[i]"""
+    out = np.empty(len(values) + 1, dtype=np.float64)
+    out[0] = 0.0
+    np.cumsum(values - shift if shift else values, out=out[1:])
+    return out
+
+
+def window_sums(prefix: np.ndarray, window: int) -> np.ndarray:
+    """Rolling window sums from a prefix-sum array, NaN until the window is full"""
+    n = len(prefix) - 1
+    out = np.full(n, np.nan)
+    if 0 < window <= n:
+        out[window - 1:] = prefix[window:] - prefix[:-window]
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int, prefix: np.ndarray = None) -> np.ndarray:
+    """Simple moving average; pass a precomputed prefix sum to share it between windows"""
+    if prefix is None:
+        prefix = prefix_sum(values)
+    return window_sums(prefix, window) / window
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """
+    Rolling standard deviation from window sums of values and squares
+
+    The outputs are cut into blocks of a few windows; each block's sums come
+    from prefix sums over its own segment of the input, centred on that
+    segment's mean. Rounding then scales with the local spread of a block
+    rather than with the whole history, where one global prefix sum cancels
+    badly on long trending series.
+    """
+    n = len(values)
+    if window <= ddof or window > n:
+        return np.full(n, np.nan)
+    block = max(4 * window, 32)
+    outputs = n - window + 1
+    blocks = -(-outputs // block)
+    # Segment k holds values[k * block : k * block + block + window - 1]; pad the tail with the last value
+    padded = np.empty(blocks * block + window - 1)
+    padded[:n] = values
+    padded[n:] = values[-1]
+    segments = np.lib.stride_tricks.sliding_window_view(padded, block + window - 1)[::block]
+    centred = segments - segments.mean(axis=1, keepdims=True)
+
+    prefix = np.zeros((blocks, block + window))
+    np.cumsum(centred, axis=1, out=prefix[:, 1:])
+    sums = prefix[:, window:] - prefix[:, :-window]
+    np.cumsum(centred * centred, axis=1, out=prefix[:, 1:])
+    squares = prefix[:, window:] - prefix[:, :-window]
+
+    out = np.full(n, np.nan)
+    variance = (squares - sums * sums / window) / (window - ddof)
+    out[window - 1:] = np.sqrt(np.maximum(variance, 0.0)).ravel()[:outputs]
+    return out
+
+
+# Largest factor a block may scale its first value by in recursive_filter;
+# bounds the rounding error of the closed form to about this many ulps
+_BLOCK_AMPLIFICATION = 1e3
+
+
+def _filter_one(values: np.ndarray, decay: float, initial: float) -> np.ndarray:
+    """recursive_filter for one decay in 0 < decay < 1 (see below)"""
+    n = len(values)
+    size = int(min(n, 1 + math.floor(math.log(_BLOCK_AMPLIFICATION) / -math.log(decay))))
+    blocks = -(-n // size)
+    padded = np.zeros(blocks * size)
+    padded[:n] = values
+
+    # Within a block starting from zero, y[j] = d^j * sum_{i<=j} (1-d) d^-i x[i]:
+    # one cumulative sum along each row of the (blocks x size) view, in place
+    steps = np.arange(size, dtype=np.float64)
+    grid = padded.reshape(blocks, size)
+    grid *= (1 - decay) * decay ** -steps
+    np.cumsum(grid, axis=1, out=grid)
+    grid *= decay ** steps
+
+    # Each block ends at its own last value plus decay^size times the previous
+    # block's end; decay^size < 1 / amplification, so that carry recursion is
+    # resolved with a handful of shifted adds
+    carry_decay = decay ** size
+    local_ends = grid[:, -1].copy()
+    ends = local_ends.copy()
+    factor, shift = carry_decay, 1
+    while shift < blocks and factor > 1e-18:
+        ends[shift:] += factor * local_ends[:-shift]
+        factor *= carry_decay
+        shift += 1
+    ends += carry_decay ** np.arange(1, blocks + 1) * initial
+
+    starts = np.empty(blocks)
+    starts[0] = initial
+    starts[1:] = ends[:-1]
+    grid += starts[:, None] * decay ** (steps + 1)
+    return padded[:n]
+
+
+def recursive_filter(values: np.ndarray, decays, initial=None) -> np.ndarray:
+    """
+    First-order recursion y[t] = d * y[t-1] + (1 - d) * x[t] for one decay d
+    or several at once, evaluated without a Python-level loop over bars
+
+    The series is cut into blocks short enough that the closed form of the
+    recursion inside a block is one scaled cumulative sum; the blocks are
+    then chained by their end values. initial is y[-1] (defaults to x[0], so
+    y[0] = x[0] as in pandas ewm(adjust=False)), either a scalar or one per
+    decay. A scalar decay returns an array shaped like values, a sequence of
+    decays a (len(decays), n) array. Unlike pandas ewm, NaN is not skipped:
+    every output from the first NaN on is NaN, so callers drop gaps first.
+    """
+    values = as_float_array(values)
+    scalar = np.ndim(decays) == 0
+    decays = np.atleast_1d(np.asarray(decays, dtype=np.float64))
+    n = len(values)
+    out = np.empty((len(decays), n))
+    if n:
+        if initial is None:
+            initial = values[0]
+        initials = np.broadcast_to(np.asarray(initial, dtype=np.float64), decays.shape)
+        for row, (decay, start) in enumerate(zip(decays, initials)):
+            if not 0 <= decay < 1:
+                raise ValueError(f"decay must be in [0, 1), got {decay}")
+            out[row] = values if decay == 0 else _filter_one(values, float(decay), float(start))
+    return out[0] if scalar else out
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average with alpha = 2 / (span + 1), seeded with the
+    first value (pandas ewm(span, adjust=False))
+    """
+    return recursive_filter(values, 1 - 2 / (span + 1))
+
+
+def emas(values: np.ndarray, spans) -> np.ndarray:
+    """EMAs of several spans in one call, shaped (len(spans), n)"""
+    return recursive_filter(values, [1 - 2 / (span + 1) for span in spans])
+
+
+def wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder smoothing (alpha = 1 / period): NaN for the first period - 1
+    values, the simple mean of the first period values, then
+    y[t] = (y[t-1] * (period - 1) + x[t]) / period
+    """
+    if period < 1:
+        raise ValueError(f"period must be at least 1, got {period}")
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n >= period:
+        seed = float(np.mean(values[:period]))
+        out[period - 1] = seed
+        out[period:] = recursive_filter(values[period:], 1 - 1 / period, seed)
+    return out
+
+
+def wilders(values: np.ndarray, periods) -> np.ndarray:
+    """
+    Wilder averages of several periods, shaped (len(periods), n), from one
+    batched recursive_filter call over the whole series. Each row starts
+    from the y[-1] that makes the recursion land on the simple-mean seed at
+    period - 1 (y[period - 1] = d^period * y[-1] + the zero-start filter of
+    the first period values), so the rows match wilder() up to rounding.
+    """
+    values = as_float_array(values)
+    periods = list(periods)
+    if any(period < 1 for period in periods):
+        raise ValueError(f"periods must be at least 1, got {periods}")
+    decays = np.array([1 - 1 / period for period in periods])
+    initials = np.zeros(len(periods))
+    for row, (decay, period) in enumerate(zip(decays, periods)):
+        if decay and len(values) >= period:
+            head = values[:period]
+            zero_start = (1 - decay) * np.dot(decay ** np.arange(period - 1, -1, -1), head)
+            initials[row] = (float(np.mean(head)) - zero_start) / decay ** period
+    out = recursive_filter(values, decays, initials)
+    for row, period in enumerate(periods):
+        out[row, :period - 1] = np.nan
+    return out
+
+
+def _rolling_extremum(values: np.ndarray, window: int, combine: np.ufunc) -> np.ndarray:
+    """
+    van Herk / Gil-Werman rolling extremum in O(n) regardless of the window
+
+    The series is cut into blocks of `window` values; a window ending at i
+    spans the tail of one block and the head of the next, so its extremum is
+    combine(suffix extremum at i - window + 1, prefix extremum at i). Both are
+    a single combine.accumulate over the (blocks x window) view. NaN inside a
+    window propagates, as in pandas rolling(window).max()/min().
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+    n = len(values)
+    out = np.full(n, np.nan)
+    if window > n:
+        return out
+    if window == 1:
+        out[:] = values
+        return out
+
+    blocks = -(-n // window)
+    padded = np.empty(blocks * window)
+    padded[:n] = values
+    padded[n:] = values[-1]  # never read: no full window reaches into the padding
+    grid = padded.reshape(blocks, window)
+    prefix = combine.accumulate(grid, axis=1).ravel()
+    suffix = combine.accumulate(grid[:, ::-1], axis=1)[:, ::-1].ravel()
+    combine(suffix[:n - window + 1], prefix[window - 1:n], out=out[window - 1:])
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum, NaN until the window is full"""
+    return _rolling_extremum(values, window, np.maximum)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum, NaN until the window is full"""
+    return _rolling_extremum(values, window, np.minimum)
+
+
+class RollingExtremum:
+    """
+    Incremental rolling max (or min) of the last `size` values via a
+    monotonic deque: amortized O(1) per appended value
+
+    Feed one value at a time with append() or a chunk with extend(); the
+    latter returns the extremum after each value, so streaming a series in
+    chunks yields the same values as rolling_max / rolling_min once the
+    window is full.
+    """
+
+    def __init__(self, size: int, maximum: bool = True):
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        self.size = size
+        self.maximum = maximum
+        self.values = deque(maxlen=size)
+        self._candidates = deque()  # (position, value), best first
+        self._position = -1
+
+    def _dominates(self, a: float, b: float) -> bool:
+        return a >= b if self.maximum else a <= b
+
+    def _push(self, position: int, value: float):
+        while self._candidates and self._dominates(value, self._candidates[-1][1]):
+            self._candidates.pop()
+        self._candidates.append((position, value))
+        while self._candidates[0][0] <= position - self.size:
+            self._candidates.popleft()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def append(self, value: float):
+        self._position += 1
+        self.values.append(value)
+        self._push(self._position, value)
+
+    def extend(self, values) -> np.ndarray:
+        """Append every value; returns the extremum after each one (NaN while the window fills)"""
+        out = np.empty(len(values))
+        for i, value in enumerate(values):
+            self.append(float(value))
+            out[i] = self._candidates[0][1] if len(self.values) == self.size else np.nan
+        return out
+
+    def revise(self, value: float):
+        """Replace the latest value; dropped candidates cannot be recovered, so rebuild (O(size))"""
+        self.values[-1] = value
+        self._rebuild()
+
+    def _rebuild(self):
+        self._candidates.clear()
+        first = self._position - len(self.values) + 1
+        for offset, value in enumerate(self.values):
+            self._push(first + offset, value)
+
+    def value(self) -> float:
+        return self._candidates[0][1] if self._candidates else math.nan
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'size': self.size, 'maximum': self.maximum, 'values': list(self.values),
+                'position': self._position}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RollingExtremum':
+        extremum = cls(data['size'], data['maximum'])
+        extremum.values.extend(data['values'])
+        extremum._position = data['position']
+        extremum._rebuild()
+        return extremum
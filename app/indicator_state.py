@@ -0,0 +1,440 @@
+"""
+Indicator State Module
+Incremental, constant-time-per-bar indicator updates for live bars
+"""
+import json
+import math
+import os
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.indicator_engine import IndicatorEngine
+from app.indicator_kernels import RollingExtremum, wilder
+
+
+class _Window:
+    """Last `size` values with running sum and sum of squares"""
+
+    def __init__(self, size: int, shift: float = 0.0):
+        self.size = size
+        # Values are stored relative to shift to keep the squares well conditioned
+        self.shift = shift
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.squares = 0.0
+        self._updates = 0
+
+    def append(self, value: float):
+        value -= self.shift
+        if len(self.values) == self.size:
+            evicted = self.values[0]
+            self.total -= evicted
+            self.squares -= evicted * evicted
+        self.values.append(value)
+        self.total += value
+        self.squares += value * value
+        self._updates += 1
+        if self._updates >= self.size:
+            self._resum()
+
+    def revise(self, value: float):
+        value -= self.shift
+        old = self.values[-1]
+        self.values[-1] = value
+        self.total += value - old
+        self.squares += value * value - old * old
+
+    def _resum(self):
+        """Recompute the sums from the window every `size` updates, so rounding error cannot build up"""
+        self.total = math.fsum(self.values)
+        self.squares = math.fsum(v * v for v in self.values)
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def mean(self) -> float:
+        return self.total / len(self.values) + self.shift if self.values else math.nan
+
+    def std(self, ddof: int = 1) -> float:
+        n = len(self.values)
+        if n <= ddof:
+            return math.nan
+        variance = (self.squares - self.total * self.total / n) / (n - ddof)
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'size': self.size, 'shift': self.shift, 'values': list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_Window':
+        window = cls(data['size'], data.get('shift', 0.0))
+        window.values.extend(data['values'])
+        window._resum()
+        return window
+
+
+class _Ema:
+    """EMA with alpha = 2 / (span + 1), seeded with the first value (pandas adjust=False)"""
+
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2.0 / (span + 1)
+        self.value = math.nan
+        self.previous = math.nan
+        self.count = 0
+
+    def _step(self, previous: float, value: float) -> float:
+        return value if math.isnan(previous) else (1 - self.alpha) * previous + self.alpha * value
+
+    def append(self, value: float):
+        self.previous = self.value
+        self.value = self._step(self.previous, value)
+        self.count += 1
+
+    def revise(self, value: float):
+        self.value = self._step(self.previous, value)
+
+    def seed(self, previous: float, count: int):
+        """Start from a known EMA value of the bar before the next one appended"""
+        self.value = previous
+        self.count = count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'span': self.span, 'value': self.value, 'previous': self.previous, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_Ema':
+        ema = cls(data['span'])
+        ema.value = data['value']
+        ema.previous = data['previous']
+        ema.count = data['count']
+        return ema
+
+
+class _Wilder:
+    """
+    Wilder average with alpha = 1 / period: the running mean until period
+    values are in (the seed), then y = y_prev + (x - y_prev) / period
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.value = math.nan
+        self.previous = math.nan
+        self.count = 0
+
+    def _step(self, previous: float, value: float, count: int) -> float:
+        return value if count == 1 else previous + (value - previous) / min(count, self.period)
+
+    def append(self, value: float):
+        self.previous = self.value
+        self.count += 1
+        self.value = self._step(self.previous, value, self.count)
+
+    def revise(self, value: float):
+        self.value = self._step(self.previous, value, self.count)
+
+    def seed(self, value: float, count: int):
+        """Start from a known average of the first count values"""
+        self.value = value
+        self.count = count
+
+    def ready(self) -> bool:
+        return self.count >= self.period
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'period': self.period, 'value': self.value, 'previous': self.previous, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_Wilder':
+        average = cls(data['period'])
+        average.value = data['value']
+        average.previous = data['previous']
+        average.count = data['count']
+        return average
+
+
+class IndicatorState:
+    """
+    Running indicator state for one symbol and interval
+
+    Appending a bar or revising the last (still forming) bar updates SMA(20/50/200),
+    EMA(12/26), RSI(14), MACD(12/26/9), Bollinger(20, 2), Stochastic(14, 3),
+    ATR(14) and volume averages in time independent of the history length
+    (RSI and ATR are Wilder-smoothed, as in IndicatorEngine).
+    values() returns the same latest-bar figures IndicatorEngine computes from
+    the full frame. State round-trips through to_dict/from_dict (JSON-safe).
+    """
+
+    SMA_PERIODS = (20, 50, 200)
+    EMA_SPANS = (12, 26)
+    RSI_PERIOD = 14
+    BOLLINGER_PERIOD = 20
+    STOCHASTIC_PERIOD = 14
+    STOCHASTIC_SMOOTH = 3
+    ATR_PERIOD = 14
+    VOLUME_PERIODS = (20, 50)
+    FORMAT_VERSION = 2
+
+    # Longest lookback any indicator needs, plus one previous close
+    WARMUP_BARS = max(SMA_PERIODS) + 1
+
+    def __init__(self, symbol: Optional[str] = None, interval: Optional[str] = None, shift: float = 0.0,
+                 source: Optional[str] = None):
+        self.symbol = symbol
+        self.interval = interval
+        # Fingerprint of the inputs that fix the price basis (e.g. split/dividend files); set by the loader
+        self.source = source
+        self.bars = 0
+        self.last_timestamp: Optional[str] = None
+        self.last_bar: Optional[Dict[str, float]] = None
+        self.prev_close = math.nan
+
+        self.closes = {period: _Window(period, shift) for period in self.SMA_PERIODS}
+        self.emas = {span: _Ema(span) for span in self.EMA_SPANS}
+        self.macd_signal = _Ema(9)
+        self.gains = _Wilder(self.RSI_PERIOD)
+        self.losses = _Wilder(self.RSI_PERIOD)
+        self.true_ranges = _Wilder(self.ATR_PERIOD)
+        self.highs = RollingExtremum(self.STOCHASTIC_PERIOD, maximum=True)
+        self.lows = RollingExtremum(self.STOCHASTIC_PERIOD, maximum=False)
+        self.stochastic_k = _Window(self.STOCHASTIC_SMOOTH)
+        self.volumes = {period: _Window(period) for period in self.VOLUME_PERIODS}
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update(self, timestamp, open: float, high: float, low: float, close: float, volume: float):
+        """Append a new bar, or revise the last one when the timestamp is unchanged"""
+        stamp = str(pd.Timestamp(timestamp))
+        if self.last_timestamp is not None:
+            if stamp == self.last_timestamp:
+                return self.revise(open, high, low, close, volume)
+            if pd.Timestamp(stamp) < pd.Timestamp(self.last_timestamp):
+                raise ValueError(f"Bar {stamp} is older than the last bar {self.last_timestamp}")
+        self.append(open, high, low, close, volume, timestamp=stamp)
+
+    def append(self, open: float, high: float, low: float, close: float, volume: float, timestamp=None):
+        """Add a completed or newly opened bar"""
+        if self.last_bar is not None:
+            self.prev_close = self.last_bar['close']
+        self.bars += 1
+        self.last_timestamp = str(pd.Timestamp(timestamp)) if timestamp is not None else None
+        self.last_bar = {'open': float(open), 'high': float(high), 'low': float(low),
+                         'close': float(close), 'volume': float(volume)}
+        self._apply(self.last_bar, revise=False)
+
+    def revise(self, open: float, high: float, low: float, close: float, volume: float):
+        """Replace the last bar (e.g. a 5-minute bar that is still forming)"""
+        if self.last_bar is None:
+            raise ValueError("No bar to revise")
+        self.last_bar = {'open': float(open), 'high': float(high), 'low': float(low),
+                         'close': float(close), 'volume': float(volume)}
+        self._apply(self.last_bar, revise=True)
+
+    def _apply(self, bar: Dict[str, float], revise: bool):
+        def push(structure, value):
+            structure.revise(value) if revise else structure.append(value)
+
+        close = bar['close']
+        for window in self.closes.values():
+            push(window, close)
+        for ema in self.emas.values():
+            push(ema, close)
+        push(self.macd_signal, self.emas[12].value - self.emas[26].value)
+        for window in self.volumes.values():
+            push(window, bar['volume'])
+
+        has_previous = not math.isnan(self.prev_close)
+        if has_previous:
+            delta = close - self.prev_close
+            push(self.gains, delta if delta > 0 else 0.0)
+            push(self.losses, -delta if delta < 0 else 0.0)
+            push(self.true_ranges, max(bar['high'] - bar['low'],
+                                       abs(bar['high'] - self.prev_close), abs(bar['low'] - self.prev_close)))
+
+        push(self.highs, bar['high'])
+        push(self.lows, bar['low'])
+        if self.bars >= self.STOCHASTIC_PERIOD:
+            lowest, highest = self.lows.value(), self.highs.value()
+            k = 100 * (close - lowest) / (highest - lowest) if highest != lowest else math.nan
+            push(self.stochastic_k, k)
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def values(self) -> Dict[str, Any]:
+        """Latest-bar indicators in the TechnicalAnalyzer result format"""
+        if self.last_bar is None:
+            return {}
+        close = self.last_bar['close']
+        result = {
+            'current_price': close,
+            'bars': self.bars,
+            'timestamp': self.last_timestamp,
+            'sma': {f'sma_{p}': round(self.closes[p].mean(), 2) if self.bars >= p else None
+                    for p in self.SMA_PERIODS},
+            'ema': {f'ema_{s}': round(self.emas[s].value, 2) if self.bars >= s else None
+                    for s in self.EMA_SPANS},
+            'rsi': self._rsi(),
+            'macd': self._macd(),
+            'bollinger_bands': self._bollinger(),
+            'stochastic': self._stochastic(),
+            'atr': round(self.true_ranges.value, 2) if self.true_ranges.ready() else 0.0,
+            'volume': self._volume()
+        }
+        if not math.isnan(self.prev_close):
+            change = close - self.prev_close
+            result['price_change'] = round(change, 2)
+            result['price_change_percent'] = round(change / self.prev_close * 100, 2)
+        return result
+
+    def _rsi(self) -> float:
+        if not self.gains.ready():
+            return 50.0  # Neutral
+        if self.losses.value == 0:
+            return 100.0
+        rs = self.gains.value / self.losses.value
+        return round(100 - (100 / (1 + rs)), 2)
+
+    def _macd(self) -> Dict[str, float]:
+        if self.bars < 26:
+            return {'macd': 0, 'signal': 0, 'histogram': 0}
+        line = self.emas[12].value - self.emas[26].value
+        signal = self.macd_signal.value
+        return {'macd': round(line, 3), 'signal': round(signal, 3), 'histogram': round(line - signal, 3)}
+
+    def _bollinger(self, std_dev: int = 2) -> Dict[str, float]:
+        window = self.closes[self.BOLLINGER_PERIOD]
+        if self.bars < self.BOLLINGER_PERIOD:
+            return {'upper': 0, 'middle': 0, 'lower': 0, 'width': 0}
+        middle = window.mean()
+        deviation = window.std() * std_dev
+        upper, lower = middle + deviation, middle - deviation
+        width = upper - lower
+        return {
+            'upper': round(upper, 2),
+            'middle': round(middle, 2),
+            'lower': round(lower, 2),
+            'width': round(width, 2),
+            'percent_b': round((self.last_bar['close'] - lower) / width, 3) if width else math.nan
+        }
+
+    def _stochastic(self) -> Dict[str, float]:
+        if self.bars < self.STOCHASTIC_PERIOD:
+            return {'k': 50, 'd': 50}
+        k = self.stochastic_k.values[-1]
+        d = self.stochastic_k.mean() if self.stochastic_k.full() else math.nan
+        return {'k': round(k, 2), 'd': round(d, 2)}
+
+    def _volume(self) -> Dict[str, int]:
+        avg_20 = int(self.volumes[20].mean())
+        avg_50 = int(self.volumes[50].mean()) if self.bars >= 50 else avg_20
+        return {'current': int(self.last_bar['volume']), 'avg_20': avg_20, 'avg_50': avg_50}
+
+    # ------------------------------------------------------------------
+    # Construction and persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, symbol: Optional[str] = None,
+                   interval: Optional[str] = None, source: Optional[str] = None) -> 'IndicatorState':
+        """
+        Build the state from history: EMAs and Wilder averages are seeded from
+        one vectorized IndicatorEngine pass, then only the last WARMUP_BARS
+        bars are replayed
+        """
+        n = len(df)
+        start = max(0, n - cls.WARMUP_BARS)
+        close = df['close'].to_numpy(dtype=np.float64)
+        state = cls(symbol, interval, shift=float(close[start]) if n else 0.0, source=source)
+
+        if start > 0:
+            engine = IndicatorEngine(df.iloc[:start])
+            for span, ema in state.emas.items():
+                ema.seed(float(engine.ema(span)[-1]), start)
+            state.macd_signal.seed(float(engine.macd()['signal'][-1]), start)
+            true_ranges = engine.true_range()[1:]
+            for average, values in ((state.gains, engine.gains()), (state.losses, engine.losses()),
+                                    (state.true_ranges, true_ranges)):
+                if len(values):
+                    latest = wilder(values, average.period)[-1] if len(values) >= average.period else values.mean()
+                    average.seed(float(latest), len(values))
+            state.bars = start
+            state.last_bar = {'close': float(close[start - 1])}
+
+        open_, high, low = (df[c].to_numpy(dtype=np.float64) for c in ('open', 'high', 'low'))
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        for i in range(start, n):
+            state.append(open_[i], high[i], low[i], close[i], volume[i], timestamp=df.index[i])
+        return state
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': self.FORMAT_VERSION,
+            'symbol': self.symbol,
+            'interval': self.interval,
+            'source': self.source,
+            'bars': self.bars,
+            'last_timestamp': self.last_timestamp,
+            'last_bar': self.last_bar,
+            'prev_close': None if math.isnan(self.prev_close) else self.prev_close,
+            'closes': {str(p): w.to_dict() for p, w in self.closes.items()},
+            'emas': {str(s): e.to_dict() for s, e in self.emas.items()},
+            'macd_signal': self.macd_signal.to_dict(),
+            'gains': self.gains.to_dict(),
+            'losses': self.losses.to_dict(),
+            'true_ranges': self.true_ranges.to_dict(),
+            'highs': self.highs.to_dict(),
+            'lows': self.lows.to_dict(),
+            'stochastic_k': self.stochastic_k.to_dict(),
+            'volumes': {str(p): w.to_dict() for p, w in self.volumes.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'IndicatorState':
+        if data.get('version') != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported indicator state version {data.get('version')}")
+        state = cls(data.get('symbol'), data.get('interval'), source=data.get('source'))
+        state.bars = data['bars']
+        state.last_timestamp = data.get('last_timestamp')
+        state.last_bar = data.get('last_bar')
+        state.prev_close = math.nan if data.get('prev_close') is None else data['prev_close']
+        state.closes = {int(p): _Window.from_dict(w) for p, w in data['closes'].items()}
+        state.emas = {int(s): _Ema.from_dict(e) for s, e in data['emas'].items()}
+        state.macd_signal = _Ema.from_dict(data['macd_signal'])
+        state.gains = _Wilder.from_dict(data['gains'])
+        state.losses = _Wilder.from_dict(data['losses'])
+        state.true_ranges = _Wilder.from_dict(data['true_ranges'])
+        state.highs = RollingExtremum.from_dict(data['highs'])
+        state.lows = RollingExtremum.from_dict(data['lows'])
+        state.stochastic_k = _Window.from_dict(data['stochastic_k'])
+        state.volumes = {int(p): _Window.from_dict(w) for p, w in data['volumes'].items()}
+        return state
+
+    def save(self, path: str):
+        """Write the state as JSON (atomically replaced)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['IndicatorState']:
+        """Restore a saved state, None if missing or unreadable"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading indicator state {path}: {str(e)}")
+            return None
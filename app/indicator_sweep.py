@@ -0,0 +1,153 @@
+"""
+Indicator Sweep Module
+One indicator over a grid of parameters as a (parameter sets x bars) matrix
+"""
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from app.indicator_engine import IndicatorEngine
+from app.indicator_kernels import ema
+
+# Indicator -> parameter names and defaults; a grid may list any subset
+SWEEP_PARAMETERS = {
+    'sma': {'period': 20},
+    'ema': {'span': 12},
+    'rsi': {'period': 14},
+    'bollinger': {'period': 20, 'std_dev': 2.0},
+    'atr': {'period': 14},
+    'stochastic': {'period': 14, 'smooth': 3},
+    'macd': {'fast': 12, 'slow': 26, 'signal': 9}
+}
+
+MAX_COMBINATIONS = 1000
+
+
+def expand_grid(indicator: str, grid: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Cartesian product of the grid values, missing parameters at their
+    defaults: {'period': [10, 20], 'std_dev': [2, 2.5]} -> four parameter sets
+    Raises ValueError on unknown indicators or parameters and invalid values
+    """
+    if indicator not in SWEEP_PARAMETERS:
+        raise ValueError(f"Unknown indicator '{indicator}'. Available: {', '.join(SWEEP_PARAMETERS)}")
+    defaults = SWEEP_PARAMETERS[indicator]
+    grid = grid or {}
+    unknown = set(grid) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown parameter(s) for {indicator}: {', '.join(sorted(unknown))}. "
+                         f"Available: {', '.join(defaults)}")
+
+    names = list(defaults)
+    axes = []
+    for name in names:
+        values = grid.get(name, [defaults[name]])
+        values = list(values) if isinstance(values, (list, tuple, range, np.ndarray)) else [values]
+        if not values:
+            raise ValueError(f"Empty value list for {name}")
+        cast = float if isinstance(defaults[name], float) else int
+        values = list(dict.fromkeys(cast(value) for value in values))
+        if any(value <= 0 for value in values):
+            raise ValueError(f"{name} values must be positive")
+        axes.append(values)
+
+    combinations = int(np.prod([len(values) for values in axes]))
+    if combinations > MAX_COMBINATIONS:
+        raise ValueError(f"Grid has {combinations} parameter sets, the limit is {MAX_COMBINATIONS}")
+    return [dict(zip(names, values)) for values in itertools.product(*axes)]
+
+
+class IndicatorSweep:
+    """
+    Parameter sweeps on one IndicatorEngine
+
+    Every parameter set is a row of the result matrices. Rolling families
+    reuse the engine's shared intermediates (one close prefix sum behind
+    every SMA window, one rolling deviation per Bollinger period whatever the
+    number of widths, one set of rolling extrema per stochastic period). EMA
+    families evaluate all their spans, and RSI / ATR families all their Wilder
+    periods, in one batched recursive-filter call.
+    """
+
+    def __init__(self, price_data: pd.DataFrame, engine: Optional[IndicatorEngine] = None):
+        self.price_data = price_data
+        self.engine = engine or IndicatorEngine(price_data)
+
+    def run(self, indicator: str, grid: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        {'indicator', 'params': [parameter sets], 'index': bar timestamps,
+         'values': {output name: (len(params), bars) float64 matrix}}
+        Rows hold NaN until that parameter set's warm-up is complete.
+        """
+        params = expand_grid(indicator, grid)
+        values = getattr(self, f'_{indicator}')(params)
+        return {'indicator': indicator, 'params': params, 'index': self.engine.index, 'values': values}
+
+    def _matrix(self, rows: int) -> np.ndarray:
+        return np.full((rows, len(self.engine)), np.nan)
+
+    def _sma(self, params: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        out = self._matrix(len(params))
+        for row, p in enumerate(params):
+            out[row] = self.engine.sma(p['period'])
+        return {'sma': out}
+
+    def _ema(self, params: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        spans = [p['span'] for p in params]
+        averages = self.engine.emas(spans)
+        out = self._matrix(len(params))
+        for row, span in enumerate(spans):
+            # Same warm-up as ema_values: no value before span bars
+            out[row, span - 1:] = averages[span][span - 1:]
+        return {'ema': out}
+
+    def _rsi(self, params: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        periods = [p['period'] for p in params]
+        averages = self.engine.rsis(periods)
+        out = self._matrix(len(params))
+        for row, period in enumerate(periods):
+            out[row] = averages[period]
+        return {'rsi': out}
+
+    def _bollinger(self, params: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        upper, middle, lower, percent_b = (self._matrix(len(params)) for _ in range(4))
+        close = self.engine.close
+        for row, p in enumerate(params):
+            # One SMA and deviation per period, whatever the number of widths
+            middle[row] = self.engine.sma(p['period'])
+            width = self.engine.std(p['period']) * p['std_dev']
+            upper[row] = middle[row] + width
+            lower[row] = middle[row] - width
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent_b[:] = (close - lower) / (upper - lower)
+        return {'upper': upper, 'middle': middle, 'lower': lower, 'percent_b': percent_b}
+
+    def _atr(self, params: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        periods = [p['period'] for p in params]
+        averages = self.engine.atrs(periods)
+        out = self._matrix(len(params))
+        for row, period in enumerate(periods):
+            out[row] = averages[period]
+        return {'atr': out}
+
+    def _stochastic(self, params: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        k, d = self._matrix(len(params)), self._matrix(len(params))
+        for row, p in enumerate(params):
+            stochastic = self.engine.stochastic(p['period'], p['smooth'])
+            k[row] = stochastic['k']
+            d[row] = stochastic['d']
+        return {'k': k, 'd': d}
+
+    def _macd(self, params: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        # Every fast and slow span in one batched pass
+        averages = self.engine.emas(sorted({p['fast'] for p in params} | {p['slow'] for p in params}))
+        line, signal = self._matrix(len(params)), self._matrix(len(params))
+        lines = {}
+        for row, p in enumerate(params):
+            key = (p['fast'], p['slow'])
+            if key not in lines:
+                lines[key] = averages[p['fast']] - averages[p['slow']]
+            line[row] = lines[key]
+            signal[row] = ema(lines[key], p['signal'])
+        return {'macd': line, 'signal': signal, 'histogram': line - signal}
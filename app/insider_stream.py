@@ -0,0 +1,76 @@
+"""
+Insider Stream Module
+Incremental parsing of large insider transaction files
+"""
+import json
+from typing import Dict, Iterator
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def iter_json_array(filepath: str, key: str = 'data', chunk_size: int = 64 * 1024) -> Iterator[Dict]:
+    """
+    Yield the objects of a top-level JSON array one at a time
+
+    Only one read chunk plus the object being decoded is held in memory, so
+    the whole file is never materialised. Stopping the iteration early stops
+    reading the file.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        buffer = ''
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, eof
+            if eof:
+                return False
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer += chunk
+            return True
+
+        # Seek to the opening bracket of "<key>": [
+        marker = f'"{key}"'
+        while True:
+            found = buffer.find(marker)
+            if found != -1:
+                bracket = buffer.find('[', found + len(marker))
+                if bracket != -1:
+                    buffer = buffer[bracket + 1:]
+                    break
+                # Keep the marker in the buffer until the bracket arrives
+                buffer = buffer[found:]
+            else:
+                buffer = buffer[-len(marker):]
+            if not fill():
+                return
+
+        position = 0
+        while True:
+            # Skip separators between array items
+            while True:
+                while position < len(buffer) and buffer[position] in _WHITESPACE + ',':
+                    position += 1
+                if position < len(buffer) or not fill():
+                    break
+            if position >= len(buffer) or buffer[position] == ']':
+                return
+
+            try:
+                item, end = _DECODER.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Object straddles the chunk boundary - read more and retry
+                buffer = buffer[position:]
+                position = 0
+                if not fill():
+                    raise
+                continue
+
+            yield item
+            position = end
+            if position > chunk_size:
+                buffer = buffer[position:]
+                position = 0
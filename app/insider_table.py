@@ -0,0 +1,265 @@
+"""
+Insider Table Module
+Typed columnar table of insider transactions with windowed aggregation
+"""
+import json
+import os
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.insider_stream import iter_json_array
+
+class InsiderTable:
+    """
+    Insider transactions as typed NumPy columns, sorted by date ascending
+
+    Columns: date (datetime64[D]), executive / title / security type as
+    integer codes into small label arrays, acquisition flag (A/D), shares,
+    price and value (float64). Window aggregates use cumulative sums plus
+    binary search, per-executive totals use bincount.
+    """
+
+    LABEL_COLUMNS = ('executive', 'title', 'security_type')
+    ARRAY_COLUMNS = ('date', 'acquisition', 'shares', 'price', 'value',
+                     'executive', 'title', 'security_type')
+    META_FILE = 'meta.json'
+    FORMAT_VERSION = 1
+
+    def __init__(self, columns: Dict[str, np.ndarray], labels: Dict[str, np.ndarray]):
+        self.date = columns['date']
+        self.acquisition = columns['acquisition']
+        self.shares = columns['shares']
+        self.price = columns['price']
+        self.value = columns['value']
+        self.executive = columns['executive']
+        self.title = columns['title']
+        self.security_type = columns['security_type']
+        self.labels = labels
+
+        # Running totals shared by every window query
+        signed = np.where(self.acquisition, self.value, -self.value)
+        self._cum_buy_count = np.concatenate(([0], np.cumsum(self.acquisition)))
+        self._cum_buy_value = np.concatenate(([0.0], np.cumsum(np.where(self.acquisition, self.value, 0.0))))
+        self._cum_sell_value = np.concatenate(([0.0], np.cumsum(np.where(self.acquisition, 0.0, self.value))))
+        self._cum_net_value = np.concatenate(([0.0], np.cumsum(signed)))
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def nbytes(self) -> int:
+        """Memory held by the columns and running totals"""
+        arrays = [getattr(self, name) for name in self.ARRAY_COLUMNS]
+        arrays += [self._cum_buy_count, self._cum_buy_value, self._cum_sell_value, self._cum_net_value]
+        arrays += list(self.labels.values())
+        return int(sum(a.nbytes for a in arrays))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> 'InsiderTable':
+        """Build the table in one pass over Alpha Vantage insider rows"""
+        dates, flags, shares, prices = [], [], [], []
+        codes = {name: [] for name in cls.LABEL_COLUMNS}
+        lookups = {name: {} for name in cls.LABEL_COLUMNS}
+
+        for row in rows:
+            dates.append(row.get('transaction_date') or 'NaT')
+            flags.append(str(row.get('acquisition_or_disposal', '')).upper() == 'A')
+            shares.append(_to_float(row.get('shares')))
+            prices.append(_to_float(row.get('share_price')))
+            for name, field in (('executive', 'executive'),
+                                ('title', 'executive_title'),
+                                ('security_type', 'security_type')):
+                label = row.get(field) or ''
+                lookup = lookups[name]
+                if label not in lookup:
+                    lookup[label] = len(lookup)
+                codes[name].append(lookup[label])
+
+        date = np.array(dates, dtype='datetime64[D]')
+        # Files list newest first; sort the reversed rows so same-day order is kept
+        reverse = np.arange(len(date))[::-1]
+        order = reverse[np.argsort(date[reverse], kind='stable')]
+        share_array = np.array(shares, dtype=np.float64)[order]
+        price_array = np.array(prices, dtype=np.float64)[order]
+        columns = {
+            'date': date[order],
+            'acquisition': np.array(flags, dtype=bool)[order],
+            'shares': share_array,
+            'price': price_array,
+            'value': share_array * price_array
+        }
+        labels = {}
+        for name in cls.LABEL_COLUMNS:
+            columns[name] = np.array(codes[name], dtype=np.int32)[order]
+            labels[name] = np.array(list(lookups[name]), dtype=str)
+        return cls(columns, labels)
+
+    @classmethod
+    def from_file(cls, filepath: str) -> 'InsiderTable':
+        """Stream an insider_transactions JSON file straight into the table"""
+        return cls.from_rows(iter_json_array(filepath, 'data'))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory: str, fingerprint: Dict):
+        """Write the columns as .npy files; meta.json is written last to mark completeness"""
+        os.makedirs(directory, exist_ok=True)
+        meta_path = os.path.join(directory, self.META_FILE)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        arrays = {name: getattr(self, name) for name in self.ARRAY_COLUMNS}
+        arrays.update({f'{name}_labels': values for name, values in self.labels.items()})
+        for name, values in arrays.items():
+            target = os.path.join(directory, f'{name}.npy')
+            with open(f'{target}.tmp', 'wb') as f:
+                np.save(f, values)
+            os.replace(f'{target}.tmp', target)
+
+        with open(f'{meta_path}.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'version': self.FORMAT_VERSION, 'kind': 'insider', 'rows': len(self),
+                       'source': fingerprint}, f, indent=2)
+        os.replace(f'{meta_path}.tmp', meta_path)
+
+    @classmethod
+    def load(cls, directory: str, fingerprint: Dict) -> Optional['InsiderTable']:
+        """Memory-map a saved table, None if missing or built from another source file"""
+        try:
+            with open(os.path.join(directory, cls.META_FILE), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != cls.FORMAT_VERSION or meta.get('source') != fingerprint:
+                return None
+            columns = {
+                name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+                for name in cls.ARRAY_COLUMNS
+            }
+            labels = {
+                name: np.load(os.path.join(directory, f'{name}_labels.npy'))
+                for name in cls.LABEL_COLUMNS
+            }
+        except (OSError, ValueError):
+            return None
+        return cls(columns, labels)
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    def _bounds(self, start=None, end=None) -> tuple:
+        """Row range [lo, hi) of transactions dated within [start, end]"""
+        lo = 0 if start is None else int(np.searchsorted(self.date, np.datetime64(start, 'D'), side='left'))
+        hi = len(self) if end is None else int(np.searchsorted(self.date, np.datetime64(end, 'D'), side='right'))
+        return lo, max(lo, hi)
+
+    def totals(self, start=None, end=None) -> Dict[str, Any]:
+        """Buy/sell counts and values for transactions dated within [start, end]"""
+        lo, hi = self._bounds(start, end)
+        buys = int(self._cum_buy_count[hi] - self._cum_buy_count[lo])
+        buy_value = float(self._cum_buy_value[hi] - self._cum_buy_value[lo])
+        sell_value = float(self._cum_sell_value[hi] - self._cum_sell_value[lo])
+        return {
+            'transactions': hi - lo,
+            'buyers': buys,
+            'sellers': (hi - lo) - buys,
+            'buy_value': round(buy_value, 2),
+            'sell_value': round(sell_value, 2),
+            'net_value': round(buy_value - sell_value, 2)
+        }
+
+    def last_date(self) -> Optional[np.datetime64]:
+        return self.date[-1] if len(self) else None
+
+    def window_totals(self, days: Iterable[int] = (30, 90, 365), as_of=None) -> Dict[str, Dict]:
+        """Totals over trailing windows ending at as_of (default: latest transaction)"""
+        end = np.datetime64(as_of, 'D') if as_of is not None else self.last_date()
+        if end is None:
+            return {f'{d}d': self.totals() for d in days}
+        return {f'{d}d': self.totals(end - np.timedelta64(d - 1, 'D'), end) for d in days}
+
+    def rolling_net_value(self, days: int = 90) -> Dict[str, np.ndarray]:
+        """Trailing net value at every transaction date, fully vectorized"""
+        dates = np.unique(self.date)
+        hi = np.searchsorted(self.date, dates, side='right')
+        lo = np.searchsorted(self.date, dates - np.timedelta64(days - 1, 'D'), side='left')
+        return {'dates': dates, 'net_value': self._cum_net_value[hi] - self._cum_net_value[lo]}
+
+    def executive_totals(self, start=None, end=None, top: int = 10) -> List[Dict[str, Any]]:
+        """Per-executive buy/sell values, ranked by gross traded value"""
+        lo, hi = self._bounds(start, end)
+        codes = self.executive[lo:hi]
+        flags = self.acquisition[lo:hi]
+        values = self.value[lo:hi]
+        size = len(self.labels['executive'])
+        buy_value = np.bincount(codes, weights=np.where(flags, values, 0.0), minlength=size)
+        sell_value = np.bincount(codes, weights=np.where(flags, 0.0, values), minlength=size)
+        counts = np.bincount(codes, minlength=size)
+
+        ranked = np.argsort(-(buy_value + sell_value), kind='stable')
+        ranked = ranked[counts[ranked] > 0][:top]
+        return [
+            {
+                'executive': str(self.labels['executive'][code]),
+                'transactions': int(counts[code]),
+                'buy_value': round(float(buy_value[code]), 2),
+                'sell_value': round(float(sell_value[code]), 2),
+                'net_value': round(float(buy_value[code] - sell_value[code]), 2)
+            }
+            for code in ranked
+        ]
+
+    def cluster_activity(self, days: int = 30, min_insiders: int = 3, as_of=None) -> Dict[str, Any]:
+        """
+        Distinct insiders buying or selling within a trailing window
+        A cluster is at least min_insiders different people on the same side
+        """
+        end = np.datetime64(as_of, 'D') if as_of is not None else self.last_date()
+        if end is None:
+            return {'signal': 'none', 'distinct_buyers': 0, 'distinct_sellers': 0}
+        lo, hi = self._bounds(end - np.timedelta64(days - 1, 'D'), end)
+        codes = self.executive[lo:hi]
+        flags = self.acquisition[lo:hi]
+        buyers = int(np.unique(codes[flags]).size)
+        sellers = int(np.unique(codes[~flags]).size)
+
+        if buyers >= min_insiders and buyers > sellers:
+            signal = 'buying_cluster'
+        elif sellers >= min_insiders and sellers > buyers:
+            signal = 'selling_cluster'
+        elif buyers > sellers:
+            signal = 'moderate_buying'
+        elif sellers > buyers:
+            signal = 'moderate_selling'
+        elif buyers == 0:
+            signal = 'none'
+        else:
+            signal = 'mixed'
+        return {'signal': signal, 'distinct_buyers': buyers, 'distinct_sellers': sellers, 'window_days': days}
+
+    def recent_rows(self, count: int = 50, end=None) -> List[Dict[str, Any]]:
+        """Latest transactions dated on or before end, as dicts in the source schema, newest first"""
+        _, hi = self._bounds(None, end)
+        rows = []
+        for i in range(hi - 1, max(-1, hi - 1 - count), -1):
+            rows.append({
+                'transaction_date': str(self.date[i]),
+                'executive': str(self.labels['executive'][self.executive[i]]),
+                'executive_title': str(self.labels['title'][self.title[i]]),
+                'security_type': str(self.labels['security_type'][self.security_type[i]]),
+                'acquisition_or_disposal': 'A' if self.acquisition[i] else 'D',
+                'shares': float(self.shares[i]),
+                'share_price': float(self.price[i]),
+                'value': round(float(self.value[i]), 2)
+            })
+        return rows
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
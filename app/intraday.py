@@ -0,0 +1,415 @@
+"""
+Intraday Module
+Session VWAP, anchored VWAP and volume-at-price profiles over intraday bars
+"""
+import math
+import os
+import threading
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from app.cache import LRUCache
+from app.chart_series import format_dates, to_json_list
+from app.indicator_kernels import as_float_array, prefix_sum
+
+# Default profile bin width relative to the session's first price (~0.14 for a $280 stock)
+DEFAULT_BIN_FRACTION = 0.0005
+# Share of the session volume inside the value area
+VALUE_AREA = 0.70
+
+PROFILE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def session_starts(index: pd.DatetimeIndex) -> np.ndarray:
+    """Positions of the first bar of every session (calendar day of the exchange-local timestamps)"""
+    days = np.asarray(index.values, dtype='datetime64[ns]').astype('datetime64[D]')
+    if not len(days):
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.concatenate([[True], days[1:] != days[:-1]]))
+
+
+def typical_prices(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    return (high + low + close) / 3
+
+
+def session_vwap(typical: np.ndarray, volume: np.ndarray, starts: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    VWAP and volume-weighted standard deviation at every bar, reset at each
+    session start: three prefix sums, each bar minus the sums at its
+    session's first bar
+    """
+    n = len(typical)
+    price_volume = prefix_sum(typical * volume)
+    volumes = prefix_sum(volume)
+    squares = prefix_sum(typical * typical * volume)
+    # Prefix position of the session start each bar belongs to
+    base = np.repeat(starts, np.diff(np.append(starts, n)))
+    position = np.arange(1, n + 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        total = volumes[position] - volumes[base]
+        vwap = (price_volume[position] - price_volume[base]) / total
+        variance = (squares[position] - squares[base]) / total - vwap * vwap
+    return {'vwap': vwap, 'std': np.sqrt(np.maximum(variance, 0.0))}
+
+
+def anchored_vwap(typical: np.ndarray, volume: np.ndarray, anchors: List[int]) -> np.ndarray:
+    """
+    VWAP from each anchor bar onward, shaped (len(anchors), n) with NaN
+    before the anchor; one pair of prefix sums serves every anchor
+    """
+    n = len(typical)
+    price_volume = prefix_sum(typical * volume)
+    volumes = prefix_sum(volume)
+    anchors = np.asarray(anchors, dtype=np.int64).reshape(-1, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = (price_volume[1:] - price_volume[anchors]) / (volumes[1:] - volumes[anchors])
+    out[np.arange(n) < anchors] = np.nan
+    return out
+
+
+def price_bins(prices: np.ndarray, bin_size: float) -> np.ndarray:
+    """Integer bin of each price; math.floor in the incremental path uses the same division"""
+    return np.floor(prices / bin_size).astype(np.int64)
+
+
+def volume_profile(low: np.ndarray, high: np.ndarray, volume: np.ndarray, bin_size: float) -> Dict[str, Any]:
+    """
+    Volume at price: each bar's volume spread evenly over the bins its
+    low-high range touches, built as a difference array with two bincounts
+    and one cumulative sum (O(bars + bins), no per-bar loop)
+    """
+    if not len(volume):
+        return {'first_bin': 0, 'volumes': np.zeros(0)}
+    low_bins = price_bins(low, bin_size)
+    high_bins = np.maximum(price_bins(high, bin_size), low_bins)
+    first = int(low_bins.min())
+    size = int(high_bins.max()) - first + 1
+    share = volume / (high_bins - low_bins + 1)
+    steps = (np.bincount(low_bins - first, share, minlength=size + 1)
+             - np.bincount(high_bins - first + 1, share, minlength=size + 1))
+    return {'first_bin': first, 'volumes': np.cumsum(steps[:size])}
+
+
+def profile_summary(first_bin: int, volumes: np.ndarray, bin_size: float,
+                    value_area: float = VALUE_AREA) -> Dict[str, Optional[float]]:
+    """
+    Point of control (busiest bin) and value area: the smallest set of the
+    busiest bins holding value_area of the volume, reported as its price span
+    """
+    total = float(volumes.sum())
+    if total <= 0:
+        return {'poc': None, 'value_area_low': None, 'value_area_high': None}
+    order = np.argsort(-volumes, kind='stable')
+    count = int(np.searchsorted(np.cumsum(volumes[order]), value_area * total)) + 1
+    inside = order[:count]
+    return {
+        'poc': round((first_bin + int(order[0]) + 0.5) * bin_size, 4),
+        'value_area_low': round((first_bin + int(inside.min())) * bin_size, 4),
+        'value_area_high': round((first_bin + int(inside.max()) + 1) * bin_size, 4)
+    }
+
+
+class SessionProfile:
+    """
+    Running VWAP and volume-at-price state of one session
+
+    Built from the session's bars in one vectorized pass (from_bars), then
+    kept current bar by bar: append() / revise() touch three running sums and
+    only the profile bins the bar spans, so a refresh as bars arrive costs
+    microseconds regardless of how far into the session it is.
+    """
+
+    def __init__(self, session: str, bin_size: float):
+        if bin_size <= 0:
+            raise ValueError("bin_size must be positive")
+        self.session = session
+        self.bin_size = bin_size
+        self.bars = 0
+        self.last_timestamp: Optional[str] = None
+        self.last_bar: Optional[Dict[str, float]] = None
+        self.price_volume = 0.0
+        self.volume = 0.0
+        self.squares = 0.0
+        self.first_bin = 0
+        self.volumes = np.zeros(0)
+        self._last_contribution = None  # (typical, volume, low bin, high bin, share) of the last bar
+
+    @classmethod
+    def from_bars(cls, session: str, df: pd.DataFrame, bin_size: Optional[float] = None) -> 'SessionProfile':
+        """State after every bar of df (one session) in one vectorized pass"""
+        high, low, close, volume = (as_float_array(df[column]) for column in ('high', 'low', 'close', 'volume'))
+        if bin_size is None:
+            bin_size = cls.default_bin_size(float(df['open'].iloc[0]) if len(df) else 0.0)
+        profile = cls(session, bin_size)
+        if not len(df):
+            return profile
+
+        typical = typical_prices(high, low, close)
+        profile.bars = len(df)
+        profile.price_volume = float(np.dot(typical, volume))
+        profile.volume = float(volume.sum())
+        profile.squares = float(np.dot(typical * typical, volume))
+        histogram = volume_profile(low, high, volume, bin_size)
+        profile.first_bin = histogram['first_bin']
+        profile.volumes = histogram['volumes']
+
+        last = len(df) - 1
+        profile.last_timestamp = str(df.index[last])
+        profile.last_bar = {column: float(df[column].iloc[last]) for column in ('open', 'high', 'low', 'close', 'volume')}
+        low_bin = math.floor(low[last] / bin_size)
+        high_bin = max(math.floor(high[last] / bin_size), low_bin)
+        profile._last_contribution = (float(typical[last]), float(volume[last]), low_bin, high_bin,
+                                      float(volume[last]) / (high_bin - low_bin + 1))
+        return profile
+
+    @staticmethod
+    def default_bin_size(price: float) -> float:
+        return max(round(abs(price) * DEFAULT_BIN_FRACTION, 2), 0.01)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update(self, timestamp, open: float, high: float, low: float, close: float, volume: float):
+        """Append a new bar, or revise the last one when the timestamp is unchanged"""
+        stamp = str(pd.Timestamp(timestamp))
+        if stamp == self.last_timestamp:
+            self.revise(open, high, low, close, volume)
+        else:
+            self.append(open, high, low, close, volume, timestamp=stamp)
+
+    def append(self, open: float, high: float, low: float, close: float, volume: float, timestamp=None):
+        self.bars += 1
+        self.last_timestamp = str(pd.Timestamp(timestamp)) if timestamp is not None else None
+        self._apply(open, high, low, close, volume)
+
+    def revise(self, open: float, high: float, low: float, close: float, volume: float):
+        """Replace the last (still forming) bar"""
+        if self._last_contribution is None:
+            raise ValueError("No bar to revise")
+        typical, bar_volume, low_bin, high_bin, share = self._last_contribution
+        self.price_volume -= typical * bar_volume
+        self.volume -= bar_volume
+        self.squares -= typical * typical * bar_volume
+        self.volumes[low_bin - self.first_bin:high_bin - self.first_bin + 1] -= share
+        self._apply(open, high, low, close, volume)
+
+    def _apply(self, open: float, high: float, low: float, close: float, volume: float):
+        self.last_bar = {'open': float(open), 'high': float(high), 'low': float(low),
+                         'close': float(close), 'volume': float(volume)}
+        typical = (high + low + close) / 3
+        self.price_volume += typical * volume
+        self.volume += volume
+        self.squares += typical * typical * volume
+
+        low_bin = math.floor(low / self.bin_size)
+        high_bin = max(math.floor(high / self.bin_size), low_bin)
+        self._cover(low_bin, high_bin)
+        share = volume / (high_bin - low_bin + 1)
+        self.volumes[low_bin - self.first_bin:high_bin - self.first_bin + 1] += share
+        self._last_contribution = (typical, float(volume), low_bin, high_bin, share)
+
+    def _cover(self, low_bin: int, high_bin: int):
+        """Widen the histogram so it spans [low_bin, high_bin]"""
+        if not len(self.volumes):
+            self.first_bin = low_bin
+            self.volumes = np.zeros(high_bin - low_bin + 1)
+            return
+        if low_bin < self.first_bin:
+            self.volumes = np.concatenate([np.zeros(self.first_bin - low_bin), self.volumes])
+            self.first_bin = low_bin
+        last_bin = self.first_bin + len(self.volumes) - 1
+        if high_bin > last_bin:
+            self.volumes = np.concatenate([self.volumes, np.zeros(high_bin - last_bin)])
+
+    def nbytes(self) -> int:
+        """Memory held by the histogram plus a fixed allowance for the scalars"""
+        return int(self.volumes.nbytes) + 1024
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def values(self, include_bins: bool = True) -> Dict[str, Any]:
+        """Latest session VWAP with 1/2-sigma bands, profile summary and (optionally) the bins"""
+        if not self.volume:
+            return {'session': self.session, 'bars': self.bars, 'last_timestamp': self.last_timestamp,
+                    'vwap': None, 'bin_size': self.bin_size}
+        vwap = self.price_volume / self.volume
+        std = math.sqrt(max(self.squares / self.volume - vwap * vwap, 0.0))
+        close = self.last_bar['close']
+        result = {
+            'session': self.session,
+            'bars': self.bars,
+            'last_timestamp': self.last_timestamp,
+            'volume': int(self.volume),
+            'vwap': round(vwap, 4),
+            'std': round(std, 4),
+            'bands': {
+                'upper_1': round(vwap + std, 4), 'lower_1': round(vwap - std, 4),
+                'upper_2': round(vwap + 2 * std, 4), 'lower_2': round(vwap - 2 * std, 4)
+            },
+            'distance_percent': round((close / vwap - 1) * 100, 2),
+            'bin_size': self.bin_size,
+            **profile_summary(self.first_bin, self.volumes, self.bin_size)
+        }
+        if include_bins:
+            used = np.flatnonzero(self.volumes > 1e-9)
+            if len(used):
+                window = slice(int(used[0]), int(used[-1]) + 1)
+                result['profile'] = {
+                    'prices': to_json_list((np.arange(window.start, window.stop) + self.first_bin) * self.bin_size, 4),
+                    'volumes': to_json_list(self.volumes[window], 2)
+                }
+        return result
+
+
+class IntradayAnalytics:
+    """
+    Session profiles cached per (symbol, interval, session, bin size)
+
+    A completed session is built once and then served from the cache. For
+    the session still trading, a refresh finds the cached profile, checks
+    that its last bar is still in the data and feeds only the bars after
+    it (revising that last bar if it changed), so each refresh costs a few
+    bar updates instead of a rebuild.
+    """
+
+    # Default byte budget, overridable via INTRADAY_CACHE_MAX_MB
+    DEFAULT_MAX_MB = 16
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_mb = float(os.getenv('INTRADAY_CACHE_MAX_MB', self.DEFAULT_MAX_MB))
+            max_bytes = int(max_mb * 1024 * 1024)
+        self.cache = LRUCache(max_bytes=max_bytes)
+        self._lock = threading.Lock()
+        self.rebuilds = 0
+        self.incremental_updates = 0
+
+    @staticmethod
+    def sessions(price_data: pd.DataFrame) -> List[str]:
+        """Session dates (YYYY-MM-DD) in the data, oldest first"""
+        return [str(price_data.index[i].date()) for i in session_starts(price_data.index)]
+
+    @staticmethod
+    def session_slice(price_data: pd.DataFrame, session: Optional[str] = None) -> slice:
+        """Bar positions of one session (default: the latest); raises ValueError if absent"""
+        index = price_data.index
+        if not len(index):
+            raise ValueError("No intraday bars")
+        if session is None:
+            day = index[-1].normalize()
+        else:
+            try:
+                day = pd.Timestamp(session).normalize()
+            except ValueError:
+                raise ValueError(f"Invalid session '{session}', expected YYYY-MM-DD")
+        # Bars are sorted, so a session is two binary searches rather than a scan of the history
+        start = int(index.searchsorted(day, side='left'))
+        end = int(index.searchsorted(day + pd.Timedelta(days=1), side='left'))
+        if start == end:
+            raise ValueError(f"No bars for session {day.date()}")
+        return slice(start, end)
+
+    def profile(self, symbol: str, interval: str, price_data: pd.DataFrame, session: Optional[str] = None,
+                bin_size: Optional[float] = None) -> SessionProfile:
+        """Cached SessionProfile of one session, brought up to date with price_data"""
+        window = self.session_slice(price_data, session)
+        day = str(price_data.index[window.start].date())
+        if bin_size is None:
+            bin_size = SessionProfile.default_bin_size(float(price_data['open'].iat[window.start]))
+        key = (symbol.upper(), interval, day, bin_size)
+
+        with self._lock:
+            profile = self.cache.get(key)
+            pending = self._unapplied_bars(profile, price_data, window) if profile is not None else None
+            if pending is None:
+                profile = SessionProfile.from_bars(day, price_data.iloc[window], bin_size)
+                self.rebuilds += 1
+            elif not len(pending[1]):
+                return profile
+            else:
+                timestamps, rows = pending
+                for timestamp, (open_, high, low, close, volume) in zip(timestamps, rows.tolist()):
+                    profile.update(timestamp, open_, high, low, close, volume)
+                    self.incremental_updates += 1
+            self.cache.put(key, profile, size=profile.nbytes())
+        return profile
+
+    @staticmethod
+    def _unapplied_bars(profile: SessionProfile, price_data: pd.DataFrame, window: slice) -> Optional[tuple]:
+        """
+        (timestamps, OHLCV rows) to feed into a cached profile: its last bar,
+        if revised, and everything after (no rows when it is current); None
+        when the data no longer extends it
+        """
+        last = window.start + profile.bars - 1
+        if profile.bars < 1 or last >= window.stop or str(price_data.index[last]) != profile.last_timestamp:
+            return None
+        # Views of the full columns, so only the unapplied tail is touched
+        rows = np.column_stack([as_float_array(price_data[column])[last:window.stop] for column in PROFILE_COLUMNS])
+        if rows[0].tolist() == [profile.last_bar[column] for column in PROFILE_COLUMNS]:
+            rows = rows[1:]
+            last += 1
+        return price_data.index[last:window.stop], rows
+
+    def analyze(self, symbol: str, interval: str, price_data: pd.DataFrame, session: Optional[str] = None,
+                anchors: Optional[List[str]] = None, bin_size: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Session summary and profile, plus per-bar session VWAP (with 1-sigma
+        bands) and anchored VWAPs over the session's bars; anchors are bar
+        timestamps anywhere in the data (the first bar at or after each one)
+        """
+        window = self.session_slice(price_data, session)
+        profile = self.profile(symbol, interval, price_data, session, bin_size)
+
+        positions = []
+        for anchor in anchors or []:
+            try:
+                stamp = pd.Timestamp(anchor)
+            except ValueError:
+                raise ValueError(f"Invalid anchor '{anchor}', expected YYYY-MM-DD[THH:MM:SS]")
+            position = int(price_data.index.searchsorted(stamp, side='left'))
+            if position >= window.stop:
+                raise ValueError(f"Anchor {anchor} is after the session")
+            positions.append(position)
+
+        # Only bars from the earliest anchor (or the session start) to the session end are converted
+        first = min(positions + [window.start])
+        frame = price_data.iloc[first:window.stop]
+        high, low, close, volume = (as_float_array(frame[column]) for column in ('high', 'low', 'close', 'volume'))
+        typical = typical_prices(high, low, close)
+        bars = slice(window.start - first, window.stop - first)
+        running = session_vwap(typical[bars], volume[bars], np.array([0]))
+        with self._lock:
+            summary = profile.values()
+        payload = {
+            **summary,
+            'dates': format_dates(frame.index[bars]),
+            'close': to_json_list(close[bars], 4),
+            'vwap_series': to_json_list(running['vwap'], 4),
+            'upper_1': to_json_list(running['vwap'] + running['std'], 4),
+            'lower_1': to_json_list(running['vwap'] - running['std'], 4),
+            'anchored': []
+        }
+
+        if positions:
+            matrix = anchored_vwap(typical, volume, [position - first for position in positions])
+            for position, row in zip(positions, matrix):
+                payload['anchored'].append({
+                    'anchor': str(price_data.index[position]),
+                    'vwap': round(float(row[-1]), 4),
+                    'series': to_json_list(row[bars], 4)
+                })
+        return payload
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats()
+        stats['rebuilds'] = self.rebuilds
+        stats['incremental_updates'] = self.incremental_updates
+        return stats
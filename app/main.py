@@ -4,9 +4,10 @@ Trading Analytics Platform - Main FastAPI Application
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+import asyncio
 import json
 import os
 from datetime import datetime
@@ -18,6 +19,12 @@ from app.data_loader import DataLoader
 from app.fundamental_analysis import FundamentalAnalyzer
 from app.sentiment_analysis import SentimentAnalyzer
 from app.gemini_analyzer import GeminiAnalyzer
+from app.chart_series import DEFAULT_POINTS, MAX_POINTS, parse_range
+from app.indicator_cache import IndicatorCache
+from app.intraday import IntradayAnalytics
+from app.manifest import parse_as_of
+from app.resample import interval_rank, normalize_interval
+from app.warmup import CacheWarmer
 
 app = FastAPI(title="Trading Analytics Platform", version="1.0.0")
 
@@ -41,6 +48,34 @@ fundamental_analyzer = FundamentalAnalyzer()
 sentiment_analyzer = SentimentAnalyzer()
 gemini_analyzer = GeminiAnalyzer()
 
+# Indicator results shared across endpoints, keyed by a fingerprint of the price data
+indicator_cache = IndicatorCache(technical_analyzer)
+
+# Per-session intraday VWAP / volume profiles, updated incrementally as bars arrive
+intraday_analytics = IntradayAnalytics()
+
+# Optional cache warm-up, configured via WARMUP_SYMBOLS / WARMUP_WORKERS
+cache_warmer = CacheWarmer.from_env(data_loader)
+
+@app.on_event("startup")
+async def start_manifest_polling():
+    """Keep the data manifest current from a background thread instead of on requests"""
+    data_loader.manifest.start_polling(float(os.getenv('MANIFEST_POLL_SECONDS', 30)))
+
+@app.on_event("shutdown")
+async def stop_manifest_polling():
+    data_loader.manifest.stop_polling()
+
+@app.on_event("startup")
+async def warm_data_cache():
+    """Preload configured symbols; in the background unless WARMUP_BACKGROUND=false"""
+    if cache_warmer is None:
+        return
+    if os.getenv('WARMUP_BACKGROUND', 'true').strip().lower() in ('0', 'false', 'no'):
+        await asyncio.get_running_loop().run_in_executor(None, cache_warmer.run)
+    else:
+        cache_warmer.start_background()
+
 # Request/Response Models
 class StockRequest(BaseModel):
     symbol: str = "IBM"
@@ -74,6 +109,15 @@ class TradeSignal(BaseModel):
     take_profit: List[float]  # Multiple targets
     timeframe: str
 
+def validate_as_of(as_of: Optional[str]) -> Optional[datetime]:
+    """Parse an as_of query parameter, answering 400 for malformed values"""
+    if as_of is None:
+        return None
+    try:
+        return parse_as_of(as_of)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/")
 async def root():
     """Serve the main dashboard"""
@@ -84,52 +128,311 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Data, indicator and intraday cache usage counters (entries, bytes, hits, misses, evictions)"""
+    return {"data_cache": data_loader.cache_stats(), "indicator_cache": indicator_cache.stats(),
+            "intraday_cache": intraday_analytics.stats()}
+
+@app.get("/api/warmup/status")
+async def get_warmup_status():
+    """Progress and timings of the startup cache warm-up"""
+    if cache_warmer is None:
+        return {"state": "disabled"}
+    return cache_warmer.status()
+
 @app.get("/api/symbols")
 async def get_available_symbols():
     """Get list of available symbols with data"""
     symbols = data_loader.get_available_symbols()
     return {"symbols": symbols, "default": "IBM"}
 
+@app.get("/api/symbols/search")
+async def search_symbols(q: str = "", limit: int = 20):
+    """Search symbols by prefix or substring, with data availability flags"""
+    matches = data_loader.search_symbols(q, limit=max(1, min(limit, 100)))
+    return {"query": q, "results": [info.to_dict() for info in matches]}
+
+@app.get("/api/symbols/{symbol}")
+async def get_symbol_info(symbol: str):
+    """Data availability flags for one symbol"""
+    info = data_loader.get_symbol_info(symbol)
+    if info is None:
+        raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
+    return info.to_dict()
+
 @app.get("/api/technical/{symbol}")
-async def get_technical_analysis(symbol: str = "IBM"):
+async def get_technical_analysis(symbol: str = "IBM", interval: Optional[str] = None, as_of: Optional[str] = None,
+                                 adjusted: bool = True):
     """
     Get comprehensive technical analysis for a symbol
+    interval: 5min, 15min, 1h, daily, weekly or monthly (default: daily, weekly fallback)
+    as_of: YYYY-MM-DD[THH:MM:SS] point-in-time cutoff
+    adjusted: split/dividend adjusted bars (default) or raw bars
     """
+    if interval is not None:
+        try:
+            interval = normalize_interval(interval)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    cutoff = validate_as_of(as_of)
+    
     try:
         # Load price data
-        price_data = data_loader.load_price_data(symbol)
+        price_data = await data_loader.aload_price_data(symbol, interval, cutoff, adjusted)
         
         if price_data.empty:
             raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
         
-        # Calculate all technical indicators
-        indicators = technical_analyzer.calculate_all_indicators(price_data)
+        # Calculate all technical indicators; the chart reuses the same intermediates
+        indicators, chart_data = indicator_cache.technical(symbol, interval, price_data)
         
         return {
             "symbol": symbol,
+            "interval": interval or "daily",
+            "as_of": as_of,
+            "adjusted": adjusted,
             "timestamp": datetime.now().isoformat(),
             "indicators": indicators,
-            "chart_data": technical_analyzer.prepare_chart_data(price_data)
+            "chart_data": chart_data
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/technical/{symbol}/timeframes")
+async def get_multi_timeframe_analysis(symbol: str = "IBM", intervals: Optional[str] = None,
+                                       as_of: Optional[str] = None, adjusted: bool = True):
+    """
+    Full indicator set on several timeframes at once, with a trend-alignment summary
+    intervals: comma-separated (default: every interval available for the symbol)
+    as_of: YYYY-MM-DD[THH:MM:SS] point-in-time cutoff
+    """
+    try:
+        if intervals:
+            requested = [normalize_interval(i.strip()) for i in intervals.split(',') if i.strip()]
+        else:
+            requested = list(data_loader.available_intervals(symbol))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    cutoff = validate_as_of(as_of)
+    
+    if not requested:
+        raise HTTPException(status_code=404, detail=f"No price data found for {symbol}")
+    requested = sorted(set(requested), key=interval_rank)
+    
+    try:
+        # Load every timeframe concurrently
+        frames = await asyncio.gather(*[
+            data_loader.aload_price_data(symbol, interval, cutoff, adjusted) for interval in requested
+        ])
+        
+        # Each timeframe is memoized on its own data, so a new 5min bar leaves weekly/monthly cached
+        analysis = await asyncio.get_running_loop().run_in_executor(
+            None,
+            technical_analyzer.calculate_multi_timeframe,
+            dict(zip(requested, frames)),
+            lambda interval, df: indicator_cache.indicators(symbol, interval, df)
+        )
+        
+        if not analysis['timeframes']:
+            raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
+        
+        return {
+            "symbol": symbol,
+            "as_of": as_of,
+            "adjusted": adjusted,
+            "timestamp": datetime.now().isoformat(),
+            **analysis
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/technical/{symbol}/latest")
+async def get_latest_indicators(symbol: str = "IBM", interval: str = "daily"):
+    """
+    Latest-bar indicators from the persisted running state: only bars that
+    arrived since the previous call are applied (adjusted bars, no as_of)
+    interval: 5min, 15min, 1h, daily, weekly or monthly
+    """
+    try:
+        interval = normalize_interval(interval)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        state = await data_loader.aload_indicator_state(symbol, interval)
+        
+        if state is None:
+            raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
+        
+        return {
+            "symbol": symbol,
+            "interval": interval,
+            "timestamp": datetime.now().isoformat(),
+            "indicators": state.values()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/chart/{symbol}")
+async def get_chart_series(symbol: str = "IBM", interval: Optional[str] = None, series: str = "",
+                           start: Optional[str] = None, end: Optional[str] = None,
+                           points: int = DEFAULT_POINTS, adjusted: bool = True):
+    """
+    Price and indicator series for any date range, downsampled with LTTB
+    series: comma-separated, e.g. sma_50,ema_200,rsi,macd,bollinger,atr,stochastic,donchian_55,volume_sma
+    start/end: YYYY-MM-DD[THH:MM:SS] (default: full history)
+    points: point budget (default 1000, 0 = every bar)
+    """
+    if interval is not None:
+        try:
+            interval = normalize_interval(interval)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if points < 0 or points > MAX_POINTS:
+        raise HTTPException(status_code=400, detail=f"points must be between 0 and {MAX_POINTS}")
+    try:
+        start_ts, end_ts = parse_range(start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        # Indicators need the history before start to warm up, so only the end is a load cutoff
+        price_data = await data_loader.aload_price_data(symbol, interval, None, adjusted)
+        
+        if price_data.empty:
+            raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
+        
+        try:
+            chart = indicator_cache.chart_series(symbol, interval, price_data, series.split(','),
+                                                 start_ts, end_ts, points)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Lists straight from NumPy; returning a response skips per-element re-encoding
+        return JSONResponse({
+            "symbol": symbol,
+            "interval": interval or "daily",
+            "start": start,
+            "end": end,
+            "adjusted": adjusted,
+            **chart
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/levels/{symbol}")
+async def get_price_levels(symbol: str = "IBM", interval: Optional[str] = None, as_of: Optional[str] = None,
+                           adjusted: bool = True, tolerance: float = 0.01, max_zones: int = 5):
+    """
+    Support/resistance zones from 5/20/60/250-bar pivots over the full history
+    tolerance: maximum zone width relative to its lowest pivot (default 1%)
+    max_zones: strongest zones returned on each side of the latest close
+    """
+    if interval is not None:
+        try:
+            interval = normalize_interval(interval)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if tolerance <= 0 or max_zones < 1:
+        raise HTTPException(status_code=400, detail="tolerance must be positive and max_zones at least 1")
+    cutoff = validate_as_of(as_of)
+    
+    try:
+        price_data = await data_loader.aload_price_data(symbol, interval, cutoff, adjusted)
+        
+        if price_data.empty:
+            raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
+        
+        levels = indicator_cache.levels(symbol, interval, price_data, tolerance=tolerance, max_zones=max_zones)
+        
+        return {
+            "symbol": symbol,
+            "interval": interval or "daily",
+            "as_of": as_of,
+            "adjusted": adjusted,
+            "timestamp": datetime.now().isoformat(),
+            "levels": levels
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/intraday/{symbol}")
+async def get_intraday_analytics(symbol: str = "IBM", interval: str = "5min", session: Optional[str] = None,
+                                 anchors: Optional[str] = None, bin_size: Optional[float] = None,
+                                 adjusted: bool = True):
+    """
+    Session VWAP with 1/2-sigma bands, anchored VWAPs and the volume-at-price profile
+    session: YYYY-MM-DD (default: the latest session)
+    anchors: comma-separated bar timestamps, e.g. 2025-09-15,2025-10-01T12:00:00
+    bin_size: profile bin width in price units (default: 0.05% of the session open)
+    """
+    try:
+        interval = normalize_interval(interval)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if interval_rank(interval) >= interval_rank('daily'):
+        raise HTTPException(status_code=400, detail="interval must be intraday (5min, 15min or 1h)")
+    if bin_size is not None and bin_size <= 0:
+        raise HTTPException(status_code=400, detail="bin_size must be positive")
+    anchor_list = [a.strip() for a in anchors.split(',') if a.strip()] if anchors else []
+    
+    try:
+        price_data = await data_loader.aload_price_data(symbol, interval, None, adjusted)
+        
+        if price_data.empty:
+            raise HTTPException(status_code=404, detail=f"No intraday data found for {symbol}")
+        
+        try:
+            analytics = intraday_analytics.analyze(symbol, interval, price_data, session, anchor_list, bin_size)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return JSONResponse({
+            "symbol": symbol,
+            "interval": interval,
+            "adjusted": adjusted,
+            "sessions": intraday_analytics.sessions(price_data),
+            **analytics
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/signals/{symbol}")
-async def get_trade_signals(symbol: str = "IBM"):
+async def get_trade_signals(symbol: str = "IBM", as_of: Optional[str] = None):
     """
     Generate comprehensive trade signals based on all data types
+    as_of: YYYY-MM-DD[THH:MM:SS] point-in-time cutoff
     """
+    cutoff = validate_as_of(as_of)
     try:
         # Load all data types
-        price_data = data_loader.load_price_data(symbol)
-        fundamental_data = data_loader.load_fundamental_data(symbol)
-        sentiment_data = data_loader.load_sentiment_data(symbol)
-        insider_data = data_loader.load_insider_data(symbol)
+        price_data, fundamental_data, sentiment_data, insider_data = await asyncio.gather(
+            data_loader.aload_price_data(symbol, None, cutoff),
+            data_loader.aload_fundamental_data(symbol, cutoff),
+            data_loader.aload_sentiment_data(symbol, cutoff),
+            data_loader.aload_insider_data(symbol, None, cutoff)
+        )
         
         # Calculate indicators from each analysis type
         if not price_data.empty:
-            tech_indicators = technical_analyzer.calculate_all_indicators(price_data)
+            tech_indicators = indicator_cache.indicators(symbol, None, price_data)
         else:
             tech_indicators = {}
         
@@ -154,12 +457,14 @@ async def get_trade_signals(symbol: str = "IBM"):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/fundamental/{symbol}")
-async def get_fundamental_analysis(symbol: str = "IBM"):
+async def get_fundamental_analysis(symbol: str = "IBM", as_of: Optional[str] = None):
     """
     Get fundamental analysis for a symbol
+    as_of: YYYY-MM-DD[THH:MM:SS] - use the snapshots current at that time
     """
+    cutoff = validate_as_of(as_of)
     try:
-        fundamental_data = data_loader.load_fundamental_data(symbol)
+        fundamental_data = await data_loader.aload_fundamental_data(symbol, cutoff)
         
         if not fundamental_data:
             raise HTTPException(status_code=404, detail=f"No fundamental data found for {symbol}")
@@ -176,12 +481,14 @@ async def get_fundamental_analysis(symbol: str = "IBM"):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/sentiment/{symbol}")
-async def get_sentiment_analysis(symbol: str = "IBM"):
+async def get_sentiment_analysis(symbol: str = "IBM", as_of: Optional[str] = None):
     """
     Get sentiment analysis for a symbol
+    as_of: YYYY-MM-DD[THH:MM:SS] - use the snapshots current at that time
     """
+    cutoff = validate_as_of(as_of)
     try:
-        sentiment_data = data_loader.load_sentiment_data(symbol)
+        sentiment_data = await data_loader.aload_sentiment_data(symbol, cutoff)
         
         if not sentiment_data:
             raise HTTPException(status_code=404, detail=f"No sentiment data found for {symbol}")
@@ -197,14 +504,43 @@ async def get_sentiment_analysis(symbol: str = "IBM"):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/transcripts/{symbol}")
+async def get_transcript_summaries(symbol: str = "IBM"):
+    """
+    Per-quarter earnings call summaries for a symbol
+    """
+    sentiment_data = await data_loader.aload_sentiment_data(symbol)
+    transcripts = sentiment_data.get('transcripts', [])
+    if not transcripts:
+        raise HTTPException(status_code=404, detail=f"No transcripts found for {symbol}")
+    
+    return {
+        "symbol": symbol,
+        "count": len(transcripts),
+        "transcripts": transcripts
+    }
+
+@app.get("/api/transcripts/{symbol}/{quarter}")
+async def get_transcript(symbol: str, quarter: str):
+    """
+    Full earnings call transcript for one quarter (YYYYQn)
+    """
+    transcript = await data_loader.aload_transcript(symbol, quarter)
+    if not transcript:
+        raise HTTPException(status_code=404, detail=f"No transcript found for {symbol} {quarter}")
+    
+    return transcript
+
 @app.get("/api/overview/{symbol}")
 async def get_stock_overview(symbol: str = "IBM"):
     """
     Get complete overview including price, volume, and key metrics
     """
     try:
-        price_data = data_loader.load_price_data(symbol)
-        company_info = data_loader.load_company_overview(symbol)
+        price_data, company_info = await asyncio.gather(
+            data_loader.aload_price_data(symbol),
+            data_loader.aload_company_overview(symbol)
+        )
         
         # Get latest price info
         if not price_data.empty:
@@ -265,12 +601,14 @@ async def get_ai_analysis(symbol: str = "IBM"):
     """
     try:
         # Load all data types
-        price_data = data_loader.load_price_data(symbol)
-        fundamental_data = data_loader.load_fundamental_data(symbol)
-        sentiment_data = data_loader.load_sentiment_data(symbol)
+        price_data, fundamental_data, sentiment_data = await asyncio.gather(
+            data_loader.aload_price_data(symbol),
+            data_loader.aload_fundamental_data(symbol),
+            data_loader.aload_sentiment_data(symbol)
+        )
         
         # Calculate indicators
-        tech_indicators = technical_analyzer.calculate_all_indicators(price_data) if not price_data.empty else {}
+        tech_indicators = indicator_cache.indicators(symbol, None, price_data) if not price_data.empty else {}
         
         # Get AI analysis
         ai_analysis = gemini_analyzer.analyze_comprehensive({
@@ -307,13 +645,13 @@ async def get_trading_expert_analysis(symbol: str = "IBM"):
     """
     try:
         # Load price data and calculate technical indicators
-        price_data = data_loader.load_price_data(symbol)
+        price_data = await data_loader.aload_price_data(symbol)
         
         if price_data.empty:
             raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
         
         # Calculate technical indicators
-        tech_indicators = technical_analyzer.calculate_all_indicators(price_data)
+        tech_indicators = indicator_cache.indicators(symbol, None, price_data)
         
         # Generate computed signal using mathematical model
         computed_signal = signal_generator.generate_signal(
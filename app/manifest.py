@@ -0,0 +1,426 @@
+"""
+Data Manifest Module
+Persistent index of the JSON data files under each symbol folder
+"""
+import json
+import os
+import re
+import threading
+import time
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Data category folders inside each symbol folder (e.g. IBM/TechnicalAnalysis)
+CATEGORY_FOLDERS = {
+    'TechnicalAnalysis': 'technical',
+    'FundamentalData': 'fundamental',
+    'SentimentData': 'sentiment',
+    'AlternativeData': 'alternative'
+}
+
+# Price file interval tokens (ibm_daily_adjusted_..., ibm_intraday_...) -> interval
+PRICE_INTERVALS = {
+    'daily': 'daily',
+    'weekly': 'weekly',
+    'monthly': 'monthly',
+    'intraday': '5min'
+}
+
+_TIMESTAMP_SUFFIX = re.compile(r'_(\d{8})_(\d{6})$')
+_QUARTER_SUFFIX = re.compile(r'_(\d{4})Q([1-4])$')
+
+
+class ManifestEntry(NamedTuple):
+    """One data file: what it holds, when it was taken and where it lives"""
+    symbol: str
+    category: str
+    data_type: str
+    interval: Optional[str]
+    period: Optional[str]
+    timestamp: datetime
+    path: str
+    size: int
+    mtime_ns: int
+
+
+def classify_file(symbol: str, category: str, path: str, size: int, mtime_ns: int) -> ManifestEntry:
+    """
+    Derive data type, interval and timestamp from a file name written by the fetch scripts
+
+    ibm_daily_adjusted_20251003_181415.json -> ('price', 'daily', 2025-10-03 18:14:15)
+    balance_sheet_20251003_182715.json      -> ('balance_sheet', None, 2025-10-03 18:27:15)
+    earnings_transcript_2024Q1.json         -> ('earnings_transcript', period '2024Q1')
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    timestamp = None
+    period = None
+
+    match = _TIMESTAMP_SUFFIX.search(stem)
+    if match:
+        try:
+            timestamp = datetime.strptime(match.group(1) + match.group(2), '%Y%m%d%H%M%S')
+        except ValueError:
+            timestamp = None
+        stem = stem[:match.start()]
+    else:
+        match = _QUARTER_SUFFIX.search(stem)
+        if match:
+            year, quarter = int(match.group(1)), int(match.group(2))
+            period = f'{year}Q{quarter}'
+            # Quarter label sorts as the first day of the quarter
+            timestamp = datetime(year, 3 * quarter - 2, 1)
+            stem = stem[:match.start()]
+
+    if timestamp is None:
+        timestamp = datetime.fromtimestamp(mtime_ns / 1e9)
+
+    data_type = stem.lower()
+    interval = None
+    if category == 'technical':
+        parts = data_type.split('_')
+        if len(parts) >= 2 and parts[0] == symbol.lower() and parts[1] in PRICE_INTERVALS:
+            data_type = 'price'
+            interval = PRICE_INTERVALS[parts[1]]
+
+    return ManifestEntry(symbol, category, data_type, interval, period, timestamp, path, size, mtime_ns)
+
+
+def parse_as_of(value) -> datetime:
+    """
+    Point-in-time cutoff from a datetime, date or ISO string
+    A bare date means the end of that day, so same-day snapshots are included
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.max.time())
+    text = str(value).strip()
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"Invalid as_of '{value}'. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS")
+    if len(text) == 10:
+        parsed = datetime.combine(parsed.date(), datetime.max.time())
+    return parsed
+
+
+class DataManifest:
+    """
+    Index of (symbol, data_type, interval, timestamp, path, size) for every data file
+
+    The index is built once, persisted to disk, and refreshed incrementally:
+    only folders whose modification time changed are listed again. In-place
+    overwrites (same name, new content) leave the folder mtime alone; the
+    background poller re-stats the indexed files to pick those up. Lookups of
+    the latest file for a (symbol, data_type, interval) are dictionary hits.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, root_dir: str, manifest_path: Optional[str] = None, refresh_seconds: float = 5.0):
+        self.root_dir = root_dir
+        self.manifest_path = manifest_path
+        self.refresh_seconds = refresh_seconds
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._folder_files: Dict[str, set] = {}
+        self._dir_mtimes: Dict[str, int] = {}
+        self._category_dirs: Dict[str, List[Tuple[str, str]]] = {}
+        self._series: Dict[Tuple, List[ManifestEntry]] = {}
+        self._timestamps: Dict[Tuple, List[datetime]] = {}
+        self._intervals: Dict[Tuple, List[str]] = {}
+        self._symbols: Dict[str, Dict[str, List[str]]] = {}
+        self._last_refresh = 0.0
+        # Bumped whenever the indexes are rebuilt, so dependents can tell when to refresh
+        self.generation = 0
+        self._poller: Optional[threading.Thread] = None
+        self._stop_polling = threading.Event()
+
+        self._load()
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def latest(self, symbol: str, data_type: str, interval: Optional[str] = None) -> Optional[ManifestEntry]:
+        """Most recent file of a data type for a symbol"""
+        self.maybe_refresh()
+        series = self._series.get((symbol.upper(), data_type, interval))
+        return series[-1] if series else None
+
+    def entries(self, symbol: str, data_type: str, interval: Optional[str] = None) -> List[ManifestEntry]:
+        """All files of a data type for a symbol, oldest first"""
+        self.maybe_refresh()
+        return list(self._series.get((symbol.upper(), data_type, interval), []))
+
+    def as_of(self, symbol: str, data_type: str, as_of: datetime, interval: Optional[str] = None) -> Optional[ManifestEntry]:
+        """Newest file of a data type whose timestamp is at or before as_of (binary search)"""
+        self.maybe_refresh()
+        key = (symbol.upper(), data_type, interval)
+        series = self._series.get(key)
+        if not series:
+            return None
+        timestamps = self._timestamps.get(key)
+        if timestamps is None or len(timestamps) != len(series):
+            # Indexes are being swapped by a refresh; fall back to the entries themselves
+            timestamps = [e.timestamp for e in series]
+        position = bisect_right(timestamps, as_of)
+        return series[position - 1] if position else None
+
+    def intervals(self, symbol: str, data_type: str = 'price') -> List[str]:
+        """Intervals available for a symbol's data type"""
+        self.maybe_refresh()
+        return list(self._intervals.get((symbol.upper(), data_type), []))
+
+    def symbols(self) -> List[str]:
+        """Symbols that have at least one data file"""
+        self.maybe_refresh()
+        return sorted(self._symbols)
+
+    def symbol_folders(self, symbol: str) -> Dict[str, List[str]]:
+        """Data types available per category folder for a symbol"""
+        self.maybe_refresh()
+        return self._symbols.get(symbol.upper(), {})
+
+    def all_entries(self) -> List[ManifestEntry]:
+        self.maybe_refresh()
+        return list(self._entries.values())
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def maybe_refresh(self):
+        """
+        Refresh when the last refresh is older than refresh_seconds
+        Skipped while the background poller keeps the index current
+        """
+        if self._poller is not None and self._poller.is_alive():
+            return
+        if time.monotonic() - self._last_refresh >= self.refresh_seconds:
+            self.refresh()
+
+    def refresh(self, restat_files: bool = False) -> bool:
+        """
+        Incrementally bring the index up to date with the file system
+        Only folder mtimes are checked unless restat_files is set: then the
+        files of unchanged folders are stat'ed too, catching overwrites in
+        place (the background poller does this, keeping it off requests)
+        Returns True when any file was added, removed or changed
+        """
+        with self._lock:
+            self._last_refresh = time.monotonic()
+            seen_folders = set()
+            changed = False
+
+            for symbol_dir, folders in self._symbol_dirs().items():
+                symbol = os.path.basename(symbol_dir).upper()
+                for category, folder in folders:
+                    try:
+                        mtime_ns = os.stat(folder).st_mtime_ns
+                    except OSError:
+                        continue
+                    seen_folders.add(folder)
+                    if self._dir_mtimes.get(folder) == mtime_ns:
+                        if restat_files:
+                            # Files overwritten in place keep the folder's mtime; stat the known ones
+                            changed |= self._restat_folder(symbol, category, folder)
+                        continue
+                    changed |= self._scan_folder(symbol, category, folder)
+                    self._dir_mtimes[folder] = mtime_ns
+
+            # Folders that disappeared take their files with them
+            for folder in [f for f in self._folder_files if f not in seen_folders]:
+                for path in self._folder_files.pop(folder):
+                    self._entries.pop(path, None)
+                    changed = True
+                self._dir_mtimes.pop(folder, None)
+
+            if changed or not self._series:
+                self._rebuild_indexes()
+            if changed:
+                self._save()
+            return changed
+
+    def _symbol_dirs(self) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Top-level folders that contain data category folders, with those folders
+        Folder listings are only repeated when the parent folder's mtime changed
+        """
+        if self._changed(self.root_dir):
+            try:
+                children = [
+                    e.path for e in os.scandir(self.root_dir)
+                    if e.is_dir() and not e.name.startswith('.')
+                ]
+            except OSError:
+                children = []
+            self._category_dirs = {d: self._category_dirs.get(d) for d in children}
+
+        for symbol_dir in list(self._category_dirs):
+            if self._category_dirs[symbol_dir] is not None and not self._changed(symbol_dir):
+                continue
+            folders = []
+            for folder_name, category in CATEGORY_FOLDERS.items():
+                folder = os.path.join(symbol_dir, folder_name)
+                if os.path.isdir(folder):
+                    folders.append((category, folder))
+            self._category_dirs[symbol_dir] = folders
+
+        return {d: f for d, f in self._category_dirs.items() if f}
+
+    def _changed(self, directory: str) -> bool:
+        """Record a directory's mtime, returning True if it differs from the last one seen"""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return True
+        key = f'{directory}{os.sep}'
+        if self._dir_mtimes.get(key) == mtime_ns:
+            return False
+        self._dir_mtimes[key] = mtime_ns
+        return True
+
+    def _scan_folder(self, symbol: str, category: str, folder: str) -> bool:
+        """Re-list one category folder, returning True if its files changed"""
+        changed = False
+        current = set()
+        try:
+            files = [e for e in os.scandir(folder) if e.is_file() and e.name.endswith('.json')]
+        except OSError:
+            files = []
+
+        for file_entry in files:
+            path = file_entry.path
+            current.add(path)
+            stat = file_entry.stat()
+            existing = self._entries.get(path)
+            if existing and existing.mtime_ns == stat.st_mtime_ns and existing.size == stat.st_size:
+                continue
+            self._entries[path] = classify_file(symbol, category, path, stat.st_size, stat.st_mtime_ns)
+            changed = True
+
+        for path in self._folder_files.get(folder, set()) - current:
+            del self._entries[path]
+            changed = True
+        self._folder_files[folder] = current
+        return changed
+
+    def _restat_folder(self, symbol: str, category: str, folder: str) -> bool:
+        """Re-stat the files already indexed for an unlisted folder, returning True if any changed"""
+        changed = False
+        for path in self._folder_files.get(folder, ()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Removed without touching the folder's mtime; fall back to a listing
+                return self._scan_folder(symbol, category, folder)
+            existing = self._entries.get(path)
+            if existing and existing.mtime_ns == stat.st_mtime_ns and existing.size == stat.st_size:
+                continue
+            self._entries[path] = classify_file(symbol, category, path, stat.st_size, stat.st_mtime_ns)
+            changed = True
+        return changed
+
+    def _rebuild_indexes(self):
+        series: Dict[Tuple, List[ManifestEntry]] = {}
+        intervals: Dict[Tuple, List[str]] = {}
+        symbols: Dict[str, Dict[str, List[str]]] = {}
+        for entry in self._entries.values():
+            key = (entry.symbol, entry.data_type, entry.interval)
+            if key not in series:
+                series[key] = []
+                intervals.setdefault((entry.symbol, entry.data_type), []).append(entry.interval)
+            series[key].append(entry)
+            data_types = symbols.setdefault(entry.symbol, {}).setdefault(entry.category, [])
+            if entry.data_type not in data_types:
+                data_types.append(entry.data_type)
+        for entries in series.values():
+            entries.sort(key=lambda e: (e.timestamp, e.mtime_ns))
+        self._series = series
+        self._timestamps = {key: [e.timestamp for e in entries] for key, entries in series.items()}
+        self._intervals = intervals
+        self._symbols = symbols
+        self.generation += 1
+
+    # ------------------------------------------------------------------
+    # Background polling
+    # ------------------------------------------------------------------
+
+    def start_polling(self, interval_seconds: float = 30.0):
+        """
+        Refresh the index (re-stat'ing indexed files) from a daemon thread every
+        interval_seconds; lookups then skip their own refresh entirely
+        """
+        if self._poller and self._poller.is_alive():
+            return
+        self._stop_polling.clear()
+
+        def poll():
+            while not self._stop_polling.wait(interval_seconds):
+                try:
+                    self.refresh(restat_files=True)
+                except Exception as e:
+                    print(f"Error refreshing data manifest: {str(e)}")
+
+        self._poller = threading.Thread(target=poll, name='data-manifest-poller', daemon=True)
+        self._poller.start()
+
+    def stop_polling(self):
+        self._stop_polling.set()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        """Load a previously saved manifest so unchanged folders are not listed again"""
+        if not self.manifest_path or not os.path.exists(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') != self.FORMAT_VERSION or saved.get('root_dir') != self.root_dir:
+                return
+            entries = {}
+            folder_files = {}
+            for item in saved.get('entries', []):
+                item['timestamp'] = datetime.fromisoformat(item['timestamp'])
+                entry = ManifestEntry(**item)
+                entries[entry.path] = entry
+                folder_files.setdefault(os.path.dirname(entry.path), set()).add(entry.path)
+            self._entries = entries
+            self._folder_files = folder_files
+            # Folder listings are redone on the first refresh; only file-level mtimes are trusted
+            self._dir_mtimes = {
+                k: int(v) for k, v in saved.get('dirs', {}).items() if not k.endswith(os.sep)
+            }
+        except Exception as e:
+            print(f"Error loading data manifest {self.manifest_path}: {str(e)}")
+            self._entries = {}
+            self._folder_files = {}
+            self._dir_mtimes = {}
+
+    def _save(self):
+        if not self.manifest_path:
+            return
+        payload = {
+            'version': self.FORMAT_VERSION,
+            'root_dir': self.root_dir,
+            'dirs': self._dir_mtimes,
+            'entries': [
+                dict(entry._asdict(), timestamp=entry.timestamp.isoformat())
+                for entry in self._entries.values()
+            ]
+        }
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            tmp_path = f'{self.manifest_path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"Error saving data manifest {self.manifest_path}: {str(e)}")
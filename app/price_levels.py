@@ -0,0 +1,127 @@
+"""
+Price Levels Module
+Multi-scale pivot detection over the full history, clustered into support/resistance zones
+"""
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.indicator_engine import IndicatorEngine
+
+class LevelDetector:
+    """
+    Support/resistance zones from swing pivots at several scales
+
+    Pivots are found at every scale over the whole history (see
+    IndicatorEngine.pivots), then all pivot prices are sorted once and cut
+    into zones no wider than the tolerance with one binary search per zone,
+    so clustering is O(p log p) with no pairwise comparisons. Each zone
+    reports its pivot count, a strength weighted by scale (a 250-bar pivot
+    outweighs a 5-bar one), and how many bars traded into it.
+    """
+
+    DEFAULT_SCALES = (5, 20, 60, 250)
+
+    def __init__(self, scales: Tuple[int, ...] = DEFAULT_SCALES, tolerance: float = 0.01):
+        if tolerance <= 0:
+            raise ValueError("tolerance must be positive")
+        self.scales = tuple(sorted(set(int(scale) for scale in scales)))
+        # Maximum width of a zone relative to its lowest pivot (1% by default)
+        self.tolerance = tolerance
+
+    def detect(self, price_data: pd.DataFrame, engine: Optional[IndicatorEngine] = None,
+               max_zones: int = 5) -> Dict[str, Any]:
+        """
+        Zones over the full history, plus the strongest max_zones below
+        (support, nearest first) and above (resistance, nearest first) the
+        latest close
+        """
+        if engine is None:
+            engine = IndicatorEngine(price_data)
+        if len(engine) == 0:
+            return {'current_price': None, 'scales': list(self.scales), 'tolerance': self.tolerance,
+                    'pivots': {}, 'zones': [], 'support': [], 'resistance': []}
+
+        prices, positions, weights, scale_bits, pivot_counts = self._collect_pivots(engine)
+        zones = self._cluster(engine, prices, positions, weights, scale_bits)
+
+        current_price = float(engine.close[-1])
+        below = [zone for zone in zones if zone['price'] <= current_price]
+        above = [zone for zone in zones if zone['price'] > current_price]
+
+        return {
+            'current_price': current_price,
+            'scales': list(self.scales),
+            'tolerance': self.tolerance,
+            'pivots': pivot_counts,
+            'zones': zones,
+            'support': sorted(self._strongest(below, max_zones), key=lambda zone: -zone['price']),
+            'resistance': sorted(self._strongest(above, max_zones), key=lambda zone: zone['price'])
+        }
+
+    def _collect_pivots(self, engine: IndicatorEngine) -> tuple:
+        """Flat arrays of every pivot price, bar position, scale weight and scale bit"""
+        prices, positions, weights, scale_bits = [], [], [], []
+        pivot_counts = {}
+        for rank, scale in enumerate(self.scales):
+            pivots = engine.pivots(scale)
+            pivot_counts[str(scale)] = {'highs': int(len(pivots['highs'])), 'lows': int(len(pivots['lows']))}
+            for column, found in ((engine.high, pivots['highs']), (engine.low, pivots['lows'])):
+                prices.append(column[found])
+                positions.append(found)
+                weights.append(np.full(len(found), rank + 1.0))
+                scale_bits.append(np.full(len(found), 1 << rank, dtype=np.int64))
+        return (np.concatenate(prices), np.concatenate(positions), np.concatenate(weights),
+                np.concatenate(scale_bits), pivot_counts)
+
+    def _cluster(self, engine: IndicatorEngine, prices: np.ndarray, positions: np.ndarray,
+                 weights: np.ndarray, scale_bits: np.ndarray) -> List[Dict[str, Any]]:
+        """Sort-based clustering of pivot prices into zones"""
+        valid = np.isfinite(prices) & (prices > 0)
+        if not valid.any():
+            return []
+        order = np.argsort(prices[valid], kind='stable')
+        prices = prices[valid][order]
+        positions = positions[valid][order]
+        weights = weights[valid][order]
+        scale_bits = scale_bits[valid][order]
+
+        # Each zone spans at most tolerance above its lowest pivot; one binary
+        # search per zone finds where the next one starts (no chaining drift)
+        starts = []
+        start = 0
+        while start < len(prices):
+            starts.append(start)
+            start = int(np.searchsorted(prices, prices[start] * (1 + self.tolerance), side='right'))
+        starts = np.array(starts, dtype=np.int64)
+
+        counts = np.diff(np.append(starts, len(prices)))
+        strength = np.add.reduceat(weights, starts)
+        centers = np.add.reduceat(prices * weights, starts) / strength
+        lows = np.minimum.reduceat(prices, starts)
+        highs = np.maximum.reduceat(prices, starts)
+        last_positions = np.maximum.reduceat(positions, starts)
+        zone_scales = np.bitwise_or.reduceat(scale_bits, starts)
+
+        # Bars trading into [low, high]: low <= zone high minus those entirely below the zone
+        bar_lows = np.sort(engine.low)
+        bar_highs = np.sort(engine.high)
+        touches = np.searchsorted(bar_lows, highs, side='right') - np.searchsorted(bar_highs, lows, side='left')
+
+        index = engine.index
+        zones = []
+        for i in range(len(starts)):
+            zones.append({
+                'price': round(float(centers[i]), 2),
+                'low': round(float(lows[i]), 2),
+                'high': round(float(highs[i]), 2),
+                'pivots': int(counts[i]),
+                'touches': int(touches[i]),
+                'strength': round(float(strength[i]), 2),
+                'scales': [scale for rank, scale in enumerate(self.scales) if zone_scales[i] & (1 << rank)],
+                'last_pivot': str(index[last_positions[i]])
+            })
+        return zones
+
+    def _strongest(self, zones: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+        return sorted(zones, key=lambda zone: (zone['strength'], zone['touches']), reverse=True)[:count]
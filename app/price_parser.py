@@ -0,0 +1,112 @@
+"""
+Price Parser Module
+Vectorized parser for Alpha Vantage time-series JSON
+"""
+import re
+import numpy as np
+import pandas as pd
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+# Output columns in the order the rest of the app expects them
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'adjusted_close']
+REQUIRED_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# Strips the numbering Alpha Vantage puts in front of field names ("5. adjusted close")
+_FIELD_PREFIX = re.compile(r'^\d+\.\s*')
+
+
+def find_time_series_key(data: Dict) -> Optional[str]:
+    """Name of the time series block ("Time Series (Daily)", "Weekly Adjusted Time Series", ...)"""
+    for key in data.keys():
+        if 'time series' in key.lower():
+            return key
+    return None
+
+
+def detect_field_names(record: Dict) -> Dict[str, str]:
+    """
+    Map output column -> source field name, detected once per file from one record
+
+    Handles both the numbered Alpha Vantage scheme ('1. open', '5. volume' or
+    '6. volume' when an adjusted close is present) and plain names ('open').
+    """
+    fields = {}
+    for source_name in record.keys():
+        column = _FIELD_PREFIX.sub('', source_name).strip().lower().replace(' ', '_')
+        if column in PRICE_COLUMNS and column not in fields:
+            fields[column] = source_name
+    return fields
+
+
+def parse_time_series(data: Dict) -> Optional[pd.DataFrame]:
+    """
+    Parse Alpha Vantage daily, weekly, monthly or intraday JSON into a DataFrame
+
+    Columns are built in bulk as typed arrays (float64 prices, int64 volume) and
+    the datetime index is returned already sorted in ascending order.
+    """
+    if not data:
+        return None
+
+    time_series_key = find_time_series_key(data)
+    if not time_series_key:
+        return None
+
+    time_series = data.get(time_series_key) or {}
+    if not time_series:
+        return None
+
+    dates = list(time_series.keys())
+    records = list(time_series.values())
+    fields = detect_field_names(records[0])
+
+    columns = {}
+    for column in PRICE_COLUMNS:
+        source_name = fields.get(column)
+        if source_name is None:
+            if column in REQUIRED_COLUMNS:
+                columns[column] = np.zeros(len(records), dtype=np.int64 if column == 'volume' else np.float64)
+            continue
+        columns[column] = _column_array(records, source_name, integer=(column == 'volume'))
+
+    index = np.array(dates, dtype='datetime64[ns]')
+    order = _ascending_order(index)
+    if order is not None:
+        index = np.ascontiguousarray(index[order])
+        columns = {name: np.ascontiguousarray(values[order]) for name, values in columns.items()}
+
+    return pd.DataFrame(columns, index=pd.DatetimeIndex(index, name='date'), copy=False)
+
+
+def _column_array(records: List[Dict], source_name: str, integer: bool = False) -> np.ndarray:
+    """Convert one field of every record into a typed array"""
+    count = len(records)
+    try:
+        values = map(itemgetter(source_name), records)
+        if integer:
+            return np.fromiter(map(int, values), dtype=np.int64, count=count)
+        return np.fromiter(map(float, values), dtype=np.float64, count=count)
+    except (KeyError, ValueError):
+        # Ragged or oddly formatted records - fall back to per-record defaults
+        floats = np.fromiter(
+            (float(record.get(source_name, 0) or 0) for record in records),
+            dtype=np.float64,
+            count=count
+        )
+        return floats.astype(np.int64) if integer else floats
+
+
+def _ascending_order(index: np.ndarray):
+    """
+    Indexer that sorts the dates ascending, or None when they already are
+    Alpha Vantage writes newest first, so the common case is a plain reversal
+    """
+    if len(index) < 2:
+        return None
+    steps = np.diff(index)
+    if (steps >= np.timedelta64(0)).all():
+        return None
+    if (steps <= np.timedelta64(0)).all():
+        return slice(None, None, -1)
+    return np.argsort(index, kind='stable')
@@ -0,0 +1,189 @@
+"""
+Price Store Module
+Columnar, memory-mapped storage for parsed price series
+"""
+import json
+import os
+import threading
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+class PriceStore:
+    """
+    Binary columnar store for OHLCV series, one directory per symbol and interval.
+
+    Every column is written as its own ``.npy`` file (float64 OHLC, int64 volume,
+    datetime64[ns] index) so it can be opened with ``mmap_mode='r'`` - no JSON
+    decoding and no copy on load. A ``meta.json`` file next to the columns records
+    the fingerprint of the source JSON the series was built from.
+    """
+
+    INDEX_COLUMN = 'date'
+    COLUMN_DTYPES = {
+        'open': np.float64,
+        'high': np.float64,
+        'low': np.float64,
+        'close': np.float64,
+        'volume': np.int64,
+        'adjusted_close': np.float64
+    }
+    META_FILE = 'meta.json'
+    FORMAT_VERSION = 1
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @staticmethod
+    def fingerprint(source_path: str) -> Dict[str, Any]:
+        """Identify a source file by path, modification time and size"""
+        stat = os.stat(source_path)
+        return {
+            'path': os.path.abspath(source_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size
+        }
+
+    def series_dir(self, symbol: str, interval: str) -> str:
+        """Directory holding the columns of one symbol/interval series"""
+        return os.path.join(self.store_dir, symbol.upper(), interval)
+
+    def series_lock(self, symbol: str, interval: str) -> threading.Lock:
+        """Lock serialising (re)ingestion of one series across worker threads"""
+        key = (symbol.upper(), interval)
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def read_meta(self, symbol: str, interval: str) -> Optional[Dict]:
+        """Read the metadata of a stored series, None if it is missing or unreadable"""
+        meta_path = os.path.join(self.series_dir(symbol, interval), self.META_FILE)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_current(self, symbol: str, interval: str, fingerprint: Dict) -> bool:
+        """True when the stored series was built from exactly this source file"""
+        meta = self.read_meta(symbol, interval)
+        return (
+            meta is not None
+            and meta.get('version') == self.FORMAT_VERSION
+            and meta.get('source') == fingerprint
+        )
+
+    def write(self, symbol: str, interval: str, df: pd.DataFrame, fingerprint: Dict):
+        """
+        Persist a parsed price DataFrame as memory-mappable columns
+
+        The metadata file is removed first and written last, so a series is only
+        considered valid once every column has been replaced.
+        """
+        series_dir = self.series_dir(symbol, interval)
+        os.makedirs(series_dir, exist_ok=True)
+
+        meta_path = os.path.join(series_dir, self.META_FILE)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        columns = [c for c in self.COLUMN_DTYPES if c in df.columns]
+        arrays = {self.INDEX_COLUMN: df.index.values.astype('datetime64[ns]')}
+        for column in columns:
+            arrays[column] = df[column].to_numpy(dtype=self.COLUMN_DTYPES[column])
+
+        for name, values in arrays.items():
+            target = os.path.join(series_dir, f'{name}.npy')
+            tmp_path = f'{target}.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(values))
+            os.replace(tmp_path, target)
+
+        meta = {
+            'version': self.FORMAT_VERSION,
+            'symbol': symbol.upper(),
+            'interval': interval,
+            'columns': columns,
+            'rows': int(len(df)),
+            'source': fingerprint
+        }
+        tmp_meta = f'{meta_path}.tmp'
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_meta, meta_path)
+
+    def read(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        """
+        Open a stored series without copying
+        The returned DataFrame is backed by read-only memory maps
+        """
+        meta = self.read_meta(symbol, interval)
+        if meta is None:
+            return None
+
+        series_dir = self.series_dir(symbol, interval)
+        try:
+            index = np.load(os.path.join(series_dir, f'{self.INDEX_COLUMN}.npy'), mmap_mode='r')
+            columns = {
+                column: np.load(os.path.join(series_dir, f'{column}.npy'), mmap_mode='r')
+                for column in meta.get('columns', [])
+            }
+        except (OSError, ValueError) as e:
+            print(f"Error reading price store {series_dir}: {str(e)}")
+            return None
+
+        return pd.DataFrame(
+            columns,
+            index=pd.DatetimeIndex(index, name=self.INDEX_COLUMN),
+            copy=False
+        )
+
+    def load(
+        self,
+        symbol: str,
+        interval: str,
+        source_path: str,
+        parse: Callable[[str], Optional[pd.DataFrame]],
+        depends_on: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Return the stored series for a source file, (re)ingesting it first
+        when the source fingerprint no longer matches the stored one
+        depends_on: further files the series is built from (e.g. corporate actions)
+        """
+        fingerprint = self.fingerprint(source_path)
+        if depends_on:
+            fingerprint['depends_on'] = [self.fingerprint(path) for path in depends_on]
+        if not self.is_current(symbol, interval, fingerprint):
+            with self.series_lock(symbol, interval):
+                # Another thread may have finished the same ingest while we waited
+                if not self.is_current(symbol, interval, fingerprint):
+                    df = parse(source_path)
+                    if df is None or df.empty:
+                        return None
+                    try:
+                        self.write(symbol, interval, df, fingerprint)
+                    except OSError as e:
+                        # Read-only deployments still work, just without the store
+                        print(f"Error writing price store for {symbol} {interval}: {str(e)}")
+                        return df
+        return self.read(symbol, interval)
+
+    def stored_series(self) -> List[Dict]:
+        """List metadata of every series currently in the store"""
+        series = []
+        if not os.path.isdir(self.store_dir):
+            return series
+        for symbol in sorted(os.listdir(self.store_dir)):
+            symbol_dir = os.path.join(self.store_dir, symbol)
+            if not os.path.isdir(symbol_dir):
+                continue
+            for interval in sorted(os.listdir(symbol_dir)):
+                meta = self.read_meta(symbol, interval)
+                if meta is not None:
+                    series.append(meta)
+        return series
@@ -0,0 +1,94 @@
+"""
+Resample Module
+Vectorized OHLCV aggregation from finer to coarser bar intervals
+"""
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+# Supported intervals, finest first
+INTERVALS = ['5min', '15min', '1h', 'daily', 'weekly', 'monthly']
+
+# Accepted spellings for each interval
+INTERVAL_ALIASES = {
+    '5m': '5min', '5min': '5min',
+    '15m': '15min', '15min': '15min',
+    '1h': '1h', '60m': '1h', '60min': '1h', 'hourly': '1h',
+    '1d': 'daily', 'd': 'daily', 'day': 'daily', 'daily': 'daily',
+    '1w': 'weekly', 'w': 'weekly', 'week': 'weekly', 'weekly': 'weekly',
+    '1mo': 'monthly', 'm': 'monthly', 'month': 'monthly', 'monthly': 'monthly'
+}
+
+# Fixed-width intraday buckets in minutes
+_INTRADAY_MINUTES = {'5min': 5, '15min': 15, '1h': 60}
+
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+def normalize_interval(interval: str) -> str:
+    """Canonical interval name, raising ValueError for unsupported intervals"""
+    canonical = INTERVAL_ALIASES.get(str(interval).strip().lower())
+    if canonical is None:
+        raise ValueError(f"Unsupported interval '{interval}'. Use one of: {', '.join(INTERVALS)}")
+    return canonical
+
+
+def interval_rank(interval: str) -> int:
+    """Position of an interval from finest (0) to coarsest"""
+    return INTERVALS.index(interval)
+
+
+def _bucket_keys(index: pd.DatetimeIndex, interval: str) -> np.ndarray:
+    """Integer bucket id per bar; bars sharing an id are aggregated together"""
+    values = index.values.astype('datetime64[ns]')
+    if interval in _INTRADAY_MINUTES:
+        step = _INTRADAY_MINUTES[interval] * _NS_PER_MINUTE
+        return values.view(np.int64) // step
+    days = values.astype('datetime64[D]').view(np.int64)
+    if interval == 'daily':
+        return days
+    if interval == 'weekly':
+        # 1970-01-01 was a Thursday; shift so weeks run Monday to Sunday
+        return (days + 3) // 7
+    if interval == 'monthly':
+        return values.astype('datetime64[M]').view(np.int64)
+    raise ValueError(f"Cannot resample to '{interval}'")
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: str) -> Optional[pd.DataFrame]:
+    """
+    Aggregate sorted OHLCV bars into a coarser interval in one vectorized pass
+
+    Intraday buckets are labelled with their start time, daily bars with the
+    date, and weekly/monthly bars with their last trading day - the same
+    labelling Alpha Vantage uses for its native series.
+    """
+    if df is None or df.empty:
+        return None
+
+    interval = normalize_interval(interval)
+    keys = _bucket_keys(df.index, interval)
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+    ends = np.concatenate((starts[1:], [len(keys)])) - 1
+
+    columns = {
+        'open': df['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy(), starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy(), starts),
+        'close': df['close'].to_numpy()[ends],
+        'volume': np.add.reduceat(df['volume'].to_numpy(dtype=np.int64), starts)
+    }
+    if 'adjusted_close' in df.columns:
+        columns['adjusted_close'] = df['adjusted_close'].to_numpy()[ends]
+
+    timestamps = df.index.values.astype('datetime64[ns]')
+    if interval in _INTRADAY_MINUTES:
+        step = _INTRADAY_MINUTES[interval] * _NS_PER_MINUTE
+        labels = (keys[starts] * step).astype('datetime64[ns]')
+    elif interval == 'daily':
+        labels = timestamps[starts].astype('datetime64[D]').astype('datetime64[ns]')
+    else:
+        labels = timestamps[ends].astype('datetime64[D]').astype('datetime64[ns]')
+
+    return pd.DataFrame(columns, index=pd.DatetimeIndex(labels, name='date'), copy=False)
@@ -5,6 +5,10 @@ Combines multiple analysis types to generate comprehensive trade signals
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+import pandas as pd
+
+from app.universe_indicators import technical_from_row
+
 class SignalGenerator:
     """
     Generate comprehensive trade signals based on multiple data sources
@@ -110,6 +114,47 @@ class SignalGenerator:
             }
         }
     
+    def generate_universe_signals(
+        self,
+        table: pd.DataFrame,
+        fundamentals: Optional[Dict[str, Dict[str, Any]]] = None,
+        sentiments: Optional[Dict[str, Dict[str, Any]]] = None,
+        insiders: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> pd.DataFrame:
+        """
+        Score every symbol of a UniverseIndicators table
+        
+        Optional per-symbol fundamental/sentiment/insider dictionaries are
+        combined exactly as in generate_signal. Returns one row per symbol,
+        strongest signal first.
+        """
+        rows = []
+        for symbol, row in table.to_dict('index').items():
+            signal = self.generate_signal(
+                technical_from_row(row),
+                (fundamentals or {}).get(symbol),
+                (sentiments or {}).get(symbol),
+                (insiders or {}).get(symbol)
+            )
+            rows.append({
+                'symbol': symbol,
+                'signal': signal['signal'],
+                'strength': signal['strength'],
+                'confidence': signal['confidence'],
+                'risk_level': signal['risk_level'],
+                'entry_price': signal['entry_price'],
+                'stop_loss': signal['stop_loss'],
+                'take_profit': signal['take_profit'],
+                'timeframe': signal['timeframe']
+            })
+        
+        columns = ['signal', 'strength', 'confidence', 'risk_level', 'entry_price',
+                   'stop_loss', 'take_profit', 'timeframe']
+        if not rows:
+            return pd.DataFrame(columns=columns, index=pd.Index([], name='symbol'))
+        signals = pd.DataFrame(rows).set_index('symbol')
+        return signals.sort_values('strength', ascending=False, kind='stable')
+    
     def _analyze_technical(self, technical: Dict) -> Dict:
         """Analyze technical indicators"""
         score = 0
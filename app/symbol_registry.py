@@ -0,0 +1,130 @@
+"""
+Symbol Registry Module
+Constant-time symbol lookup and fast search for the dashboard symbol picker
+"""
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from app.manifest import DataManifest
+from app.resample import INTERVALS
+
+class SymbolInfo(NamedTuple):
+    """Data availability flags for one symbol"""
+    symbol: str
+    price_intervals: Tuple[str, ...]
+    fundamentals: bool
+    sentiment: bool
+    insider: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'symbol': self.symbol,
+            'price_intervals': list(self.price_intervals),
+            'fundamentals': self.fundamentals,
+            'sentiment': self.sentiment,
+            'insider': self.insider
+        }
+
+
+class SymbolRegistry:
+    """
+    Registry of every symbol in the data folder layout
+
+    Built from the data manifest and rebuilt only when the manifest changes.
+    Lookups are dictionary hits; prefix search is a binary search over the
+    sorted symbol list and substring search scans one joined string.
+    """
+
+    def __init__(self, manifest: DataManifest):
+        self.manifest = manifest
+        self._lock = threading.Lock()
+        self._generation = None
+        self._info: Dict[str, SymbolInfo] = {}
+        self._sorted: List[str] = []
+        self._haystack = ''
+        self._offsets: List[int] = []
+
+    def _ensure_current(self):
+        """Rebuild from the manifest when it has changed since the last build"""
+        self.manifest.maybe_refresh()
+        if self._generation == self.manifest.generation:
+            return
+        with self._lock:
+            if self._generation == self.manifest.generation:
+                return
+            generation = self.manifest.generation
+            info = {}
+            for symbol in self.manifest.symbols():
+                folders = self.manifest.symbol_folders(symbol)
+                intervals = self.manifest.intervals(symbol, 'price')
+                info[symbol] = SymbolInfo(
+                    symbol=symbol,
+                    price_intervals=tuple(sorted(intervals, key=self._interval_rank)),
+                    fundamentals=bool(folders.get('fundamental')),
+                    sentiment=bool(folders.get('sentiment')),
+                    insider='insider_transactions' in folders.get('alternative', [])
+                )
+
+            ordered = sorted(info)
+            offsets = []
+            position = 0
+            for symbol in ordered:
+                offsets.append(position)
+                position += len(symbol) + 1
+
+            self._info = info
+            self._sorted = ordered
+            self._haystack = '\n'.join(ordered)
+            self._offsets = offsets
+            self._generation = generation
+
+    def _interval_rank(self, interval: str) -> int:
+        if interval in INTERVALS:
+            return INTERVALS.index(interval)
+        return len(INTERVALS)
+
+    def get(self, symbol: str) -> Optional[SymbolInfo]:
+        """Availability flags for a symbol, None if it has no data"""
+        self._ensure_current()
+        return self._info.get(symbol.upper())
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.get(symbol) is not None
+
+    def __len__(self) -> int:
+        self._ensure_current()
+        return len(self._sorted)
+
+    def symbols(self) -> List[str]:
+        """All registered symbols, sorted"""
+        self._ensure_current()
+        return list(self._sorted)
+
+    def search(self, query: str, limit: int = 20) -> List[SymbolInfo]:
+        """
+        Symbols matching a query for the symbol picker
+        Prefix matches come first (alphabetical), then other substring matches
+        """
+        self._ensure_current()
+        query = query.strip().upper()
+        if not query:
+            return [self._info[s] for s in self._sorted[:limit]]
+
+        # Prefix matches: contiguous range of the sorted list
+        start = bisect_left(self._sorted, query)
+        end = bisect_right(self._sorted, query + '\uffff', lo=start)
+        results = self._sorted[start:min(end, start + limit)]
+        if len(results) >= limit:
+            return [self._info[s] for s in results]
+
+        # Substring matches anywhere else in the symbol
+        seen = set(results)
+        position = self._haystack.find(query)
+        while position != -1 and len(results) < limit:
+            symbol = self._sorted[bisect_right(self._offsets, position) - 1]
+            if symbol not in seen:
+                seen.add(symbol)
+                results.append(symbol)
+            position = self._haystack.find(query, position + 1)
+        return [self._info[s] for s in results]
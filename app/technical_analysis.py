@@ -4,10 +4,16 @@ Implements standard technical indicators and analysis
 """
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
+from app.chart_series import to_json_list
+from app.indicator_engine import IndicatorEngine
+from app.indicator_kernels import as_float_array, ema, emas, rolling_max, rolling_min, wilder
+from app.indicator_sweep import IndicatorSweep
+
 class TechnicalAnalyzer:
     """
     Comprehensive technical analysis calculator
@@ -16,7 +22,7 @@ class TechnicalAnalyzer:
     def __init__(self):
         self.indicators = {}
         
-    def calculate_all_indicators(self, price_data: pd.DataFrame) -> Dict[str, Any]:
+    def calculate_all_indicators(self, price_data: pd.DataFrame, engine: Optional[IndicatorEngine] = None) -> Dict[str, Any]:
         """
         Calculate all technical indicators for given price data
         
@@ -28,26 +34,32 @@ class TechnicalAnalyzer:
         - Volume Analysis
         - Support/Resistance Levels
         - Trend Analysis
-        """
+        - Donchian Channel and N-bar highs/lows
+        - ADX/DMI, OBV, MFI, CCI, Williams %R, Keltner Channel, Ichimoku,
+          rolling VWAP and Parabolic SAR
         
-        # Ensure we have the required columns
-        required_columns = ['open', 'high', 'low', 'close', 'volume']
+        All indicators come from one IndicatorEngine, so shared intermediates
+        (SMA(20), EMA(12/26), deltas, returns) are computed once. Pass the
+        engine used for prepare_chart_data to share them with the chart too.
+        """
+        if engine is None:
+            engine = IndicatorEngine(price_data)
         
         # Calculate individual indicators
-        sma_data = self.calculate_sma(price_data)
-        ema_data = self.calculate_ema(price_data)
-        rsi = self.calculate_rsi(price_data)
-        macd = self.calculate_macd(price_data)
-        bollinger = self.calculate_bollinger_bands(price_data)
-        volume_analysis = self.analyze_volume(price_data)
-        support_resistance = self.calculate_support_resistance(price_data)
-        trend = self.identify_trend(price_data, sma_data)
-        stochastic = self.calculate_stochastic(price_data)
-        atr = self.calculate_atr(price_data)
+        sma_data = engine.sma_values()
+        ema_data = engine.ema_values()
+        rsi = engine.rsi_value()
+        macd = engine.macd_values()
+        bollinger = engine.bollinger_values()
+        volume_analysis = engine.volume_values()
+        support_resistance = engine.support_resistance_values()
+        trend = engine.trend_value(sma_data)
+        stochastic = engine.stochastic_values()
+        atr = engine.atr_value()
         
         # Get current price info
-        latest_price = float(price_data['close'].iloc[-1])
-        prev_close = float(price_data['close'].iloc[-2])
+        latest_price = float(engine.close[-1])
+        prev_close = float(engine.close[-2])
         price_change = latest_price - prev_close
         price_change_percent = (price_change / prev_close) * 100
         
@@ -64,7 +76,7 @@ class TechnicalAnalyzer:
             'current_price': latest_price,
             'price_change': round(price_change, 2),
             'price_change_percent': round(price_change_percent, 2),
-            'volume': int(price_data['volume'].iloc[-1]),
+            'volume': int(engine.volume[-1]),
             'sma': sma_data,
             'ema': ema_data,
             'rsi': rsi,
@@ -76,7 +88,133 @@ class TechnicalAnalyzer:
             'stochastic': stochastic,
             'atr': atr,
             'signal_strength': signal_strength,
-            'volatility': self.calculate_volatility(price_data)
+            'volatility': engine.volatility_value(),
+            'donchian': engine.donchian_values(),
+            'extremes': engine.extremes_values(),
+            'adx': engine.adx_values(),
+            'obv': engine.obv_values(),
+            'mfi': engine.mfi_value(),
+            'cci': engine.cci_value(),
+            'williams_r': engine.williams_r_value(),
+            'keltner': engine.keltner_values(),
+            'ichimoku': engine.ichimoku_values(),
+            'vwap': engine.vwap_values(),
+            'parabolic_sar': engine.parabolic_sar_values()
+        }
+    
+    def calculate_multi_timeframe(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        compute: Optional[Callable[[str, pd.DataFrame], Dict[str, Any]]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate the full indicator set on several timeframes concurrently
+        
+        frames maps interval -> price data; empty frames are reported as
+        unavailable. compute(interval, df) defaults to calculate_all_indicators;
+        pass a cached variant so each timeframe is memoized on its own data.
+        Returns the per-timeframe indicators plus a trend-alignment summary.
+        """
+        if compute is None:
+            compute = lambda interval, df: self.calculate_all_indicators(df)
+        
+        available = {interval: df for interval, df in frames.items() if df is not None and not df.empty}
+        timeframes: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        
+        if available:
+            # NumPy releases the GIL in the heavy kernels, so timeframes overlap on threads
+            with ThreadPoolExecutor(max_workers=max_workers or len(available),
+                                    thread_name_prefix='timeframes') as pool:
+                futures = {pool.submit(compute, interval, df): interval for interval, df in available.items()}
+                for future in as_completed(futures):
+                    interval = futures[future]
+                    try:
+                        timeframes[interval] = future.result()
+                    except Exception as e:
+                        errors[interval] = str(e)
+                        print(f"Error analysing {interval} timeframe: {str(e)}")
+        
+        # Keep the caller's (finest to coarsest) order
+        ordered = {interval: timeframes[interval] for interval in frames if interval in timeframes}
+        return {
+            'timeframes': ordered,
+            'unavailable': [interval for interval in frames if interval not in available],
+            'errors': errors,
+            'alignment': self.summarize_trend_alignment(ordered)
+        }
+    
+    def sweep_indicator(self, price_data: pd.DataFrame, indicator: str,
+                        grid: Optional[Dict[str, Any]] = None,
+                        engine: Optional[IndicatorEngine] = None) -> Dict[str, Any]:
+        """
+        Calculate one indicator over a grid of parameters
+        
+        grid maps parameter name -> values, e.g. {'period': range(5, 51)} for
+        RSI or {'period': [20, 30], 'std_dev': [1.5, 2, 2.5]} for Bollinger
+        Bands (see SWEEP_PARAMETERS). Returns the parameter sets and, per
+        output, a (parameter sets x bars) matrix.
+        """
+        return IndicatorSweep(price_data, engine).run(indicator, grid)
+    
+    def summarize_trend_alignment(self, timeframes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Per-timeframe trend direction and how far the timeframes agree
+        Later (coarser) timeframes weigh more and set the dominant trend
+        """
+        directions = {}
+        weighted = 0.0
+        total_weight = 0.0
+        for weight, (interval, indicators) in enumerate(timeframes.items(), start=1):
+            trend = indicators.get('trend', 'neutral')
+            if 'uptrend' in trend:
+                direction = 1
+            elif 'downtrend' in trend:
+                direction = -1
+            else:
+                direction = 0
+            
+            macd = indicators.get('macd', {})
+            sma_50 = indicators.get('sma', {}).get('sma_50')
+            directions[interval] = {
+                'trend': trend,
+                'direction': direction,
+                'rsi': indicators.get('rsi'),
+                'macd_bullish': macd.get('histogram', 0) > 0,
+                'above_sma_50': bool(sma_50 and indicators.get('current_price', 0) > sma_50)
+            }
+            weighted += direction * weight
+            total_weight += weight
+        
+        if not directions:
+            return {'status': 'no_data', 'score': 0.0, 'timeframes': {}}
+        
+        bullish = [i for i, d in directions.items() if d['direction'] > 0]
+        bearish = [i for i, d in directions.items() if d['direction'] < 0]
+        
+        if bullish and not bearish:
+            status = 'bullish_aligned' if len(bullish) == len(directions) else 'bullish_leaning'
+        elif bearish and not bullish:
+            status = 'bearish_aligned' if len(bearish) == len(directions) else 'bearish_leaning'
+        elif bullish and bearish:
+            status = 'mixed'
+        else:
+            status = 'neutral'
+        
+        dominant_interval = list(directions)[-1]
+        dominant = directions[dominant_interval]['direction']
+        
+        return {
+            'status': status,
+            'score': round(100 * weighted / total_weight, 2),
+            'bullish': bullish,
+            'bearish': bearish,
+            'neutral': [i for i, d in directions.items() if d['direction'] == 0],
+            'dominant_timeframe': dominant_interval,
+            'dominant_trend': directions[dominant_interval]['trend'],
+            'against_dominant': [i for i, d in directions.items() if d['direction'] * dominant < 0],
+            'timeframes': directions
         }
     
     def calculate_sma(self, df: pd.DataFrame, periods: List[int] = [20, 50, 200]) -> Dict[str, float]:
@@ -90,33 +228,43 @@ class TechnicalAnalyzer:
                 sma_values[f'sma_{period}'] = None
         return sma_values
     
+    @staticmethod
+    def _finite_bars(df: pd.DataFrame, columns=('close',)) -> List[np.ndarray]:
+        """
+        Float arrays of the columns with bars holding NaN/inf in any of them
+        dropped: the recursive filters carry a NaN forward, while pandas ewm skipped it
+        """
+        arrays = [as_float_array(df[column]) for column in columns]
+        finite = np.logical_and.reduce([np.isfinite(a) for a in arrays])
+        return arrays if finite.all() else [a[finite] for a in arrays]
+    
     def calculate_ema(self, df: pd.DataFrame, periods: List[int] = [12, 26]) -> Dict[str, float]:
         """Calculate Exponential Moving Averages"""
-        ema_values = {}
-        for period in periods:
-            if len(df) >= period:
-                ema = df['close'].ewm(span=period, adjust=False).mean().iloc[-1]
-                ema_values[f'ema_{period}'] = round(float(ema), 2)
-            else:
-                ema_values[f'ema_{period}'] = None
-        return ema_values
+        close, = self._finite_bars(df)
+        ready = [period for period in periods if len(close) >= period]
+        # Every span comes out of one recursive-filter call
+        latest = dict(zip(ready, emas(close, ready)[:, -1])) if ready else {}
+        return {
+            f'ema_{period}': round(float(latest[period]), 2) if period in latest else None
+            for period in periods
+        }
     
     def calculate_rsi(self, df: pd.DataFrame, period: int = 14) -> float:
         """
         Calculate Relative Strength Index
         RSI = 100 - (100 / (1 + RS))
-        RS = Average Gain / Average Loss
+        RS = Average Gain / Average Loss (Wilder-smoothed)
         """
-        if len(df) < period:
+        close_prices, = self._finite_bars(df)
+        if len(close_prices) <= period:
             return 50.0  # Neutral
-            
-        close_prices = df['close'].values
+        
         deltas = np.diff(close_prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
+        gains = np.where(deltas > 0, deltas, 0.0)
+        losses = np.where(deltas < 0, -deltas, 0.0)
         
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
+        avg_gain = wilder(gains, period)[-1]
+        avg_loss = wilder(losses, period)[-1]
         
         if avg_loss == 0:
             return 100.0
@@ -133,26 +281,26 @@ class TechnicalAnalyzer:
         Signal = 9-day EMA of MACD
         Histogram = MACD - Signal
         """
-        if len(df) < 26:
+        close, = self._finite_bars(df)
+        if len(close) < 26:
             return {'macd': 0, 'signal': 0, 'histogram': 0}
         
-        # Calculate EMAs
-        ema_12 = df['close'].ewm(span=12, adjust=False).mean()
-        ema_26 = df['close'].ewm(span=26, adjust=False).mean()
+        # Calculate EMAs (both spans in one pass)
+        ema_12, ema_26 = emas(close, [12, 26])
         
         # MACD line
         macd_line = ema_12 - ema_26
         
         # Signal line (9-day EMA of MACD)
-        signal_line = macd_line.ewm(span=9, adjust=False).mean()
+        signal_line = ema(macd_line, 9)
         
         # Histogram
         histogram = macd_line - signal_line
         
         return {
-            'macd': round(float(macd_line.iloc[-1]), 3),
-            'signal': round(float(signal_line.iloc[-1]), 3),
-            'histogram': round(float(histogram.iloc[-1]), 3)
+            'macd': round(float(macd_line[-1]), 3),
+            'signal': round(float(signal_line[-1]), 3),
+            'histogram': round(float(histogram[-1]), 3)
         }
     
     def calculate_bollinger_bands(self, df: pd.DataFrame, period: int = 20, std_dev: int = 2) -> Dict[str, float]:
@@ -189,34 +337,38 @@ class TechnicalAnalyzer:
         if len(df) < period:
             return {'k': 50, 'd': 50}
         
-        low_min = df['low'].rolling(window=period).min()
-        high_max = df['high'].rolling(window=period).max()
+        # %D of the latest bar needs only the last period + 2 bars
+        tail = df.tail(period + 2)
+        low_min = rolling_min(as_float_array(tail['low']), period)
+        high_max = rolling_max(as_float_array(tail['high']), period)
         
-        k_percent = 100 * ((df['close'] - low_min) / (high_max - low_min))
-        d_percent = k_percent.rolling(window=3).mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_percent = 100 * ((as_float_array(tail['close']) - low_min) / (high_max - low_min))
         
         return {
-            'k': round(float(k_percent.iloc[-1]), 2),
-            'd': round(float(d_percent.iloc[-1]), 2)
+            'k': round(float(k_percent[-1]), 2),
+            'd': round(float(np.mean(k_percent[-3:])), 2)
         }
     
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> float:
         """
         Calculate Average True Range (ATR) for volatility
+        Wilder-smoothed true range; the first bar has no previous close and is skipped
         """
-        if len(df) < period:
+        high, low, close = self._finite_bars(df, ('high', 'low', 'close'))
+        if len(close) <= period:
             return 0.0
         
-        high = df['high'].values
-        low = df['low'].values
-        close = df['close'].values
+        high = high[1:]
+        low = low[1:]
+        previous = close[:-1]
         
         tr1 = high - low
-        tr2 = abs(high - np.roll(close, 1))
-        tr3 = abs(low - np.roll(close, 1))
+        tr2 = abs(high - previous)
+        tr3 = abs(low - previous)
         
         tr = np.maximum(tr1, np.maximum(tr2, tr3))
-        atr = np.mean(tr[-period:])
+        atr = wilder(tr, period)[-1]
         
         return round(float(atr), 2)
     
@@ -277,14 +429,10 @@ class TechnicalAnalyzer:
         lows = recent_data['low'].values
         
         # Find local maxima and minima
-        resistance_levels = []
-        support_levels = []
-        
-        for i in range(1, len(highs) - 1):
-            if highs[i] > highs[i-1] and highs[i] > highs[i+1]:
-                resistance_levels.append(float(highs[i]))
-            if lows[i] < lows[i-1] and lows[i] < lows[i+1]:
-                support_levels.append(float(lows[i]))
+        inner_highs = highs[1:-1]
+        inner_lows = lows[1:-1]
+        resistance_levels = [float(h) for h in inner_highs[(inner_highs > highs[:-2]) & (inner_highs > highs[2:])]]
+        support_levels = [float(l) for l in inner_lows[(inner_lows < lows[:-2]) & (inner_lows < lows[2:])]]
         
         # Method 2: Pivot points
         last_high = float(df['high'].iloc[-1])
@@ -475,7 +623,7 @@ class TechnicalAnalyzer:
             'timestamp': df.index[-1] if hasattr(df.index, '__iter__') else datetime.now()
         }
     
-    def prepare_chart_data(self, df: pd.DataFrame, limit: int = 100) -> Dict[str, List]:
+    def prepare_chart_data(self, df: pd.DataFrame, limit: int = 100, engine: Optional[IndicatorEngine] = None) -> Dict[str, List]:
         """
         Prepare data for charting
         """
@@ -484,23 +632,24 @@ class TechnicalAnalyzer:
         # Convert dates to strings for JSON serialization
         dates = [str(d) for d in recent_data.index] if hasattr(recent_data.index, '__iter__') else [str(i) for i in range(len(recent_data))]
         
-        # Convert to lists for JSON serialization
+        # Convert to lists for JSON serialization (one C-level tolist per column)
         chart_data = {
             'dates': dates,
-            'prices': [float(x) for x in recent_data['close'].tolist()],
-            'volumes': [int(x) for x in recent_data['volume'].tolist()],
-            'high': [float(x) for x in recent_data['high'].tolist()],
-            'low': [float(x) for x in recent_data['low'].tolist()],
-            'open': [float(x) for x in recent_data['open'].tolist()]
+            'prices': recent_data['close'].to_numpy(dtype=np.float64).tolist(),
+            'volumes': recent_data['volume'].to_numpy().astype(np.int64).tolist(),
+            'high': recent_data['high'].to_numpy(dtype=np.float64).tolist(),
+            'low': recent_data['low'].to_numpy(dtype=np.float64).tolist(),
+            'open': recent_data['open'].to_numpy(dtype=np.float64).tolist()
         }
         
-        # Add moving averages if available
+        # Add moving averages if available (shared with the indicator engine)
+        if engine is None and len(df) >= 20:
+            engine = IndicatorEngine(df)
+        
         if len(df) >= 20:
-            sma_20 = df['close'].rolling(window=20).mean().tail(limit)
-            chart_data['sma_20'] = [float(x) if not pd.isna(x) else None for x in sma_20.tolist()]
+            chart_data['sma_20'] = to_json_list(engine.sma(20)[-limit:])
         
         if len(df) >= 50:
-            sma_50 = df['close'].rolling(window=50).mean().tail(limit)
-            chart_data['sma_50'] = [float(x) if not pd.isna(x) else None for x in sma_50.tolist()]
+            chart_data['sma_50'] = to_json_list(engine.sma(50)[-limit:])
         
         return chart_data
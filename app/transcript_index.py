@@ -0,0 +1,124 @@
+"""
+Transcript Index Module
+Per-quarter earnings-call summaries computed once at ingest
+"""
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from app.manifest import ManifestEntry
+
+
+def summarize_transcript(data: Dict, quarter: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Compact record of one earnings call: segment/speaker counts, text length
+    and segment sentiment statistics. A precomputed ``sentiment_analysis``
+    block in the source is carried over unchanged for SentimentAnalyzer.
+    """
+    segments = data.get('transcript') or []
+    speaker_counts: Dict[str, int] = {}
+    characters = 0
+    words = 0
+    scores = []
+
+    for segment in segments:
+        speaker = segment.get('speaker') or 'Unknown'
+        speaker_counts[speaker] = speaker_counts.get(speaker, 0) + 1
+        content = segment.get('content') or ''
+        characters += len(content)
+        words += len(content.split())
+        try:
+            scores.append(float(segment.get('sentiment')))
+        except (TypeError, ValueError):
+            pass
+
+    sentiment = {'segments_scored': len(scores)}
+    if scores:
+        sentiment.update({
+            'mean': round(sum(scores) / len(scores), 4),
+            'min': min(scores),
+            'max': max(scores),
+            'positive_share': round(sum(1 for s in scores if s > 0.1) / len(scores), 4),
+            'negative_share': round(sum(1 for s in scores if s < -0.1) / len(scores), 4)
+        })
+
+    top_speakers = sorted(speaker_counts.items(), key=lambda item: item[1], reverse=True)[:5]
+    summary = {
+        'symbol': data.get('symbol'),
+        'quarter': data.get('quarter') or quarter,
+        'segments': len(segments),
+        'speakers': len(speaker_counts),
+        'top_speakers': [{'speaker': name, 'segments': count} for name, count in top_speakers],
+        'characters': characters,
+        'words': words,
+        'sentiment': sentiment
+    }
+    if data.get('sentiment_analysis'):
+        summary['sentiment_analysis'] = data['sentiment_analysis']
+    return summary
+
+
+class TranscriptIndex:
+    """
+    Quarter -> summary index for one symbol's transcripts
+
+    Summaries are persisted to one small JSON file keyed by source path and
+    fingerprint, so each transcript is read in full only once per version.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self._records: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') == self.FORMAT_VERSION:
+                return saved.get('records', {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp_path = f'{self.index_path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.FORMAT_VERSION, 'records': self._records}, f, indent=1)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Error saving transcript index {self.index_path}: {str(e)}")
+
+    def summaries(self, entries: List[ManifestEntry], load_json: Callable[[str], Dict], prune: bool = True) -> List[Dict]:
+        """
+        Summaries for the given transcript files, oldest quarter first
+        Only new or changed files are opened; with prune, records of files
+        not in entries are dropped (pass False for a subset of the files)
+        """
+        changed = False
+        summaries = []
+        for entry in entries:
+            fingerprint = [entry.mtime_ns, entry.size]
+            record = self._records.get(entry.path)
+            if record is None or record.get('fingerprint') != fingerprint:
+                data = load_json(entry.path)
+                if not data:
+                    continue
+                record = {'fingerprint': fingerprint, 'summary': summarize_transcript(data, entry.period)}
+                self._records[entry.path] = record
+                changed = True
+            summaries.append(record['summary'])
+
+        # Forget files that are no longer in the manifest
+        if prune:
+            paths = {entry.path for entry in entries}
+            for path in [p for p in self._records if p not in paths]:
+                del self._records[path]
+                changed = True
+
+        if changed:
+            self._save()
+        return summaries
@@ -0,0 +1,446 @@
+"""
+Universe Indicators Module
+Latest-bar technical indicators for many symbols at once from (symbols x bars) matrices
+"""
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+FIELDS = ('close', 'high', 'low', 'volume')
+
+# Tails read by the latest-bar indicators (stochastic needs period + smooth - 1,
+# volatility period + 1 closes); narrower matrices are left-padded to this width
+MIN_COLUMNS = 21
+
+TABLE_COLUMNS = [
+    'bars', 'current_price', 'price_change', 'price_change_percent', 'volume',
+    'sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_26', 'rsi',
+    'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_width', 'bb_percent_b',
+    'stoch_k', 'stoch_d', 'atr',
+    'volume_avg_20', 'volume_avg_50', 'volume_ratio', 'volume_trend', 'volume_signal',
+    'support_1', 'support_2', 'support_3', 'resistance_1', 'resistance_2', 'resistance_3', 'pivot',
+    'trend', 'volatility'
+]
+
+VOLUME_INTERPRETATIONS = {
+    'bullish_strong': "Price up on high volume - Strong bullish signal",
+    'bullish_weak': "Price up on low volume - Weak bullish signal",
+    'bearish_strong': "Price down on high volume - Strong bearish signal",
+    'bearish_weak': "Price down on low volume - Weak bearish signal",
+    'neutral': "Normal volume activity"
+}
+
+
+class UniverseIndicators:
+    """
+    Column-wise indicator pass over a whole symbol universe
+
+    Each row of the close/high/low/volume matrices is one symbol and each
+    column one bar, latest bar last. Symbols with shorter histories are
+    left-padded with NaN; every indicator is computed for all rows with one
+    set of NumPy operations (EMAs step bar by bar across all symbols at
+    once) and follows the same definitions, warm-up rules and rounding as
+    IndicatorEngine / TechnicalAnalyzer.calculate_all_indicators.
+    """
+
+    def __init__(self, symbols: List[str], close, high, low, volume):
+        self.symbols = [str(symbol) for symbol in symbols]
+        self.close = _matrix(close)
+        self.high = _matrix(high)
+        self.low = _matrix(low)
+        self.volume = _matrix(volume)
+        if not (self.close.shape == self.high.shape == self.low.shape == self.volume.shape):
+            raise ValueError("close, high, low and volume matrices must have the same shape")
+        if self.close.shape[0] != len(self.symbols):
+            raise ValueError(f"Expected {len(self.symbols)} rows, got {self.close.shape[0]}")
+        self.bars = np.isfinite(self.close).sum(axis=1)
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame], bars: Optional[int] = None) -> 'UniverseIndicators':
+        """
+        Build the matrices from per-symbol OHLCV frames
+
+        Rows are aligned on their latest bar; pass bars to keep only the most
+        recent bars of each symbol (EMAs are then seeded at the window start).
+        Empty frames are skipped.
+        """
+        symbols = [symbol for symbol, df in frames.items() if df is not None and not df.empty]
+        width = max((len(frames[symbol]) for symbol in symbols), default=0)
+        if bars is not None:
+            width = min(width, bars)
+
+        matrices = np.full((len(FIELDS), len(symbols), width), np.nan)
+        for row, symbol in enumerate(symbols):
+            df = frames[symbol]
+            # One whole-frame conversion is far cheaper than four column lookups
+            values = df.to_numpy(dtype=np.float64)[-width:, df.columns.get_indexer(FIELDS)]
+            matrices[:, row, width - len(values):] = values.T
+        return cls(symbols, *matrices)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def table(self) -> pd.DataFrame:
+        """
+        One row per symbol with the latest value of every indicator
+
+        Values are rounded like calculate_all_indicators; indicators without
+        enough history take the same neutral defaults (or NaN where the
+        single-symbol output is None).
+        """
+        if not len(self):
+            return pd.DataFrame(columns=TABLE_COLUMNS, index=pd.Index([], name='symbol'))
+
+        bars = self.bars
+        close, high, low, volume = self.close, self.high, self.low, self.volume
+        current = close[:, -1]
+        previous = close[:, -2]
+        columns: Dict[str, Any] = {'bars': bars, 'current_price': current}
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change = current - previous
+            columns['price_change'] = _round(price_change, 2)
+            columns['price_change_percent'] = _round(price_change / previous * 100, 2)
+            columns['volume'] = np.trunc(volume[:, -1])
+
+            # Moving averages
+            sma = {}
+            for period in (20, 50, 200):
+                sma[period] = _round(self._tail_mean(close, period), 2)
+                columns[f'sma_{period}'] = sma[period]
+
+            ema_fast = _ema(close, 12)
+            ema_slow = _ema(close, 26)
+            columns['ema_12'] = np.where(bars >= 12, _round(ema_fast[:, -1], 2), np.nan)
+            columns['ema_26'] = np.where(bars >= 26, _round(ema_slow[:, -1], 2), np.nan)
+
+            # MACD
+            line = ema_fast - ema_slow
+            # The signal skips the same missing bars as the averages
+            signal_line = _ema(np.where(np.isnan(close), np.nan, line), 9)
+            has_macd = bars >= 26
+            columns['macd'] = np.where(has_macd, _round(line[:, -1], 3), 0.0)
+            columns['macd_signal'] = np.where(has_macd, _round(signal_line[:, -1], 3), 0.0)
+            columns['macd_histogram'] = np.where(has_macd, _round(line[:, -1] - signal_line[:, -1], 3), 0.0)
+
+            columns['rsi'] = self._rsi()
+            columns.update(self._bollinger())
+            columns.update(self._stochastic())
+            columns['atr'] = self._atr()
+            columns.update(self._volume(price_change))
+            columns.update(self._support_resistance())
+            columns['trend'] = self._trend(sma)
+            columns['volatility'] = self._volatility()
+
+        table = pd.DataFrame(columns, index=pd.Index(self.symbols, name='symbol'))
+        return table[TABLE_COLUMNS]
+
+    # ------------------------------------------------------------------
+    # Indicator blocks (each returns one value per symbol)
+    # ------------------------------------------------------------------
+
+    def _tail(self, matrix: np.ndarray, count: int) -> np.ndarray:
+        return matrix[:, -count:]
+
+    def _tail_mean(self, matrix: np.ndarray, period: int) -> np.ndarray:
+        """Mean of the last period bars, NaN for symbols with a shorter history"""
+        if matrix.shape[1] < period:
+            return np.full(len(self), np.nan)
+        return self._tail(matrix, period).mean(axis=1)
+
+    def _rsi(self, period: int = 14) -> np.ndarray:
+        # Changes from the last non-NaN close, so a missing bar does not drop the move across it
+        deltas = self.close[:, 1:] - _forward_fill(self.close)[:, :-1]
+        gains = _wilder(np.maximum(deltas, 0.0), period)
+        losses = _wilder(np.maximum(-deltas, 0.0), period)
+        rsi = np.where(losses == 0, 100.0, _round(100 - 100 / (1 + gains / losses), 2))
+        return np.where(self.bars <= period, 50.0, rsi)
+
+    def _bollinger(self, period: int = 20, std_dev: int = 2) -> Dict[str, np.ndarray]:
+        window = self._tail(self.close, period)
+        middle = window.mean(axis=1)
+        deviation = window.std(axis=1, ddof=1) * std_dev
+        upper = middle + deviation
+        lower = middle - deviation
+        width = upper - lower
+        ready = self.bars >= period
+        return {
+            'bb_upper': np.where(ready, _round(upper, 2), 0.0),
+            'bb_middle': np.where(ready, _round(middle, 2), 0.0),
+            'bb_lower': np.where(ready, _round(lower, 2), 0.0),
+            'bb_width': np.where(ready, _round(width, 2), 0.0),
+            'bb_percent_b': np.where(ready, _round((self.close[:, -1] - lower) / width, 3), np.nan)
+        }
+
+    def _stochastic(self, period: int = 14, smooth: int = 3) -> Dict[str, np.ndarray]:
+        span = period + smooth - 1
+        # NaN padding inside a window propagates, as pandas rolling does for short histories
+        lowest = np.lib.stride_tricks.sliding_window_view(self._tail(self.low, span), period, axis=1).min(axis=2)
+        highest = np.lib.stride_tricks.sliding_window_view(self._tail(self.high, span), period, axis=1).max(axis=2)
+        k = 100 * ((self._tail(self.close, smooth) - lowest) / (highest - lowest))
+        ready = self.bars >= period
+        return {
+            'stoch_k': np.where(ready, _round(k[:, -1], 2), 50.0),
+            'stoch_d': np.where(ready, _round(k.mean(axis=1), 2), 50.0)
+        }
+
+    def _atr(self, period: int = 14) -> np.ndarray:
+        # Bars missing any of high/low/close are skipped, as TechnicalAnalyzer drops them
+        valid = ~(np.isnan(self.high) | np.isnan(self.low) | np.isnan(self.close))
+        high = self.high[:, 1:]
+        low = self.low[:, 1:]
+        previous = _forward_fill(np.where(valid, self.close, np.nan))[:, :-1]
+        true_range = np.maximum(high - low, np.maximum(np.abs(high - previous), np.abs(low - previous)))
+        true_range[~valid[:, 1:]] = np.nan
+        return np.where(self.bars <= period, 0.0, _round(_wilder(true_range, period), 2))
+
+    def _volume(self, price_change: np.ndarray) -> Dict[str, np.ndarray]:
+        bars = self.bars
+        current = np.trunc(self.volume[:, -1])
+        history_mean = np.nansum(self.volume, axis=1) / bars
+        avg_20 = np.trunc(np.where(bars >= 20, self._tail_mean(self.volume, 20), history_mean))
+        avg_50 = np.where(bars >= 50, np.trunc(self._tail_mean(self.volume, 50)), avg_20)
+        ratio = np.where(avg_20 > 0, current / avg_20, 1.0)
+
+        recent = self._tail(self.volume, 5)
+        trend = np.where(recent[:, -1] > _nan_mean(recent), 'increasing', 'decreasing')
+
+        up = price_change > 0
+        down = price_change < 0
+        signal = np.select(
+            [up & (ratio > 1.2), up & (ratio < 0.8), down & (ratio > 1.2), down & (ratio < 0.8)],
+            ['bullish_strong', 'bullish_weak', 'bearish_strong', 'bearish_weak'],
+            default='neutral'
+        )
+        return {
+            'volume_avg_20': avg_20,
+            'volume_avg_50': avg_50,
+            'volume_ratio': _round(ratio, 2),
+            'volume_trend': trend,
+            'volume_signal': signal
+        }
+
+    def _support_resistance(self, lookback: int = 20) -> Dict[str, np.ndarray]:
+        """Three nearest local highs/lows of the lookback window plus classic pivot levels"""
+        highs = self._tail(self.high, lookback)
+        lows = self._tail(self.low, lookback)
+        inner_highs = highs[:, 1:-1]
+        inner_lows = lows[:, 1:-1]
+        peaks = np.where((inner_highs > highs[:, :-2]) & (inner_highs > highs[:, 2:]), inner_highs, np.nan)
+        troughs = np.where((inner_lows < lows[:, :-2]) & (inner_lows < lows[:, 2:]), inner_lows, np.nan)
+
+        last_high = self.high[:, -1]
+        last_low = self.low[:, -1]
+        pivot = (last_high + last_low + self.close[:, -1]) / 3
+        r1 = (2 * pivot) - last_low
+        r2 = pivot + (last_high - last_low)
+        s1 = (2 * pivot) - last_high
+        s2 = pivot - (last_high - last_low)
+
+        resistance = _top_levels(np.column_stack((peaks, r1, r2)), descending=False)
+        support = _top_levels(np.column_stack((troughs, s1, s2)), descending=True)
+
+        ready = self.bars >= lookback
+        columns = {}
+        for i in range(3):
+            columns[f'support_{i + 1}'] = np.where(ready, support[:, i], np.nan)
+            columns[f'resistance_{i + 1}'] = np.where(ready, resistance[:, i], np.nan)
+        columns['pivot'] = np.where(ready, _round(pivot, 2), np.nan)
+        return columns
+
+    def _trend(self, sma: Dict[int, np.ndarray]) -> np.ndarray:
+        """Trend label from SMA alignment, 10-bar price action and higher highs/lows"""
+        current = self.close[:, -1]
+        rows = np.arange(len(self))
+        start = self.close.shape[1] - np.minimum(self.bars, 10)
+        price_trend_up = current > self.close[rows, start]
+        higher_highs = self.high[:, -1] > self.high[rows, start]
+        higher_lows = self.low[:, -1] > self.low[rows, start]
+
+        bullish_signals = price_trend_up.astype(int) + 2 * (higher_highs & higher_lows)
+        for period in (20, 50, 200):
+            # NaN (not enough history) and 0 count as missing, as a falsy SMA does
+            level = np.nan_to_num(sma[period])
+            bullish_signals += (level != 0) & (current > level)
+
+        return np.select(
+            [bullish_signals >= 4, bullish_signals >= 2, bullish_signals >= 1],
+            ['strong_uptrend', 'uptrend', 'neutral'],
+            default='downtrend'
+        )
+
+    def _volatility(self, period: int = 20) -> np.ndarray:
+        """Annualized standard deviation of the last period returns, in percent"""
+        closes = self._tail(self.close, period + 1)
+        returns = closes[:, 1:] / closes[:, :-1] - 1.0
+        count = np.isfinite(returns).sum(axis=1)
+        mean = np.nansum(returns, axis=1) / count
+        variance = np.nansum((returns - mean[:, None]) ** 2, axis=1) / (count - 1)
+        volatility = np.sqrt(variance) * np.sqrt(252)
+        return np.where(self.bars < period, 0.0, _round(volatility * 100, 2))
+
+
+def technical_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild the calculate_all_indicators dictionary shape from one table row
+    so a universe row can be scored like a single-symbol analysis
+    """
+    def value(key: str) -> float:
+        return float(row[key])
+
+    def optional(key: str) -> Optional[float]:
+        number = row.get(key)
+        return None if number is None or pd.isna(number) else float(number)
+
+    def levels(prefix: str) -> List[float]:
+        return [optional(f'{prefix}_{i}') for i in (1, 2, 3) if optional(f'{prefix}_{i}') is not None]
+
+    # Bands, %B and pivots exist once there are 20 bars
+    ready = row['bars'] >= 20
+    bollinger = {
+        'upper': value('bb_upper'), 'middle': value('bb_middle'),
+        'lower': value('bb_lower'), 'width': value('bb_width')
+    }
+    if ready:
+        bollinger['percent_b'] = value('bb_percent_b')
+
+    support_resistance = {'support': levels('support'), 'resistance': levels('resistance')}
+    if ready:
+        support_resistance['pivot'] = value('pivot')
+
+    volume_signal = row.get('volume_signal', 'neutral')
+    return {
+        'current_price': value('current_price'),
+        'price_change': value('price_change'),
+        'price_change_percent': value('price_change_percent'),
+        'volume': int(row['volume']),
+        'sma': {f'sma_{period}': optional(f'sma_{period}') for period in (20, 50, 200)},
+        'ema': {f'ema_{span}': optional(f'ema_{span}') for span in (12, 26)},
+        'rsi': value('rsi'),
+        'macd': {'macd': value('macd'), 'signal': value('macd_signal'), 'histogram': value('macd_histogram')},
+        'bollinger_bands': bollinger,
+        'volume_analysis': {
+            'current': int(row['volume']),
+            'avg_20': int(row['volume_avg_20']),
+            'avg_50': int(row['volume_avg_50']),
+            'ratio': value('volume_ratio'),
+            'trend': row.get('volume_trend'),
+            'signal': volume_signal,
+            'interpretation': VOLUME_INTERPRETATIONS.get(volume_signal, VOLUME_INTERPRETATIONS['neutral'])
+        },
+        'support_resistance': support_resistance,
+        'trend': row.get('trend', 'neutral'),
+        'stochastic': {'k': value('stoch_k'), 'd': value('stoch_d')},
+        'atr': value('atr'),
+        'volatility': value('volatility')
+    }
+
+
+def _matrix(values) -> np.ndarray:
+    """2-D float64 matrix left-padded with NaN columns to at least MIN_COLUMNS"""
+    matrix = np.asarray(values, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    if matrix.ndim != 2:
+        raise ValueError("Indicator inputs must be (symbols x bars) matrices")
+    if matrix.shape[1] < MIN_COLUMNS:
+        padding = np.full((matrix.shape[0], MIN_COLUMNS - matrix.shape[1]), np.nan)
+        matrix = np.hstack((padding, matrix))
+    return np.ascontiguousarray(matrix)
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Vectorized round() with Python's result on near-ties, where np.round
+    (scale, rint, unscale) and the correctly rounded builtin can disagree
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, digits)
+    scaled = values * 10.0 ** digits
+    ties = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    if ties.any():
+        rounded[ties] = [round(float(value), digits) for value in values[ties]]
+    return rounded
+
+
+def _ema(matrix: np.ndarray, span: int) -> np.ndarray:
+    """
+    Row-wise EMA with alpha = 2 / (span + 1), each row seeded at its first
+    non-NaN bar; one vectorized step per bar across all symbols, using the
+    same update as pandas ewm(span, adjust=False) so values match bit for bit.
+    NaN bars inside a row are skipped, the average carried across them (as
+    TechnicalAnalyzer does by dropping non-finite bars)
+    """
+    alpha = 2.0 / (span + 1)
+    decay = 1.0 - alpha
+    out = np.empty_like(matrix)
+    previous = matrix[:, 0].copy()
+    out[:, 0] = previous
+    for column in range(1, matrix.shape[1]):
+        values = matrix[:, column]
+        step = (decay * previous + alpha * values) / (decay + alpha)
+        started = np.where(np.isnan(previous), values, step)
+        previous = np.where(np.isnan(values), previous, started)
+        out[:, column] = previous
+    return out
+
+
+def _forward_fill(matrix: np.ndarray) -> np.ndarray:
+    """Row-wise last non-NaN value at every bar (NaN before a row's first value)"""
+    columns = np.where(np.isnan(matrix), 0, np.arange(matrix.shape[1]))
+    np.maximum.accumulate(columns, axis=1, out=columns)
+    return np.take_along_axis(matrix, columns, axis=1)
+
+
+def _wilder(matrix: np.ndarray, period: int) -> np.ndarray:
+    """
+    Latest row-wise Wilder average (alpha = 1 / period) over the non-NaN bars:
+    the running mean of a row's first period values, then
+    y = y_prev + (x - y_prev) / period; one vectorized step per bar
+    """
+    value = np.full(matrix.shape[0], np.nan)
+    count = np.zeros(matrix.shape[0])
+    for column in range(matrix.shape[1]):
+        values = matrix[:, column]
+        present = ~np.isnan(values)
+        count += present
+        step = np.where(count == 1, values, value + (values - value) / np.minimum(count, period))
+        value = np.where(present, step, value)
+    return value
+
+
+def _nan_mean(matrix: np.ndarray) -> np.ndarray:
+    """Row means over the finite entries (NaN for rows without any)"""
+    count = np.isfinite(matrix).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.nansum(matrix, axis=1) / count
+
+
+def _top_levels(candidates: np.ndarray, descending: bool, count: int = 3) -> np.ndarray:
+    """
+    Per row: the distinct candidate levels (rounded to cents) nearest the
+    end of the sort order - the three highest supports in descending order,
+    or the three highest resistances in ascending order. Missing slots are NaN.
+    """
+    levels = _round(candidates, 2)
+    if descending:
+        levels = -levels
+    levels = np.sort(levels, axis=1)
+
+    # Drop repeats, then push them behind the remaining levels
+    repeated = np.zeros(levels.shape, dtype=bool)
+    repeated[:, 1:] = levels[:, 1:] == levels[:, :-1]
+    levels[repeated] = np.nan
+    levels = np.sort(levels, axis=1)
+
+    if descending:
+        top = -levels[:, :count]
+    else:
+        distinct = np.isfinite(levels).sum(axis=1)
+        positions = distinct[:, None] - count + np.arange(count)
+        top = np.take_along_axis(levels, np.maximum(positions, 0), axis=1)
+        top[positions < 0] = np.nan
+        # Rows with fewer than three levels keep them in the first slots
+        top = np.sort(top, axis=1)
+    return top
@@ -0,0 +1,171 @@
+"""
+Warm-up Module
+Parallel preloading of the data cache at application startup
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from app.data_loader import DataLoader
+
+class CacheWarmer:
+    """
+    Preloads price, fundamental, sentiment and insider data for a list of
+    symbols on a worker pool, so the first request per symbol is a cache hit
+
+    Runs either blocking (run) or on a daemon thread (start_background);
+    status() reports progress and timings at any point.
+    """
+
+    DATA_TYPES = ('price', 'fundamental', 'sentiment', 'insider')
+    DEFAULT_WORKERS = 4
+
+    def __init__(self, loader: DataLoader, symbols: Optional[List[str]] = None, workers: int = DEFAULT_WORKERS):
+        self.loader = loader
+        # None means every symbol in the registry, resolved when the run starts
+        self.symbols = [s.upper() for s in symbols] if symbols is not None else None
+        self.workers = max(1, workers)
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._state = 'idle'
+        self._total = 0
+        self._completed = 0
+        self._failed: List[Dict[str, str]] = []
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    @classmethod
+    def from_env(cls, loader: DataLoader) -> Optional['CacheWarmer']:
+        """
+        Build a warmer from WARMUP_SYMBOLS / WARMUP_WORKERS
+        WARMUP_SYMBOLS is a comma-separated list, or 'all'; unset disables warm-up
+        """
+        configured = os.getenv('WARMUP_SYMBOLS', '').strip()
+        if not configured:
+            return None
+        if configured.lower() in ('all', '*'):
+            symbols = None
+        else:
+            symbols = [s.strip() for s in configured.split(',') if s.strip()]
+        workers = int(os.getenv('WARMUP_WORKERS', cls.DEFAULT_WORKERS))
+        return cls(loader, symbols=symbols, workers=workers)
+
+    def _load(self, symbol: str, data_type: str):
+        if data_type == 'price':
+            self.loader.load_price_data(symbol)
+        elif data_type == 'fundamental':
+            self.loader.load_fundamental_data(symbol)
+        elif data_type == 'sentiment':
+            self.loader.load_sentiment_data(symbol)
+        elif data_type == 'insider':
+            self.loader.load_insider_data(symbol)
+
+    def _tasks(self, symbols: List[str]) -> List[tuple]:
+        """(symbol, data type) pairs that have data on disk"""
+        tasks = []
+        for symbol in symbols:
+            info = self.loader.get_symbol_info(symbol)
+            if info is None:
+                continue
+            available = {
+                'price': bool(info.price_intervals),
+                'fundamental': info.fundamentals,
+                'sentiment': info.sentiment,
+                'insider': info.insider
+            }
+            tasks.extend((symbol, data_type) for data_type in self.DATA_TYPES if available[data_type])
+        return tasks
+
+    def run(self) -> Dict[str, Any]:
+        """Warm the cache and block until done; returns the final status"""
+        symbols = self.symbols if self.symbols is not None else self.loader.get_available_symbols()
+        tasks = self._tasks(symbols)
+        with self._lock:
+            self._state = 'running'
+            self._total = len(tasks)
+            self._completed = 0
+            self._failed = []
+            self._timings = {}
+            self._started_at = time.perf_counter()
+            self._finished_at = None
+
+        print(f"Warming data cache: {len(tasks)} loads for {len(symbols)} symbols on {self.workers} workers")
+        report_every = max(1, len(tasks) // 10)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='cache-warmup') as executor:
+            futures = {executor.submit(self._timed_load, symbol, data_type): (symbol, data_type)
+                       for symbol, data_type in tasks}
+            for future in as_completed(futures):
+                symbol, data_type = futures[future]
+                try:
+                    elapsed = future.result()
+                    error = None
+                except Exception as e:
+                    elapsed = None
+                    error = str(e)
+                with self._lock:
+                    self._completed += 1
+                    if error is None:
+                        self._timings.setdefault(symbol, {})[data_type] = round(elapsed, 4)
+                    else:
+                        self._failed.append({'symbol': symbol, 'data_type': data_type, 'error': error})
+                    completed = self._completed
+                if error is not None:
+                    print(f"Warm-up failed for {symbol} {data_type}: {error}")
+                if completed % report_every == 0 or completed == len(tasks):
+                    print(f"Warm-up progress: {completed}/{len(tasks)} "
+                          f"({time.perf_counter() - self._started_at:.2f}s)")
+
+        with self._lock:
+            self._state = 'completed'
+            self._finished_at = time.perf_counter()
+        status = self.status()
+        print(f"Data cache warm-up finished in {status['elapsed_seconds']:.2f}s "
+              f"({len(status['failed'])} failed)")
+        return status
+
+    def _timed_load(self, symbol: str, data_type: str) -> float:
+        start = time.perf_counter()
+        self._load(symbol, data_type)
+        return time.perf_counter() - start
+
+    def start_background(self) -> threading.Thread:
+        """Run the warm-up on a daemon thread so the server can take traffic immediately"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return self._thread
+            self._state = 'running'
+            self._thread = threading.Thread(target=self._run_safely, name='cache-warmup', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def _run_safely(self):
+        try:
+            self.run()
+        except Exception as e:
+            print(f"Error warming data cache: {str(e)}")
+            with self._lock:
+                self._state = 'failed'
+                self._finished_at = time.perf_counter()
+
+    def status(self) -> Dict[str, Any]:
+        """Progress snapshot: state, completed/total loads, elapsed time, per-symbol timings"""
+        with self._lock:
+            if self._started_at is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+            return {
+                'state': self._state,
+                'workers': self.workers,
+                'total': self._total,
+                'completed': self._completed,
+                'progress': round(self._completed / self._total * 100, 1) if self._total else 0.0,
+                'elapsed_seconds': round(elapsed, 3),
+                'failed': list(self._failed),
+                'timings': {symbol: dict(t) for symbol, t in self._timings.items()}
+            }
@@ -0,0 +1,144 @@
+"""
+Benchmark: the extended indicator pack (ADX/DMI, OBV, MFI, CCI, Williams %R,
+Keltner, Ichimoku, VWAP, Parabolic SAR) as independent pandas passes vs the
+shared indicator engine
+
+Run from the project root:
+    python benchmarks/bench_extended_indicators.py
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from app.indicator_engine import IndicatorEngine
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+REPEATS = 3
+
+PACK = ['adx_values', 'obv_values', 'mfi_value', 'cci_value', 'williams_r_value',
+        'keltner_values', 'ichimoku_values', 'vwap_values', 'parabolic_sar_values']
+
+
+def best_time(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def make_bars(bars: int) -> pd.DataFrame:
+    """Synthetic random-walk OHLCV bars"""
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + rng.random(bars) * 2,
+        'low': close - rng.random(bars) * 2,
+        'close': close,
+        'volume': rng.integers(100_000, 10_000_000, bars).astype(float)
+    }, index=pd.date_range('1990-01-01', periods=bars, freq='min'))
+
+
+def wilder(series: pd.Series, period: int) -> pd.Series:
+    """Wilder smoothing seeded with the simple mean of the first period values"""
+    values = series.dropna()
+    seeded = pd.concat([pd.Series([values.iloc[:period].mean()], index=[values.index[period - 1]]),
+                        values.iloc[period:]])
+    return seeded.ewm(alpha=1 / period, adjust=False).mean().reindex(series.index)
+
+
+def pandas_pack(df: pd.DataFrame) -> dict:
+    """Each indicator as its own pandas computation over the frame"""
+    high, low, close, volume = df['high'], df['low'], df['close'], df['volume']
+    previous = close.shift()
+    true_range = pd.concat([high - low, (high - previous).abs(), (low - previous).abs()], axis=1).max(axis=1)
+    true_range.iloc[0] = np.nan
+    up, down = high.diff(), -low.diff()
+    plus_dm = up.where((up > down) & (up > 0), 0.0)
+    minus_dm = down.where((down > up) & (down > 0), 0.0)
+    plus_dm.iloc[0] = minus_dm.iloc[0] = np.nan
+    atr_14 = wilder(true_range, 14)
+    plus_di = 100 * wilder(plus_dm, 14) / atr_14
+    minus_di = 100 * wilder(minus_dm, 14) / atr_14
+    adx = wilder(100 * (plus_di - minus_di).abs() / (plus_di + minus_di), 14)
+
+    obv = (np.sign(close.diff()).fillna(0) * volume).cumsum()
+    typical = (high + low + close) / 3
+    flow = typical * volume
+    rising = typical.diff()
+    positive = flow.where(rising > 0, 0.0).iloc[1:].rolling(14).sum()
+    negative = flow.where(rising < 0, 0.0).iloc[1:].rolling(14).sum()
+    mfi = 100 - 100 / (1 + positive / negative)
+    mean = typical.rolling(20).mean()
+    deviation = typical.rolling(20).apply(lambda window: np.abs(window - window.mean()).mean(), raw=True)
+    cci = (typical - mean) / (0.015 * deviation)
+    highest, lowest = high.rolling(14).max(), low.rolling(14).min()
+    williams_r = -100 * (highest - close) / (highest - lowest)
+    keltner_middle = close.ewm(span=20, adjust=False).mean()
+    keltner_width = 2 * wilder(true_range, 10)
+    midpoint = lambda period: (high.rolling(period).max() + low.rolling(period).min()) / 2
+    tenkan, kijun = midpoint(9), midpoint(26)
+    senkou_a = ((tenkan + kijun) / 2).shift(26)
+    senkou_b = midpoint(52).shift(26)
+    vwap = flow.rolling(20).sum() / volume.rolling(20).sum()
+    return {
+        'adx': adx.iloc[-1], 'obv': obv.iloc[-1], 'mfi': mfi.iloc[-1], 'cci': cci.iloc[-1],
+        'williams_r': williams_r.iloc[-1], 'keltner_upper': (keltner_middle + keltner_width).iloc[-1],
+        'senkou_a': senkou_a.iloc[-1], 'senkou_b': senkou_b.iloc[-1], 'vwap': vwap.iloc[-1]
+    }
+
+
+def engine_pack(engine: IndicatorEngine) -> dict:
+    return {name: getattr(engine, name)() for name in PACK}
+
+
+def main():
+    print("=" * 76)
+    print(f"EXTENDED INDICATOR PACK BENCHMARK (best of {REPEATS})")
+    print("=" * 76)
+    print(f"{'bars':>10}{'core ms':>10}{'pandas pack':>14}{'engine pack':>14}{'  of which SAR':>16}{'speed-up':>10}")
+
+    for bars in SIZES:
+        df = make_bars(bars)
+
+        # Same values from both paths (pandas has no Parabolic SAR; it is timed separately)
+        expected = pandas_pack(df)
+        values = engine_pack(IndicatorEngine(df))
+        actual = {
+            'adx': values['adx_values']['adx'], 'obv': values['obv_values']['obv'], 'mfi': values['mfi_value'],
+            'cci': values['cci_value'], 'williams_r': values['williams_r_value'],
+            'keltner_upper': values['keltner_values']['upper'], 'senkou_a': values['ichimoku_values']['senkou_a'],
+            'senkou_b': values['ichimoku_values']['senkou_b'], 'vwap': values['vwap_values']['vwap']
+        }
+        for name, value in actual.items():
+            digits = 0 if name == 'obv' else 2
+            assert abs(round(float(expected[name]), digits) - value) <= 10 ** -digits, name
+
+        # Core indicators first, so the pack is timed on an engine whose shared intermediates exist
+        def core_then_pack():
+            engine = IndicatorEngine(df)
+            start = time.perf_counter()
+            for name in ('sma_values', 'ema_values', 'rsi_value', 'macd_values', 'bollinger_values',
+                         'stochastic_values', 'atr_value', 'volume_values', 'donchian_values'):
+                getattr(engine, name)()
+            core = time.perf_counter() - start
+            start = time.perf_counter()
+            engine_pack(engine)
+            return core, time.perf_counter() - start
+
+        runs = [core_then_pack() for _ in range(REPEATS)]
+        core_ms = min(run[0] for run in runs) * 1000
+        pack_ms = min(run[1] for run in runs) * 1000
+        sar_ms = best_time(lambda: IndicatorEngine(df).parabolic_sar()) * 1000
+        pandas_ms = best_time(lambda: pandas_pack(df)) * 1000
+        print(f"{bars:>10,}{core_ms:>10.1f}{pandas_ms:>14.1f}{pack_ms:>14.1f}{sar_ms:>16.1f}"
+              f"{pandas_ms / pack_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
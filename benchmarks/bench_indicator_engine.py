@@ -0,0 +1,111 @@
+"""
+Benchmark: independent indicator methods vs the shared indicator engine
+
+Run from the project root:
+    python benchmarks/bench_indicator_engine.py
+"""
+import json
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from app.indicator_engine import IndicatorEngine
+from app.technical_analysis import TechnicalAnalyzer
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+REPEATS = 3
+
+analyzer = TechnicalAnalyzer()
+
+
+def make_bars(bars: int) -> pd.DataFrame:
+    """Synthetic random-walk OHLCV bars"""
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.5, bars),
+        'high': close + rng.random(bars) * 2,
+        'low': close - rng.random(bars) * 2,
+        'close': close,
+        'volume': rng.integers(100_000, 10_000_000, bars)
+    }, index=pd.date_range('1990-01-01', periods=bars, freq='min'))
+
+
+def legacy_indicators(df: pd.DataFrame):
+    """The original calculate_all_indicators composition plus the chart SMAs"""
+    sma_data = analyzer.calculate_sma(df)
+    result = {
+        'current_price': float(df['close'].iloc[-1]),
+        'volume': int(df['volume'].iloc[-1]),
+        'sma': sma_data,
+        'ema': analyzer.calculate_ema(df),
+        'rsi': analyzer.calculate_rsi(df),
+        'macd': analyzer.calculate_macd(df),
+        'bollinger_bands': analyzer.calculate_bollinger_bands(df),
+        'volume_analysis': analyzer.analyze_volume(df),
+        'support_resistance': analyzer.calculate_support_resistance(df),
+        'trend': analyzer.identify_trend(df, sma_data),
+        'stochastic': analyzer.calculate_stochastic(df),
+        'atr': analyzer.calculate_atr(df),
+        'volatility': analyzer.calculate_volatility(df)
+    }
+    return result, legacy_chart(df)
+
+
+def legacy_chart(df: pd.DataFrame, limit: int = 100):
+    """The original prepare_chart_data, recomputing SMA(20/50) from the close column"""
+    recent_data = df.tail(limit)
+    chart_data = {
+        'dates': [str(d) for d in recent_data.index],
+        'prices': [float(x) for x in recent_data['close'].tolist()],
+        'volumes': [int(x) for x in recent_data['volume'].tolist()],
+        'high': [float(x) for x in recent_data['high'].tolist()],
+        'low': [float(x) for x in recent_data['low'].tolist()],
+        'open': [float(x) for x in recent_data['open'].tolist()]
+    }
+    sma_20 = df['close'].rolling(window=20).mean().tail(limit)
+    chart_data['sma_20'] = [float(x) if not pd.isna(x) else None for x in sma_20.tolist()]
+    sma_50 = df['close'].rolling(window=50).mean().tail(limit)
+    chart_data['sma_50'] = [float(x) if not pd.isna(x) else None for x in sma_50.tolist()]
+    return chart_data
+
+
+def engine_indicators(df: pd.DataFrame):
+    engine = IndicatorEngine(df)
+    return analyzer.calculate_all_indicators(df, engine), analyzer.prepare_chart_data(df, engine=engine)
+
+
+def best_time(func, df) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("=" * 60)
+    print(f"INDICATOR ENGINE BENCHMARK (best of {REPEATS})")
+    print("=" * 60)
+    print(f"{'bars':>10}{'legacy ms':>14}{'engine ms':>14}{'speed-up':>10}")
+
+    for bars in SIZES:
+        df = make_bars(bars)
+
+        # Same latest-bar values from both paths
+        expected, _ = legacy_indicators(df)
+        actual, _ = engine_indicators(df)
+        for key, value in expected.items():
+            assert json.dumps(value) == json.dumps(actual[key]), key
+
+        legacy = best_time(legacy_indicators, df) * 1000
+        engine = best_time(engine_indicators, df) * 1000
+        print(f"{bars:>10,}{legacy:>14.2f}{engine:>14.2f}{legacy / engine:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: Alpha Vantage time-series parsing, row-by-row vs vectorized
+
+Run from the project root:
+    python benchmarks/bench_price_parser.py
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from app.price_parser import parse_time_series
+
+BARS = 10_000
+REPEATS = 5
+
+# Field layout of each Alpha Vantage endpoint the fetch scripts use
+FORMATS = {
+    'daily': ('Time Series (Daily)', 'D', True, True),
+    'weekly': ('Weekly Adjusted Time Series', 'W-FRI', True, False),
+    'monthly': ('Monthly Adjusted Time Series', 'ME', True, False),
+    '5min': ('Time Series (5min)', '5min', False, False),
+}
+
+
+def make_payload(freq: str, key: str, adjusted: bool, split: bool, bars: int = BARS) -> dict:
+    """Synthetic payload in Alpha Vantage's newest-first layout"""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range('2000-01-03', periods=bars, freq=freq)[::-1]
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    fmt = '%Y-%m-%d %H:%M:%S' if freq == '5min' else '%Y-%m-%d'
+
+    series = {}
+    for i, date in enumerate(dates):
+        record = {
+            '1. open': f'{close[i] - 0.5:.4f}',
+            '2. high': f'{close[i] + 1:.4f}',
+            '3. low': f'{close[i] - 1:.4f}',
+            '4. close': f'{close[i]:.4f}',
+        }
+        if adjusted:
+            record['5. adjusted close'] = f'{close[i]:.4f}'
+            record['6. volume'] = str(1_000_000 + i)
+            record['7. dividend amount'] = '0.0000'
+        else:
+            record['5. volume'] = str(1_000_000 + i)
+        if split:
+            record['8. split coefficient'] = '1.0'
+        series[date.strftime(fmt)] = record
+    return {'Meta Data': {}, key: series}
+
+
+def legacy_parse(data: dict) -> pd.DataFrame:
+    """The original DataLoader._parse_price_data loop, kept as the baseline"""
+    time_series_key = None
+    for key in data.keys():
+        if 'Time Series' in key or 'time series' in key.lower():
+            time_series_key = key
+            break
+    time_series = data.get(time_series_key, {})
+
+    rows = []
+    for date, values in time_series.items():
+        row = {
+            'date': date,
+            'open': float(values.get('1. open', values.get('open', 0))),
+            'high': float(values.get('2. high', values.get('high', 0))),
+            'low': float(values.get('3. low', values.get('low', 0))),
+            'close': float(values.get('4. close', values.get('close', 0))),
+            'volume': int(values.get('6. volume', values.get('5. volume', values.get('volume', 0))))
+        }
+        if '5. adjusted close' in values or 'adjusted_close' in values:
+            row['adjusted_close'] = float(values.get('5. adjusted close', values.get('adjusted_close', 0)))
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    df['date'] = pd.to_datetime(df['date'])
+    df.set_index('date', inplace=True)
+    df.sort_index(inplace=True)
+    return df
+
+
+def best_time(func, payload) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(payload)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("=" * 60)
+    print(f"PRICE PARSER BENCHMARK ({BARS:,} bars, best of {REPEATS})")
+    print("=" * 60)
+    print(f"{'format':<10}{'legacy ms':>12}{'vectorized ms':>16}{'speed-up':>10}")
+
+    for name, (key, freq, adjusted, split) in FORMATS.items():
+        payload = make_payload(freq, key, adjusted, split)
+
+        expected = legacy_parse(payload)
+        actual = parse_time_series(payload)
+        assert np.allclose(expected[['open', 'high', 'low', 'close']].values,
+                           actual[['open', 'high', 'low', 'close']].values)
+        assert (expected['volume'].values == actual['volume'].values).all()
+
+        legacy = best_time(legacy_parse, payload) * 1000
+        vectorized = best_time(parse_time_series, payload) * 1000
+        print(f"{name:<10}{legacy:>12.2f}{vectorized:>16.2f}{legacy / vectorized:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: pandas rolling max/min vs the van Herk / Gil-Werman kernels,
+and the incremental monotonic-deque mode
+
+Run from the project root:
+    python benchmarks/bench_rolling_extrema.py
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from app.indicator_kernels import RollingExtremum, rolling_max, rolling_min
+
+SIZES = [10_000, 100_000, 1_000_000]
+WINDOWS = [14, 252, 5_000]
+REPEATS = 3
+
+
+def best_time(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("=" * 60)
+    print(f"ROLLING EXTREMA BENCHMARK (max + min, best of {REPEATS})")
+    print("=" * 60)
+    print(f"{'bars':>10}{'window':>8}{'pandas ms':>12}{'kernel ms':>12}{'speed-up':>10}")
+
+    rng = np.random.default_rng(42)
+    for bars in SIZES:
+        values = 100 + np.cumsum(rng.normal(0, 1, bars))
+        series = pd.Series(values)
+        for window in WINDOWS:
+            # Same values from both paths
+            assert np.array_equal(rolling_max(values, window), series.rolling(window).max().to_numpy(), equal_nan=True)
+            assert np.array_equal(rolling_min(values, window), series.rolling(window).min().to_numpy(), equal_nan=True)
+
+            pandas_ms = best_time(lambda: (series.rolling(window).max(), series.rolling(window).min())) * 1000
+            kernel_ms = best_time(lambda: (rolling_max(values, window), rolling_min(values, window))) * 1000
+            print(f"{bars:>10,}{window:>8,}{pandas_ms:>12.2f}{kernel_ms:>12.2f}{pandas_ms / kernel_ms:>9.1f}x")
+
+    # Incremental mode: per-bar cost of a live update
+    values = 100 + np.cumsum(rng.normal(0, 1, 100_000))
+    extremum = RollingExtremum(252)
+    start = time.perf_counter()
+    streamed = extremum.extend(values)
+    per_bar = (time.perf_counter() - start) / len(values) * 1e6
+    assert np.array_equal(streamed, rolling_max(values, 252), equal_nan=True)
+    print(f"\nIncremental RollingExtremum(252): {per_bar:.2f} us per bar")
+
+
+if __name__ == "__main__":
+    main()
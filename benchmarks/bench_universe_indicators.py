@@ -0,0 +1,99 @@
+"""
+Benchmark: per-symbol TechnicalAnalyzer passes vs one universe matrix pass
+
+Run from the project root:
+    python benchmarks/bench_universe_indicators.py
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from app.technical_analysis import TechnicalAnalyzer
+from app.universe_indicators import UniverseIndicators, technical_from_row
+
+UNIVERSES = [100, 1_000, 3_000]
+BARS = 300
+REPEATS = 3
+
+analyzer = TechnicalAnalyzer()
+
+
+def make_universe(symbols: int):
+    """Synthetic random-walk OHLCV frames, a tenth of them with short histories"""
+    rng = np.random.default_rng(42)
+    frames = {}
+    for i in range(symbols):
+        bars = BARS if i % 10 else int(rng.integers(2, BARS))
+        close = 50 + np.abs(np.cumsum(rng.normal(0, 1, bars)))
+        frames[f'SYM{i:04d}'] = pd.DataFrame({
+            'open': close + rng.normal(0, 0.5, bars),
+            'high': close + rng.random(bars) * 2,
+            'low': close - rng.random(bars) * 2,
+            'close': close,
+            'volume': rng.integers(100_000, 10_000_000, bars)
+        }, index=pd.date_range('2020-01-01', periods=bars, freq='D'))
+    return frames
+
+
+def same(a, b) -> bool:
+    """Recursive equality with NaN == NaN (defaults may be 0 vs 0.0)"""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(same(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) and isinstance(b, float) and np.isnan(a) and np.isnan(b):
+        return True
+    return a == b
+
+
+def per_symbol(frames):
+    return {symbol: analyzer.calculate_all_indicators(df) for symbol, df in frames.items()}
+
+
+def universe(frames):
+    return UniverseIndicators.from_frames(frames).table()
+
+
+def table_only(universe_indicators):
+    return universe_indicators.table()
+
+
+def best_time(func, data) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print("=" * 60)
+    print(f"UNIVERSE INDICATOR BENCHMARK ({BARS} bars, best of {REPEATS})")
+    print("=" * 60)
+    print(f"{'symbols':>10}{'per-symbol ms':>16}{'universe ms':>14}{'table ms':>12}{'speed-up':>10}")
+
+    for symbols in UNIVERSES:
+        frames = make_universe(symbols)
+
+        # Same values from both paths
+        expected = per_symbol(frames)
+        table = universe(frames)
+        for symbol, result in expected.items():
+            actual = technical_from_row(table.loc[symbol].to_dict())
+            for key, value in actual.items():
+                assert same(value, result[key]), (symbol, key)
+
+        single = best_time(per_symbol, frames) * 1000
+        batch = best_time(universe, frames) * 1000
+        # The indicator pass alone, for callers that keep the matrices between scans
+        matrices = UniverseIndicators.from_frames(frames)
+        indicators = best_time(table_only, matrices) * 1000
+        print(f"{symbols:>10,}{single:>16.1f}{batch:>14.1f}{indicators:>12.1f}{single / batch:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()